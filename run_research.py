@@ -6,36 +6,137 @@ This script launches the refactored research automation tool.
 Run this from the project root directory.
 """
 
-import os
-from pathlib import Path
-from datetime import datetime, timedelta
+import argparse
 
+from src.core.config import load_config
+from src.output.retention import apply_retention
 
-def cleanup_old_outputs(days_to_keep=30):
-    """Delete output files older than specified days."""
-    outputs_dir = Path(__file__).parent / "outputs"
-    
-    if not outputs_dir.exists():
-        return
+
+def cleanup_old_outputs(config_path="config.yaml"):
+    """Delete or archive old output files according to the schedule settings."""
+    config = load_config(config_path)
+    schedule = config.schedule
     
-    cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-    deleted_count = 0
+    count = apply_retention(
+        config.output_dir,
+        days_to_keep=schedule.retention_days,
+        archive=schedule.archive_previous
+    )
     
-    for file in outputs_dir.glob("research_*"):
-        if file.is_file():
-            file_modified = datetime.fromtimestamp(file.stat().st_mtime)
-            if file_modified < cutoff_date:
-                file.unlink()
-                deleted_count += 1
+    if count > 0:
+        action = "Archived" if schedule.archive_previous else "Cleaned up"
+        print(f"🗑️  {action} {count} old run(s)")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Research Automation Tool")
+    parser.add_argument("--config", default="config.yaml",
+                        help="Path to configuration file")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Stay running and execute on the config.yaml schedule")
+    parser.add_argument("--batch", nargs="+", metavar="CONFIG",
+                        help="Run several config files jointly, sharing identical searches and AI calls")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run the on-demand HTTP research service (see service: in config.yaml)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Shard topics across N worker processes (default: execution.workers)")
+    parser.add_argument("--report", metavar="RUN_ID",
+                        help="Regenerate Markdown/HTML reports for a stored run (YYYYMMDD_HHMMSS)")
+    parser.add_argument("--rerank", nargs="+", metavar="RUN_ID",
+                        help="Re-rank stored runs (or 'all') offline with the current config, no API calls")
+    parser.add_argument("--train-classifier", action="store_true",
+                        help="Train the local relevance classifier from stored AI verdicts, no API calls")
+    parser.add_argument("--benchmark-compression", nargs="?", type=int, const=50, metavar="N",
+                        help="Score N stored verdicts (default 50) with and without text compression")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", metavar="CASSETTE",
+                          help="Record every search, page and LLM interaction to a cassette file")
+    cassette.add_argument("--replay", metavar="CASSETTE",
+                          help="Replay a cassette offline instead of calling the APIs")
+    parser.add_argument("--replay-latency", action="store_true",
+                        help="When replaying, sleep for the originally recorded latencies")
+    parser.add_argument("--deadline", metavar="TIME",
+                        help="Finish by this time (HH:MM or ISO 8601), degrading priority-2+ clusters")
+    parser.add_argument("--budget", metavar="DURATION",
+                        help="Time budget for the run, e.g. 90s, 20m or 1h")
+    return parser.parse_args()
+
+
+def build_cassette(args):
+    """Create the record/replay cassette requested on the command line, if any."""
+    from src.core.cassette import Cassette
     
-    if deleted_count > 0:
-        print(f"🗑️  Cleaned up {deleted_count} old output file(s)")
+    if args.record:
+        return Cassette(args.record, "record")
+    if args.replay:
+        return Cassette(args.replay, "replay", replay_latency=args.replay_latency)
+    return None
 
 
 if __name__ == "__main__":
-    # Auto-cleanup files older than 30 days
-    cleanup_old_outputs(days_to_keep=30)
+    args = parse_args()
     
-    # Run the research tool
-    from src.main import main
-    main()
+    if args.daemon:
+        # Long-running mode: schedule, retention and warm clients
+        from src.pipeline.daemon import ResearchDaemon
+        ResearchDaemon(args.config).run_forever()
+    elif args.batch:
+        # Several audiences in one pass over a shared search/verdict pool
+        from src.main import run_batch_main
+        run_batch_main(args.batch)
+    elif args.serve:
+        # On-demand research over HTTP
+        import logging
+        from dotenv import load_dotenv
+        from src.pipeline.service import serve
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+        load_dotenv()
+        serve(load_config(args.config))
+    elif args.report:
+        # Rebuild reports from live or archived run data, no API calls
+        from src.pipeline.runner import regenerate_reports
+        paths = regenerate_reports(load_config(args.config), args.report)
+        for path in paths.values():
+            print(f"📄 {path}")
+    elif args.rerank:
+        # Re-apply thresholds, ranking, selection and templates to stored candidates
+        import logging
+        from src.pipeline.rerank import rerank_runs
+        logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+        run_ids = None if args.rerank == ["all"] else args.rerank
+        for run_id, paths in rerank_runs(load_config(args.config), run_ids).items():
+            print(f"🔁 {run_id}: {paths['markdown']}")
+    elif args.train_classifier:
+        # Fit the relevance pre-screen on verdicts from live and archived runs
+        from src.ai.classifier import train_classifier
+        metrics = train_classifier(load_config(args.config))
+        print(f"🧠 Trained on {metrics['examples']} verdicts ({metrics['relevant']} relevant)")
+        print(f"   Holdout agreement with the LLM: {metrics['agreement']}")
+        print(f"   AI calls avoided at band {metrics['band']}: {metrics['calls_avoided']} "
+              f"(agreement on those: {metrics['agreement_when_local']})")
+    elif args.benchmark_compression is not None:
+        # Tokens saved against relevance agreement, on stored verdicts (2 LLM calls each)
+        from src.ai.compressor import benchmark_compression
+        metrics = benchmark_compression(load_config(args.config), sample_size=args.benchmark_compression)
+        print(f"🗜️  {metrics['examples']} verdicts: ~{metrics['tokens_before']} -> ~{metrics['tokens_after']} "
+              f"tokens ({metrics['tokens_saved']} saved)")
+        print(f"   Agreement at the relevance threshold: {metrics['agreement']} "
+              f"(mean score difference {metrics['mean_score_difference']}, {metrics['scored']} scored)")
+    else:
+        cassette = build_cassette(args)
+        
+        # Archive or delete runs past the retention window (not for offline replays)
+        if cassette is None or cassette.recording:
+            cleanup_old_outputs(args.config)
+        
+        # Run the research tool
+        from src.main import main
+        from src.pipeline.scheduler import parse_deadline, parse_duration
+        main(
+            args.config,
+            workers=args.workers,
+            cassette=cassette,
+            deadline=parse_deadline(args.deadline) if args.deadline else None,
+            time_budget=parse_duration(args.budget) if args.budget else None
+        )
@@ -1,6 +1,19 @@
 """AI analysis module with externalized prompts."""
 
 from .analyzer import analyze_result_with_ai, generate_summary_with_ai
-from .prompt_loader import load_prompt
+from .classifier import RelevanceClassifier, train_classifier
+from .compressor import SnippetCompressor, benchmark_compression
+from .prompt_loader import load_prompt, load_prompt_text
+from .summarizer import summarize_results
 
-__all__ = ['analyze_result_with_ai', 'generate_summary_with_ai', 'load_prompt']
+__all__ = [
+    'analyze_result_with_ai',
+    'generate_summary_with_ai',
+    'summarize_results',
+    'RelevanceClassifier',
+    'train_classifier',
+    'SnippetCompressor',
+    'benchmark_compression',
+    'load_prompt',
+    'load_prompt_text'
+]
@@ -2,56 +2,131 @@
 AI-powered analysis and summarization using LangChain.
 """
 
-import json
 import logging
-from typing import Dict, Any
+from collections import Counter, defaultdict
+from typing import Dict, Any, Optional
 
 from ..core.models import Result, Topic
+from .json_parser import is_strict_json, parse_relevance_response
 from .prompt_loader import load_prompt
 
 
 logger = logging.getLogger(__name__)
 
+# Characters of fetched page text sent for analysis (vs. 300 for search snippets)
+CONTENT_ANALYSIS_CHARS = 1500
 
-def analyze_result_with_ai(result: Result, topic: Topic, llm: Any) -> Dict[str, Any]:
+# Per-model parse outcome counters: parsed, recovered, retried, failed.
+# Process-wide fallback; pipeline runs count into RunContext.parse_stats.
+PARSE_STATS: Dict[str, Counter] = defaultdict(Counter)
+
+
+def with_json_mode(llm: Any) -> Any:
+    """
+    Bind OpenAI JSON mode to an LLM so replies are a single JSON object.
+    
+    Args:
+        llm: LangChain chat model
+        
+    Returns:
+        Bound runnable, or the original LLM if binding is not supported
+    """
+    try:
+        return llm.bind(response_format={"type": "json_object"})
+    except (AttributeError, NotImplementedError):
+        return llm
+
+
+def merge_parse_stats(target: Dict[str, Counter], other: Dict[str, Counter]) -> None:
+    """Add per-model parse counters, e.g. those returned by a worker process."""
+    for model, counts in other.items():
+        target[model].update(counts)
+
+
+def log_parse_stats(stats: Optional[Dict[str, Counter]] = None) -> None:
+    """Log relevance-verdict parse counters for every model used (default: the process-wide counters)."""
+    for model, counts in (PARSE_STATS if stats is None else stats).items():
+        logger.info(
+            f"AI verdict parsing [{model}]: {counts['parsed']} parsed, "
+            f"{counts['recovered']} recovered, {counts['retried']} retried, "
+            f"{counts['failed']} failed"
+        )
+
+
+def analyze_result_with_ai(
+    result: Result,
+    topic: Topic,
+    llm: Any,
+    model: Optional[str] = None,
+    max_retries: int = 1,
+    parse_stats: Optional[Dict[str, Counter]] = None,
+    relevance_threshold: float = 0.6
+) -> Dict[str, Any]:
     """
     Use AI to analyze a search result for relevance and quality.
     
+    Replies wrapped in code fences, surrounded by prose or cut off are
+    recovered locally; only replies with no recoverable score are retried.
+    
     Args:
         result: Result object to analyze
         topic: Topic context for relevance assessment
-        llm: LangChain LLM instance
+        llm: LangChain LLM instance (ideally wrapped with with_json_mode)
+        model: Model name used for parse counters
+        max_retries: Extra calls allowed for unparseable replies
+        parse_stats: Per-model counters to update (default: the process-wide PARSE_STATS)
+        relevance_threshold: Score deciding is_relevant when the reply omits it;
+            the pipeline passes ai.relevance_threshold
         
     Returns:
-        Dictionary with relevance_score, is_relevant, and reasoning
+        Dictionary with relevance_score, is_relevant and reasoning; unusable
+        verdicts have parse_failed set and a zero score
     """
     # Load prompt from external file
     prompt = load_prompt("relevance_analysis")
+    stats = (PARSE_STATS if parse_stats is None else parse_stats)[model or 'unknown']
     
     messages = prompt.format_messages(
         topic_name=topic.name,
         keywords=", ".join(topic.keywords),
         title=result.title,
         url=result.url,
-        snippet=result.snippet[:300]
+        snippet=analysis_text(result)
     )
     
-    try:
-        response = llm.invoke(messages)
-        # Parse JSON from response
-        parsed = json.loads(response.content.strip())
+    for attempt in range(max_retries + 1):
+        try:
+            response = llm.invoke(messages)
+        except Exception as e:
+            logger.warning(f"AI analysis failed for {result.url}: {e}")
+            break
         
-        # Convert relevance_score to float
-        parsed['relevance_score'] = float(parsed['relevance_score'])
+        content = response.content.strip()
+        parsed = parse_relevance_response(content, relevance_threshold)
+        if parsed is not None:
+            stats['parsed' if is_strict_json(content) else 'recovered'] += 1
+            return parsed
         
-        return parsed
-    except Exception as e:
-        logger.warning(f"AI analysis failed for {result.url}: {e}")
-        return {
-            'relevance_score': 0.5,
-            'is_relevant': True,
-            'reasoning': 'AI analysis unavailable'
-        }
+        if attempt < max_retries:
+            stats['retried'] += 1
+            logger.debug(f"Unparseable AI reply for {result.url}, retrying")
+    
+    stats['failed'] += 1
+    return {
+        'relevance_score': 0.0,
+        'is_relevant': False,
+        'reasoning': 'AI analysis unavailable',
+        'parse_failed': True
+    }
+
+
+def analysis_text(result: Result) -> str:
+    """Return the text judged by the LLM: the compressed text if set, else fetched main text or the snippet."""
+    if result.compressed is not None:
+        return result.compressed
+    if result.content:
+        return result.content[:CONTENT_ANALYSIS_CHARS]
+    return result.snippet[:300]
 
 
 def generate_summary_with_ai(result: Result, llm: Any) -> str:
@@ -70,7 +145,7 @@ def generate_summary_with_ai(result: Result, llm: Any) -> str:
     
     messages = prompt.format_messages(
         title=result.title,
-        snippet=result.snippet[:400]
+        snippet=result.compressed if result.compressed is not None else result.snippet[:400]
     )
     
     try:
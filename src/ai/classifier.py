@@ -0,0 +1,409 @@
+"""
+Local relevance classifier that pre-screens results before the LLM.
+
+A logistic regression over hashed word n-grams, trained on the relevance
+verdicts the LLM gave in earlier runs. Results it is confident about are
+scored locally; only those inside the uncertainty band are escalated to
+analyze_result_with_ai.
+"""
+
+import json
+import logging
+import math
+import os
+import random
+import re
+import tempfile
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..core.models import ClassifierConfig, Result, SearchConfig, Topic
+from ..output.archive import iter_run_data
+
+
+logger = logging.getLogger(__name__)
+
+# Hashed feature space; collisions are rare at the vocabulary sizes seen here
+N_FEATURES = 1 << 18
+
+# Share of stored verdicts (by URL hash) held out to evaluate a new model
+HOLDOUT_SHARE = 0.2
+
+_TOKEN_RE = re.compile(r'\w{2,}')
+
+# (features, label)
+Example = Tuple[Dict[int, float], int]
+
+
+def _bucket(feature: str) -> int:
+    return zlib.crc32(feature.encode('utf-8')) & (N_FEATURES - 1)
+
+
+def _unit_hash(salt: str, text: str) -> float:
+    """Stable value in [0, 1) for deterministic sampling; each use has its own salt."""
+    return zlib.crc32(f'{salt}:{text}'.encode('utf-8')) / 2 ** 32
+
+
+def extract_features(
+    topic_name: str,
+    keywords: Iterable[str],
+    title: str,
+    snippet: str,
+    domain: str
+) -> Dict[int, float]:
+    """
+    Hashed binary feature vector of a result in a topic's context.
+
+    Features are word unigrams and bigrams of the title and snippet, title
+    words, the domain, the number of keyword hits, and text unigrams crossed
+    with the topic so one model can serve every cluster.
+
+    Args:
+        topic_name: Topic the result was found for
+        keywords: Topic keywords
+        title: Result title
+        snippet: Result snippet
+        domain: Result domain
+
+    Returns:
+        Sparse feature vector as {bucket: 1.0}
+    """
+    title_tokens = _TOKEN_RE.findall(title.lower())
+    tokens = title_tokens + _TOKEN_RE.findall(snippet.lower())
+    topic_key = topic_name.lower()
+
+    features = set(tokens)
+    features.update(f"{topic_key}|{token}" for token in tokens)
+    features.update(f"{first} {second}" for first, second in zip(tokens, tokens[1:]))
+    features.update(f"title:{token}" for token in title_tokens)
+    if domain:
+        features.add(f"domain:{domain.lower()}")
+        features.add(f"{topic_key}|domain:{domain.lower()}")
+
+    text = f"{title} {snippet}".lower()
+    hits = sum(1 for keyword in keywords if keyword.lower() in text)
+    features.add(f"keyword_hits:{min(hits, 5)}")
+
+    return {_bucket(feature): 1.0 for feature in features}
+
+
+def result_features(topic: Topic, result: Result) -> Dict[int, float]:
+    """Feature vector of a result as judged for a topic."""
+    return extract_features(topic.name, topic.keywords, result.title, result.snippet, result.domain)
+
+
+class RelevanceClassifier:
+    """
+    Logistic regression over hashed features, trained with plain SGD.
+
+    Weights are stored sparsely, so the model file holds only features
+    seen in training. Scoring a result costs one tokenisation and a few
+    dozen dictionary lookups.
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Dict[int, float]] = None,
+        bias: float = 0.0,
+        metrics: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            weights: Sparse weights by feature bucket
+            bias: Intercept
+            metrics: Training metrics stored with the model
+        """
+        self.weights = weights or {}
+        self.bias = bias
+        self.metrics = metrics or {}
+
+    def predict_proba(self, features: Dict[int, float]) -> float:
+        """Probability that the LLM would judge the result relevant."""
+        z = self.bias + sum(self.weights.get(bucket, 0.0) * value for bucket, value in features.items())
+        if z < -30:
+            return 0.0
+        return 1.0 / (1.0 + math.exp(-z))
+
+    def score(self, topic: Topic, result: Result) -> float:
+        """Probability that a result is relevant to a topic."""
+        return self.predict_proba(result_features(topic, result))
+
+    def fit(
+        self,
+        examples: List[Example],
+        epochs: int = 12,
+        learning_rate: float = 0.5,
+        l2: float = 1e-5,
+        seed: int = 13
+    ) -> None:
+        """
+        Train from scratch with class-balanced stochastic gradient descent.
+
+        Args:
+            examples: (features, label) pairs
+            epochs: Passes over the examples
+            learning_rate: Initial step size, decayed per epoch
+            l2: L2 regularisation strength
+            seed: Shuffle seed, for reproducible models
+        """
+        self.weights, self.bias = {}, 0.0
+        positives = sum(label for _, label in examples)
+        negatives = len(examples) - positives
+        if not positives or not negatives:
+            raise ValueError("Training needs both relevant and irrelevant verdicts")
+        class_weight = {1: len(examples) / (2 * positives), 0: len(examples) / (2 * negatives)}
+
+        order = list(range(len(examples)))
+        rng = random.Random(seed)
+        for epoch in range(epochs):
+            rng.shuffle(order)
+            rate = learning_rate / (1 + epoch)
+            for index in order:
+                features, label = examples[index]
+                gradient = (self.predict_proba(features) - label) * class_weight[label]
+                for bucket, value in features.items():
+                    weight = self.weights.get(bucket, 0.0)
+                    self.weights[bucket] = weight - rate * (gradient * value + l2 * weight)
+                self.bias -= rate * gradient
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'n_features': N_FEATURES,
+            'bias': self.bias,
+            'weights': {str(bucket): round(weight, 6) for bucket, weight in self.weights.items() if weight},
+            'metrics': self.metrics
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RelevanceClassifier":
+        if data.get('n_features') != N_FEATURES:
+            raise ValueError("Model was trained with a different feature space")
+        weights = {int(bucket): weight for bucket, weight in data.get('weights', {}).items()}
+        return cls(weights, data.get('bias', 0.0), data.get('metrics', {}))
+
+    def save(self, path: str) -> None:
+        """Write the model atomically as JSON."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=Path(path).parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "RelevanceClassifier":
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def classifier_path(config: SearchConfig) -> str:
+    """Location of the classifier model for a configuration."""
+    return config.classifier.model_path or str(Path(config.output_dir) / 'relevance_classifier.json')
+
+
+class VerdictLog:
+    """
+    LLM verdicts and local-classifier counters collected during a run.
+
+    Verdicts are stored in the run's metadata, so the archive doubles as
+    the training set. Worker processes return their logs for merging.
+    """
+
+    def __init__(self):
+        self.verdicts: List[Dict[str, Any]] = []
+        self.counts: Counter = Counter()
+
+    def record(self, topic: Topic, result: Result, score: float) -> None:
+        self.verdicts.append({
+            'topic': topic.name,
+            'url': result.url,
+            'domain': result.domain,
+            'title': result.title,
+            'snippet': result.snippet,
+            'score': score
+        })
+
+    def merge(self, other: "VerdictLog") -> None:
+        self.verdicts.extend(other.verdicts)
+        self.counts.update(other.counts)
+
+    def summary(self) -> Dict[str, Any]:
+        """Calls avoided and agreement with the LLM, as plain numbers."""
+        counts = self.counts
+        screened = counts['local'] + counts['escalated'] + counts['audited']
+        return {
+            'screened': screened,
+            'local': counts['local'],
+            'escalated': counts['escalated'],
+            'audited': counts['audited'],
+            'calls_avoided': round(counts['local'] / screened, 3) if screened else 0.0,
+            'audit_agreement': (
+                round(counts['audit_agreed'] / counts['audited'], 3) if counts['audited'] else None
+            )
+        }
+
+    def notes(self) -> List[str]:
+        summary = self.summary()
+        if not summary['screened']:
+            return []
+        note = (
+            f"Relevance classifier: {summary['local']} of {summary['screened']} verdicts made locally "
+            f"({summary['calls_avoided']:.0%} of AI calls avoided), {summary['escalated']} escalated"
+        )
+        if summary['audit_agreement'] is not None:
+            note += f"; agreed with the LLM on {summary['audit_agreement']:.0%} of {summary['audited']} audited results"
+        return [note]
+
+
+def screen_results(
+    results: List[Result],
+    topic: Topic,
+    classifier: RelevanceClassifier,
+    settings: ClassifierConfig,
+    log: Optional[VerdictLog] = None
+) -> Tuple[List[Result], Dict[str, float]]:
+    """
+    Score results locally and pick those that still need an LLM verdict.
+
+    Confident results get the classifier probability as relevance score.
+    Results inside the (lower, upper) band are escalated, as is a stable
+    audit_rate sample of confident ones, whose LLM verdicts measure how
+    often the local decisions agree with the LLM.
+
+    Args:
+        results: Results to screen
+        topic: Topic the results were found for
+        classifier: Trained classifier
+        settings: Uncertainty band and audit rate
+        log: Optional VerdictLog receiving the counters
+
+    Returns:
+        Tuple of (results to send to the LLM, audited URL -> local probability)
+    """
+    escalate = []
+    audits = {}
+    for result in results:
+        probability = classifier.score(topic, result)
+        if settings.lower < probability < settings.upper:
+            escalate.append(result)
+            counter = 'escalated'
+        elif _unit_hash('audit', result.url) < settings.audit_rate:
+            escalate.append(result)
+            audits[result.url] = probability
+            counter = 'audited'
+        else:
+            result.relevance_score = round(probability, 3)
+            result.score_source = 'classifier'
+            counter = 'local'
+        if log is not None:
+            log.counts[counter] += 1
+    return escalate, audits
+
+
+def record_audits(
+    results: List[Result],
+    audits: Dict[str, float],
+    log: VerdictLog,
+    threshold: float
+) -> None:
+    """Count audited results whose local decision matches the LLM verdict at the relevance threshold."""
+    for result in results:
+        if result.url in audits:
+            local = audits[result.url] >= threshold
+            log.counts['audit_agreed'] += local == (result.relevance_score >= threshold)
+
+
+def collect_examples(config: SearchConfig) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Gather stored LLM verdicts from live and archived runs.
+
+    Later verdicts for the same topic and URL replace earlier ones.
+
+    Args:
+        config: SearchConfig whose output directory holds the runs
+
+    Returns:
+        List of (topic name, verdict) pairs
+    """
+    latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for _, data in iter_run_data(config.output_dir):
+        for verdict in (data.get('metadata') or {}).get('verdicts', []):
+            latest[(verdict['topic'], verdict['url'])] = verdict
+    return [(topic, verdict) for (topic, _), verdict in latest.items()]
+
+
+def _evaluate(
+    classifier: RelevanceClassifier,
+    examples: List[Example],
+    settings: ClassifierConfig,
+    threshold: float
+) -> Dict[str, Any]:
+    agreed = confident = confident_agreed = 0
+    for features, label in examples:
+        probability = classifier.predict_proba(features)
+        agreed += (probability >= threshold) == bool(label)
+        if not settings.lower < probability < settings.upper:
+            confident += 1
+            confident_agreed += (probability >= threshold) == bool(label)
+    total = len(examples)
+    return {
+        'holdout_examples': total,
+        'agreement': round(agreed / total, 3) if total else None,
+        'calls_avoided': round(confident / total, 3) if total else None,
+        'agreement_when_local': round(confident_agreed / confident, 3) if confident else None
+    }
+
+
+def train_classifier(config: SearchConfig) -> Dict[str, Any]:
+    """
+    Train the relevance classifier from stored verdicts and save it.
+
+    The model is first fitted on 80% of the verdicts and evaluated on the
+    rest, then refitted on all of them. The holdout metrics estimate the
+    share of LLM calls the configured band would avoid and how often the
+    local decisions agree with the LLM.
+
+    Args:
+        config: SearchConfig with the output directory and classifier settings
+
+    Returns:
+        Training metrics, also stored in the model file
+    """
+    keywords = {topic.name: topic.keywords for topic in config.topics}
+    # Verdicts are labelled relevant at the pipeline's AI threshold
+    threshold = config.relevance_threshold
+    labelled = []
+    for topic_name, verdict in collect_examples(config):
+        features = extract_features(
+            topic_name, keywords.get(topic_name, []),
+            verdict.get('title', ''), verdict.get('snippet', ''), verdict.get('domain', '')
+        )
+        labelled.append((verdict['url'], (features, int(verdict['score'] >= threshold))))
+
+    if len(labelled) < config.classifier.min_examples:
+        raise ValueError(
+            f"Only {len(labelled)} stored verdicts; at least {config.classifier.min_examples} needed "
+            f"(runs record them while ai.classifier.record_verdicts is on)"
+        )
+
+    train = [example for url, example in labelled if _unit_hash('holdout', url) >= HOLDOUT_SHARE]
+    holdout = [example for url, example in labelled if _unit_hash('holdout', url) < HOLDOUT_SHARE]
+    classifier = RelevanceClassifier()
+    classifier.fit(train)
+    metrics = _evaluate(classifier, holdout, config.classifier, threshold)
+
+    classifier.fit([example for _, example in labelled])
+    metrics.update({
+        'examples': len(labelled),
+        'relevant': sum(label for _, (_, label) in labelled),
+        'band': [config.classifier.lower, config.classifier.upper]
+    })
+    classifier.metrics = metrics
+    path = classifier_path(config)
+    classifier.save(path)
+    logger.info(
+        f"Relevance classifier trained on {metrics['examples']} verdicts, saved to {path}: "
+        f"{metrics['agreement']} holdout agreement, {metrics['calls_avoided']} of calls avoidable"
+    )
+    return metrics
@@ -0,0 +1,280 @@
+"""
+Pre-LLM compression of result text into a token-bounded input.
+
+Instead of a blind character cut, the text is split into sentences,
+boilerplate is dropped, and the sentences carrying the most topic
+keywords and figures are kept, in their original order, until the token
+budget is spent. Boilerplate is recognised by generic patterns (cookie
+banners, sign-up prompts, navigation) and learned per domain: sentences
+that repeat across several pages of the same domain are page furniture,
+not content. Boilerplate is learned from one topic's results at a time,
+so a result's input does not depend on which topics ran before it or in
+which worker process.
+"""
+
+import logging
+import math
+import random
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.models import CompressionConfig, Result, SearchConfig, Topic
+from .analyzer import analysis_text, analyze_result_with_ai, with_json_mode
+from .classifier import collect_examples
+
+
+logger = logging.getLogger(__name__)
+
+# Rough size of a token in English text, as used for the budgets
+CHARS_PER_TOKEN = 4
+
+# A sentence is learned boilerplate once it appears on this share of a domain's pages
+BOILERPLATE_SHARE = 0.3
+
+# Pages per domain learned from; later pages are only compressed
+MAX_PAGES_PER_DOMAIN = 500
+
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+(?=["\'(\[A-Z0-9©])|\s*\n+\s*|\s+[|•·»]\s+')
+_WORD_RE = re.compile(r'\w+')
+_NUMBER_RE = re.compile(r'\d+(?:[.,]\d+)*')
+_STATISTIC_RE = re.compile(
+    r'\d\s*%|\d\s*percent\b|[$€£]\s*\d|\d\s*(?:x|bn|billion|million|trillion)\b', re.I
+)
+# Banner phrasing only: calls to action opening a sentence, bare link labels,
+# cookie notices and copyright lines. Sentences that merely mention these
+# words ("a copyright lawsuit", "the agent signs in to tools") are content.
+_BOILERPLATE_RE = re.compile(
+    r'^\W*(?:subscribe|sign (?:in|up)|log ?in|register|accept(?: all)?(?: cookies)?|follow us|'
+    r'share (?:this|on)|read more|click here|skip to (?:main )?content|'
+    r'(?:join|get) (?:our|the) newsletter)\b|^\W*copyright\s*(?:©|\(c\)|\d{4})'
+    r'|^\W*(?:privacy policy|terms of (?:use|service)|cookie (?:policy|settings)|advertisement|'
+    r'related (?:articles|posts|stories))\W*$'
+    r'|\b(?:we|this (?:site|website)) uses? cookies\b|\ball rights reserved\b|©',
+    re.I
+)
+
+# Longer sentences matching a generic pattern are kept: they may be content
+_BOILERPLATE_MAX_WORDS = 20
+
+_STOPWORDS = frozenset({'and', 'for', 'the', 'with', 'from', 'into', 'your', 'our', 'are', 'how'})
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences and lines, dropping empty pieces."""
+    return [piece.strip() for piece in _SENTENCE_RE.split(text) if piece and piece.strip()]
+
+
+def _sentence_key(sentence: str) -> str:
+    # Numbers are masked so "Updated 3 May" and "Updated 9 June" style lines match
+    return ' '.join(_NUMBER_RE.sub('0', word) for word in _WORD_RE.findall(sentence.lower()))
+
+
+def _keyword_terms(topic: Topic) -> Tuple[Set[str], List[str]]:
+    phrases = [keyword.lower() for keyword in topic.keywords if keyword.strip()]
+    words = {
+        word for phrase in phrases for word in _WORD_RE.findall(phrase)
+        if (len(word) >= 3 or word.isupper() or word == 'ai') and word not in _STOPWORDS
+    }
+    return words, [phrase for phrase in phrases if ' ' in phrase]
+
+
+def score_sentence(sentence: str, words: Set[str], phrases: List[str]) -> float:
+    """
+    Keyword and figure density of a sentence.
+
+    Args:
+        sentence: Sentence text
+        words: Topic keyword words, lowercase
+        phrases: Multi-word topic keywords, lowercase
+
+    Returns:
+        Weighted keyword, number and statistic hits over the square root of
+        the sentence length, so long sentences need more hits to win
+    """
+    tokens = _WORD_RE.findall(sentence.lower())
+    if not tokens:
+        return 0.0
+    lowered = sentence.lower()
+    hits = sum(1 for token in tokens if token in words)
+    hits += 2 * sum(1 for phrase in phrases if phrase in lowered)
+    hits += 1.5 * len(_NUMBER_RE.findall(sentence))
+    hits += 2 * len(_STATISTIC_RE.findall(sentence))
+    return hits / math.sqrt(len(tokens))
+
+
+class SnippetCompressor:
+    """
+    Token-bounded LLM inputs with per-domain boilerplate learned from results.
+
+    Each page counts once per domain.
+    """
+
+    def __init__(self, settings: Optional[CompressionConfig] = None):
+        self.settings = settings or CompressionConfig()
+        self._pages: Dict[str, Set[str]] = defaultdict(set)
+        self._sentences: Dict[str, Counter] = defaultdict(Counter)
+
+    def learn(self, results: Iterable[Result]) -> None:
+        """Count the sentences of pages not seen before, per domain."""
+        for result in results:
+            domain = result.domain or ''
+            pages = self._pages[domain]
+            if result.url in pages or len(pages) >= MAX_PAGES_PER_DOMAIN:
+                continue
+            pages.add(result.url)
+            keys = {_sentence_key(sentence) for sentence in split_sentences(_source_text(result))}
+            self._sentences[domain].update(key for key in keys if key)
+
+    def is_boilerplate(self, domain: Optional[str], sentence: str) -> bool:
+        """Whether a sentence is generic page furniture or repeats across the domain's pages."""
+        if len(_WORD_RE.findall(sentence)) <= _BOILERPLATE_MAX_WORDS and _BOILERPLATE_RE.search(sentence):
+            return True
+        domain = domain or ''
+        pages = len(self._pages.get(domain, ()))
+        seen = self._sentences[domain][_sentence_key(sentence)] if domain in self._sentences else 0
+        return seen >= max(self.settings.min_support, BOILERPLATE_SHARE * pages)
+
+    def compress(self, result: Result, topic: Topic) -> str:
+        """
+        Build the token-bounded text sent to the LLM for a result.
+
+        Args:
+            result: Result with a snippet and, optionally, fetched content
+            topic: Topic whose keywords mark the sentences worth keeping
+
+        Returns:
+            Kept sentences in their original order, within the budget for
+            fetched content or snippets
+        """
+        budget = self.settings.content_tokens if result.content else self.settings.snippet_tokens
+        sentences = [
+            sentence for sentence in split_sentences(_source_text(result))
+            if not self.is_boilerplate(result.domain, sentence)
+        ]
+        if not sentences:
+            return ''
+        if estimate_tokens(' '.join(sentences)) <= budget:
+            return ' '.join(sentences)
+
+        words, phrases = _keyword_terms(topic)
+        ranked = sorted(
+            range(len(sentences)),
+            key=lambda index: (-score_sentence(sentences[index], words, phrases), index)
+        )
+        kept, remaining = [], budget
+        for index in ranked:
+            cost = estimate_tokens(sentences[index]) + 1
+            if cost <= remaining:
+                kept.append(index)
+                remaining -= cost
+        if not kept:
+            # Even the best sentence is over budget: keep its start
+            return sentences[ranked[0]][:budget * CHARS_PER_TOKEN].rstrip()
+        return ' '.join(sentences[index] for index in sorted(kept))
+
+    def compress_all(self, results: List[Result], topic: Topic) -> Tuple[int, int]:
+        """
+        Learn from results, then set `compressed` on each.
+
+        Args:
+            results: Results about to be judged by the LLM
+            topic: Topic the results were found for
+
+        Returns:
+            Estimated (tokens before, tokens after); "before" is the
+            character cut the LLM would otherwise receive
+        """
+        self.learn(results)
+        before = after = 0
+        for result in results:
+            result.compressed = None
+            before += estimate_tokens(analysis_text(result))
+            compressed = self.compress(result, topic)
+            # Keep the character cut rather than send an empty input
+            result.compressed = compressed or None
+            after += estimate_tokens(analysis_text(result))
+        return before, after
+
+
+def _source_text(result: Result) -> str:
+    return result.content or result.snippet or ''
+
+
+def benchmark_compression(config: SearchConfig, llm: Any = None, sample_size: int = 50) -> Dict[str, Any]:
+    """
+    Measure tokens saved by compression against relevance-score agreement.
+
+    Stored relevance verdicts from live and archived runs are the corpus.
+    Boilerplate is learned from all of them; a sample is then scored by
+    the LLM twice, once with the character cut and once compressed.
+    Makes 2 x sample_size LLM calls.
+
+    Args:
+        config: SearchConfig with the output directory, model and compression settings
+        llm: Optional LangChain chat model; created from the config if omitted
+        sample_size: Stored verdicts to score
+
+    Returns:
+        Token counts, the share saved, the share of results on the same
+        side of the relevance threshold, and the mean score difference
+    """
+    if llm is None:
+        from .llm_factory import create_llm
+        llm = create_llm(config.ai_model, config.ai_temperature)
+    scoring_llm = with_json_mode(llm) if config.ai_structured_output else llm
+
+    topics = {topic.name: topic for topic in config.topics}
+    examples = [
+        (topics.get(name) or Topic(name=name, keywords=[], search_variations=[]), Result(
+            title=verdict.get('title', ''), url=verdict['url'],
+            snippet=verdict.get('snippet', ''), domain=verdict.get('domain')
+        ))
+        for name, verdict in collect_examples(config)
+    ]
+    if not examples:
+        raise ValueError("No stored verdicts to benchmark; runs record them while ai.classifier.record_verdicts is on")
+
+    # As in the pipeline, boilerplate is learned from each topic's results
+    compressors: Dict[str, SnippetCompressor] = {}
+    for topic, result in examples:
+        compressors.setdefault(topic.name, SnippetCompressor(config.compression)).learn([result])
+    sample = random.Random(0).sample(examples, min(sample_size, len(examples)))
+
+    threshold = config.relevance_threshold
+    tokens_before = tokens_after = agreed = 0
+    differences = []
+    for topic, result in sample:
+        tokens_before += estimate_tokens(analysis_text(result))
+        raw = analyze_result_with_ai(
+            result, topic, scoring_llm, model=config.ai_model, relevance_threshold=threshold
+        )
+        result.compressed = compressors[topic.name].compress(result, topic) or None
+        tokens_after += estimate_tokens(analysis_text(result))
+        compressed = analyze_result_with_ai(
+            result, topic, scoring_llm, model=config.ai_model, relevance_threshold=threshold
+        )
+        if raw.get('parse_failed') or compressed.get('parse_failed'):
+            continue
+        agreed += (raw['relevance_score'] >= threshold) == (compressed['relevance_score'] >= threshold)
+        differences.append(abs(raw['relevance_score'] - compressed['relevance_score']))
+
+    metrics = {
+        'examples': len(sample),
+        'scored': len(differences),
+        'tokens_before': tokens_before,
+        'tokens_after': tokens_after,
+        'tokens_saved': round(1 - tokens_after / tokens_before, 3) if tokens_before else None,
+        'agreement': round(agreed / len(differences), 3) if differences else None,
+        'mean_score_difference': round(sum(differences) / len(differences), 3) if differences else None
+    }
+    logger.info(
+        f"Compression benchmark on {metrics['examples']} verdicts: {metrics['tokens_saved']} of tokens saved, "
+        f"{metrics['agreement']} agreement at threshold {threshold}"
+    )
+    return metrics
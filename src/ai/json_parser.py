@@ -0,0 +1,135 @@
+"""
+Tolerant parsing of JSON objects embedded in LLM replies.
+"""
+
+import json
+import re
+from typing import Any, Dict, Optional
+
+
+FENCE_PATTERN = re.compile(r'```(?:json|JSON)?\s*(.*?)(?:```|$)', re.DOTALL)
+TRAILING_COMMA_PATTERN = re.compile(r',\s*([}\]])')
+SCORE_PATTERN = re.compile(r'"?relevance_score"?\s*[:=]\s*"?([01](?:\.\d+)?|\.\d+)')
+RELEVANT_PATTERN = re.compile(r'"?is_relevant"?\s*[:=]\s*"?(true|false)', re.IGNORECASE)
+REASONING_PATTERN = re.compile(r'"?reasoning"?\s*:\s*"((?:[^"\\]|\\.)*)', re.DOTALL)
+
+
+def _balanced_object(text: str) -> Optional[str]:
+    """Return the first {...} span, closing it if the reply was cut off."""
+    start = text.find('{')
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+
+    # Truncated reply: close the open string and objects
+    return text[start:] + ('"' if in_string else '') + '}' * depth
+
+
+def _loads(candidate: str) -> Optional[Dict[str, Any]]:
+    for text in (candidate, TRAILING_COMMA_PATTERN.sub(r'\1', candidate)):
+        try:
+            parsed = json.loads(text)
+        except ValueError:
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    return None
+
+
+def is_strict_json(text: str) -> bool:
+    """Return True if the text is exactly one valid JSON object."""
+    try:
+        return isinstance(json.loads(text), dict)
+    except ValueError:
+        return False
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Recover a JSON object from an LLM reply.
+
+    Handles plain JSON, code fences, leading or trailing prose, trailing
+    commas and replies truncated mid-object.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        Parsed dictionary, or None if no object could be recovered
+    """
+    text = text.strip()
+    parsed = _loads(text)
+    if parsed is not None:
+        return parsed
+
+    fence = FENCE_PATTERN.search(text)
+    if fence:
+        parsed = _loads(fence.group(1).strip())
+        if parsed is not None:
+            return parsed
+
+    candidate = _balanced_object(text)
+    if candidate:
+        return _loads(candidate)
+    return None
+
+
+def parse_relevance_response(text: str, threshold: float) -> Optional[Dict[str, Any]]:
+    """
+    Parse a relevance verdict, falling back to field-level extraction.
+
+    Args:
+        text: Raw model output for the relevance_analysis prompt
+        threshold: Relevance threshold deciding is_relevant when the reply omits it
+
+    Returns:
+        Dictionary with float relevance_score in [0, 1], is_relevant and
+        reasoning, or None if no score could be found
+    """
+    parsed = extract_json_object(text) or {}
+
+    score = parsed.get('relevance_score')
+    if score is None:
+        match = SCORE_PATTERN.search(text)
+        score = match.group(1) if match else None
+    try:
+        score = float(score)
+    except (TypeError, ValueError):
+        return None
+    score = min(1.0, max(0.0, score))
+
+    is_relevant = parsed.get('is_relevant')
+    if not isinstance(is_relevant, bool):
+        match = RELEVANT_PATTERN.search(text)
+        is_relevant = match.group(1).lower() == 'true' if match else score >= threshold
+
+    reasoning = parsed.get('reasoning')
+    if not isinstance(reasoning, str):
+        match = REASONING_PATTERN.search(text)
+        reasoning = match.group(1) if match else ''
+
+    return {
+        'relevance_score': score,
+        'is_relevant': is_relevant,
+        'reasoning': reasoning
+    }
@@ -0,0 +1,80 @@
+"""
+LLM client construction with record/replay support.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_openai import ChatOpenAI
+
+from ..core.cassette import Cassette, get_active_cassette
+
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteLLM:
+    """
+    Chat model wrapper that records or replays invoke() calls.
+
+    Only the subset of the LangChain interface used by the analyzer is
+    provided: invoke() and bind(). In replay mode no real client exists,
+    so no API key or network access is needed.
+    """
+
+    def __init__(
+        self,
+        llm: Optional[Any],
+        cassette: Cassette,
+        model: str,
+        temperature: float,
+        bound_kwargs: Optional[Dict[str, Any]] = None
+    ):
+        self.llm = llm
+        self.cassette = cassette
+        self.model = model
+        self.temperature = temperature
+        self.bound_kwargs = bound_kwargs or {}
+
+    def bind(self, **kwargs: Any) -> "CassetteLLM":
+        bound = self.llm.bind(**kwargs) if self.llm is not None else None
+        return CassetteLLM(
+            bound, self.cassette, self.model, self.temperature, {**self.bound_kwargs, **kwargs}
+        )
+
+    def invoke(self, messages: List[BaseMessage]) -> Any:
+        request = {
+            'model': self.model,
+            'temperature': self.temperature,
+            'kwargs': self.bound_kwargs,
+            'messages': [{'type': m.type, 'content': m.content} for m in messages]
+        }
+
+        if self.cassette.replaying:
+            return AIMessage(content=self.cassette.play('llm', request)['content'])
+
+        start = time.monotonic()
+        response = self.llm.invoke(messages)
+        self.cassette.record('llm', request, {'content': response.content}, time.monotonic() - start)
+        return response
+
+
+def create_llm(model: str, temperature: float) -> Any:
+    """
+    Build the chat model for scoring and summaries.
+
+    Args:
+        model: OpenAI model name
+        temperature: Sampling temperature
+
+    Returns:
+        ChatOpenAI instance, wrapped in a CassetteLLM when a cassette is active
+    """
+    cassette = get_active_cassette()
+    if cassette is None:
+        return ChatOpenAI(model=model, temperature=temperature)
+
+    llm = None if cassette.replaying else ChatOpenAI(model=model, temperature=temperature)
+    return CassetteLLM(llm, cassette, model, temperature)
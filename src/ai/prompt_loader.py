@@ -3,23 +3,66 @@ Prompt loading and management utilities.
 """
 
 from pathlib import Path
+from typing import Dict, Tuple
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
+# Parsed templates keyed by prompt name, invalidated when the file changes
+_PROMPT_CACHE: Dict[str, Tuple[int, ChatPromptTemplate]] = {}
+_TEXT_CACHE: Dict[str, Tuple[int, str]] = {}
+
+
+def _prompt_path(name: str) -> Path:
+    prompt_path = Path(__file__).parent / "prompts" / f"{name}.txt"
+    
+    if not prompt_path.exists():
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+    
+    return prompt_path
+
+
+def load_prompt_text(name: str) -> str:
+    """
+    Load the raw text of a prompt file.
+    
+    Args:
+        name: Name of the prompt file (without .txt extension)
+        
+    Returns:
+        Template text with its {placeholders} unformatted
+    """
+    prompt_path = _prompt_path(name)
+    mtime = prompt_path.stat().st_mtime_ns
+    cached = _TEXT_CACHE.get(name)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    text = prompt_path.read_text(encoding='utf-8')
+    _TEXT_CACHE[name] = (mtime, text)
+    return text
+
+
 def load_prompt(name: str) -> ChatPromptTemplate:
     """
     Load a prompt template from the prompts directory.
     
+    Templates are cached in memory and re-read only when the file's
+    modification time changes, so edits still take effect on the next run.
+    
     Args:
         name: Name of the prompt file (without .txt extension)
         
     Returns:
         ChatPromptTemplate ready for use with format_messages()
     """
-    prompt_path = Path(__file__).parent / "prompts" / f"{name}.txt"
-    
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+    prompt_path = _prompt_path(name)
+    mtime = prompt_path.stat().st_mtime_ns
+    cached = _PROMPT_CACHE.get(name)
+    if cached and cached[0] == mtime:
+        return cached[1]
     
-    template = prompt_path.read_text(encoding='utf-8')
-    return ChatPromptTemplate.from_template(template)
+    template = load_prompt_text(name)
+    prompt = ChatPromptTemplate.from_template(template)
+    _PROMPT_CACHE[name] = (mtime, prompt)
+    return prompt
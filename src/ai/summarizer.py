@@ -0,0 +1,148 @@
+"""
+Batched, cached summary generation for final ranked results.
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.cache import DiskCache
+from ..core.models import Result
+from .analyzer import CONTENT_ANALYSIS_CHARS
+from .json_parser import extract_json_object
+from .prompt_loader import load_prompt, load_prompt_text
+
+
+logger = logging.getLogger(__name__)
+
+
+def summary_text(result: Result) -> str:
+    """Return the text to summarize: the compressed text if set, else fetched main text or the snippet."""
+    if result.compressed is not None:
+        return result.compressed
+    if result.content:
+        return result.content[:CONTENT_ANALYSIS_CHARS]
+    return result.snippet[:400]
+
+
+def summary_prompt_hash(model: str) -> str:
+    """Hash of the summary prompts and model, so edits invalidate cached summaries."""
+    digest = hashlib.sha256()
+    for part in (load_prompt_text("summary_generation"), load_prompt_text("summary_batch"), model):
+        digest.update(part.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def _content_hash(result: Result) -> str:
+    text = result.title + '\n' + summary_text(result)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _parse_batch_response(content: str, count: int) -> Dict[int, str]:
+    parsed = extract_json_object(content)
+    if parsed is None:
+        raise ValueError("No JSON object in summary reply")
+
+    summaries = {}
+    for key, value in parsed.items():
+        if not str(key).strip().isdigit():
+            continue
+        index = int(key)
+        if 1 <= index <= count and isinstance(value, str) and value.strip():
+            summaries[index] = value.strip()
+    return summaries
+
+
+def apply_cached_summaries(
+    results: List[Result],
+    model: str,
+    cache: Optional[DiskCache]
+) -> List[Tuple[str, Result]]:
+    """
+    Set `ai_summary` on results whose summary is cached; no LLM calls.
+
+    Args:
+        results: Results to look up
+        model: Model name, part of the cache key
+        cache: Optional DiskCache for summaries
+
+    Returns:
+        (cache key, result) for every result without a cached summary
+    """
+    prompt_hash = summary_prompt_hash(model)
+    pending = []
+    for result in results:
+        key = f"{prompt_hash}:{_content_hash(result)}"
+        cached = cache.get(key) if cache else None
+        if cached:
+            result.ai_summary = cached['summary']
+        else:
+            pending.append((key, result))
+    return pending
+
+
+def summarize_results(
+    results: List[Result],
+    llm: Any,
+    model: str,
+    cache: Optional[DiskCache] = None,
+    batch_size: int = 5
+) -> int:
+    """
+    Set `ai_summary` on each result, sending uncached results in batched prompts.
+
+    Each item is rendered with summary_generation.txt and wrapped by
+    summary_batch.txt, which asks for one JSON object with all summaries.
+    Summaries are cached by content hash and prompt hash.
+
+    Args:
+        results: Final ranked results to summarize
+        llm: LangChain LLM instance
+        model: Model name, part of the cache key
+        cache: Optional DiskCache for summaries
+        batch_size: Number of results per LLM call
+
+    Returns:
+        Number of LLM calls made
+    """
+    pending = apply_cached_summaries(results, model, cache)
+
+    if not pending:
+        logger.info(f"Summaries: {len(results)} served from cache")
+        return 0
+
+    item_template = load_prompt_text("summary_generation")
+    batch_prompt = load_prompt("summary_batch")
+    calls = 0
+
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        items = "\n\n".join(
+            f"### Task {index}\n"
+            + item_template.format(title=result.title, snippet=summary_text(result)).strip()
+            for index, (_, result) in enumerate(batch, 1)
+        )
+        messages = batch_prompt.format_messages(count=len(batch), items=items)
+
+        try:
+            calls += 1
+            response = llm.invoke(messages)
+            summaries = _parse_batch_response(response.content, len(batch))
+        except Exception as e:
+            logger.warning(f"Batch summary generation failed: {e}")
+            continue
+
+        for index, (key, result) in enumerate(batch, 1):
+            summary = summaries.get(index)
+            if summary is None:
+                logger.warning(f"No summary returned for {result.url}")
+                continue
+            result.ai_summary = summary
+            if cache:
+                cache.set(key, {'summary': summary})
+
+    logger.info(
+        f"Summaries: {len(results) - len(pending)} cached, "
+        f"{len(pending)} generated in {calls} call(s)"
+    )
+    return calls
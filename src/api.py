@@ -0,0 +1,340 @@
+"""
+In-process library API.
+
+Runs the research pipeline without the command-line wrapper:
+
+    from src.api import run_research
+
+    run = run_research("config.yaml")
+    for topic, results in run.results_by_topic.items():
+        ...
+
+or, yielding each topic as soon as its ranking is final:
+
+    async for topic, results in iter_research(config_dict):
+        ...
+
+Pass a RunContext to reuse HTTP connections, clients and caches across
+calls, or to inject your own LLM, search provider or summary cache.
+"""
+
+import asyncio
+import logging
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from .ai.analyzer import log_parse_stats
+from .ai.classifier import VerdictLog
+from .core.cassette import Cassette, activate_cassette
+from .core.config import load_config, parse_config
+from .core.history import ContentHistory
+from .core.models import Result, SearchConfig, Topic
+from .filters.selection import selection_is_global
+from .filters.stage_graph import StageTimings
+from .output.archive import run_id_from_path
+from .output.delta_report import bootstrap_runs, compute_delta, delta_note, delta_summary, run_rows
+from .pipeline import runner
+from .pipeline.context import RunContext
+from .pipeline.exclusions import apply_learned_exclusions, exclusion_notes, finish_domain_stats
+from .pipeline.parallel import run_pipeline_parallel
+from .pipeline.rerank import candidates_to_dict
+from .pipeline.scheduler import build_scheduler, run_scheduled
+
+
+logger = logging.getLogger(__name__)
+
+ConfigSource = Union[SearchConfig, Dict[str, Any], str]
+
+
+@dataclass
+class ResearchRun:
+    """Outcome of one pipeline run."""
+    results_by_topic: Dict[str, List[Result]]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    paths: Optional[Dict[str, Path]] = None
+
+
+def resolve_config(config: ConfigSource) -> SearchConfig:
+    """
+    Accept a SearchConfig, a dict in the config.yaml layout or a YAML path.
+
+    Args:
+        config: Configuration source
+
+    Returns:
+        SearchConfig object
+    """
+    if isinstance(config, SearchConfig):
+        return config
+    if isinstance(config, dict):
+        return parse_config(config)
+    return load_config(config)
+
+
+class _PreparedRun:
+    """Per-run state shared by run_research() and iter_research()."""
+
+    def __init__(
+        self,
+        config: SearchConfig,
+        context: RunContext,
+        workers: int,
+        cassette: Optional[Cassette],
+        deadline: Optional[datetime],
+        time_budget: Optional[float]
+    ):
+        self.context = context
+        self.cassette = cassette
+        self.replaying = cassette is not None and cassette.replaying
+
+        # Extend the exclude list with domains that never pass AI filtering
+        config, self.exclusion_report = apply_learned_exclusions(config, context, cassette)
+
+        if cassette is not None:
+            activate_cassette(cassette)
+            if cassette.recording:
+                # Workers record into their own memory, so recording runs serially
+                workers = 1
+                cassette.metadata['seen_urls'] = sorted(context.get_seen_urls(config.output_dir))
+                if config.history.enabled:
+                    cassette.metadata['history'] = context.get_history(config).export_rows()
+            else:
+                # Replay against the history captured at record time and keep
+                # replay outputs out of the real output history
+                context.seen_urls = set(cassette.metadata.get('seen_urls', []))
+                if config.history.enabled:
+                    context.history = ContentHistory()
+                    context.history.import_rows(cassette.metadata.get('history', []))
+                config = replace(config, output_dir=str(Path(config.output_dir) / "replay"))
+
+        # Order topics by priority and degrade low-priority work near the deadline
+        self.scheduler = build_scheduler(config, deadline, time_budget)
+        if self.scheduler is not None and workers > 1:
+            logger.warning("Deadline scheduling runs topics serially; ignoring workers setting")
+            workers = 1
+        if workers > 1 and context.has_injected_clients():
+            # Worker processes build their clients from the config
+            logger.warning("Injected clients cannot be shared with worker processes; running serially")
+            workers = 1
+
+        # Collect LLM verdicts (training data) and local classifier counters
+        self.verdict_log = None
+        if config.classifier.record_verdicts or config.classifier.enabled:
+            self.verdict_log = VerdictLog()
+        context.verdict_log = self.verdict_log
+        self.stage_timings = StageTimings()
+        context.stage_timings = self.stage_timings
+        # Scored candidates are stored with the run for offline re-ranks
+        self.candidate_log = {} if config.store_candidates else None
+        context.candidate_log = self.candidate_log
+        # Verdict parse outcomes of this run, including worker processes
+        self.parse_stats: Dict[str, Counter] = defaultdict(Counter)
+        context.parse_stats = self.parse_stats
+        # Results dropped as already reported still count for the delta report
+        self.carried_log = {} if config.delta_report else None
+        context.carried_log = self.carried_log
+        
+        self.config = config
+        self.workers = workers
+
+    def ordered_topics(self) -> List[Topic]:
+        if self.scheduler is not None:
+            return self.scheduler.order()
+        return list(self.config.topics)
+
+    def topic_candidates(self, topic: Topic) -> List[Result]:
+        if self.scheduler is not None:
+            return self.scheduler.run_topic(self.scheduler.plan(topic), self.context)
+        return runner.search_topic(topic, self.config, self.context)
+    
+    def select(self, candidates_by_topic: Dict[str, List[Result]]) -> Dict[str, List[Result]]:
+        skip = self.scheduler.unsummarized() if self.scheduler is not None else ()
+        return runner.finalize_results(candidates_by_topic, self.config, self.context, skip)
+
+    def run_all(self) -> Dict[str, List[Result]]:
+        # Process each topic, serially or sharded across worker processes
+        if self.scheduler is not None:
+            return run_scheduled(self.config, self.context, self.scheduler)
+        if self.workers > 1:
+            return run_pipeline_parallel(self.config, self.context, self.workers)
+        return runner.run_pipeline(self.config, self.context)
+
+    def release_cassette(self) -> None:
+        if self.cassette is None:
+            return
+        self.cassette.save()
+        activate_cassette(None)
+        if self.replaying and self.cassette.misses:
+            logger.warning(f"Replay served {self.cassette.misses} request(s) without a recording")
+
+    def finish(
+        self,
+        results_by_topic: Dict[str, List[Result]],
+        write_outputs: bool,
+        extra_metadata: Optional[Dict[str, Any]] = None
+    ) -> ResearchRun:
+        """
+        Collect the run's metadata, then record and write the run.
+
+        Args:
+            results_by_topic: Final results per topic
+            write_outputs: Write the report files and record the run for delta reports
+            extra_metadata: Metadata added by the caller; its notes are appended
+        """
+        if self.replaying:
+            metadata = {
+                'notes': exclusion_notes(self.exclusion_report),
+                'domain_exclusion': self.exclusion_report
+            }
+        else:
+            metadata = finish_domain_stats(self.config, self.context, self.exclusion_report)
+        if self.scheduler is not None:
+            metadata['notes'] = self.scheduler.notes() + metadata['notes']
+            metadata['schedule'] = [plan.to_dict() for plan in self.scheduler.plans]
+        if self.verdict_log is not None:
+            self.context.verdict_log = None
+            if self.config.classifier.enabled:
+                metadata['notes'] += self.verdict_log.notes()
+                metadata['classifier'] = self.verdict_log.summary()
+            if self.config.classifier.record_verdicts:
+                metadata['verdicts'] = self.verdict_log.verdicts
+        self.context.stage_timings = None
+        metadata['stage_timings'] = self.stage_timings.to_dict()
+        self.context.candidate_log = None
+        if self.candidate_log is not None:
+            metadata['candidates'] = candidates_to_dict(self.candidate_log)
+        self.context.carried_log = None
+        self.context.parse_stats = None
+        if self.parse_stats:
+            log_parse_stats(self.parse_stats)
+            metadata['parse_stats'] = {model: dict(counts) for model, counts in self.parse_stats.items()}
+        for key, value in (extra_metadata or {}).items():
+            if key == 'notes':
+                metadata['notes'] += value
+            else:
+                metadata[key] = value
+
+        # Compare with the previous run through the history's run index
+        delta = None
+        if write_outputs and self.config.delta_report:
+            run_index = self.context.get_history(self.config)
+            bootstrap_runs(run_index, self.config.output_dir)
+            delta = compute_delta(
+                run_index, results_by_topic, self.config.history.change_distance, self.carried_log
+            )
+            metadata['notes'].append(delta_note(*delta))
+            metadata['delta'] = delta_summary(*delta)
+        
+        paths = None
+        if write_outputs:
+            paths = runner.write_outputs(results_by_topic, self.config, metadata, delta)
+            if delta is not None:
+                run_index.record_run(run_id_from_path(paths['json']), run_rows(results_by_topic, delta[1]))
+
+        if not self.replaying:
+            self.context.remember_results(results_by_topic)
+            if self.context.history is not None:
+                self.context.history.flush()
+
+        return ResearchRun(results_by_topic, metadata, paths)
+
+
+def run_research(
+    config: ConfigSource,
+    context: Optional[RunContext] = None,
+    write_outputs: bool = False,
+    workers: Optional[int] = None,
+    cassette: Optional[Cassette] = None,
+    deadline: Optional[datetime] = None,
+    time_budget: Optional[float] = None
+) -> ResearchRun:
+    """
+    Run the pipeline in-process and return the ranked results per topic.
+
+    API keys are not checked up front: a context with injected clients, or a
+    replaying cassette, needs none.
+
+    Args:
+        config: SearchConfig, dict in the config.yaml layout, or YAML path
+        context: Optional RunContext to reuse or inject clients and caches
+        write_outputs: Also write the Markdown, JSON and browser files
+        workers: Number of worker processes, overriding execution.workers
+        cassette: Optional Cassette to record into or replay from
+        deadline: Optional wall-clock deadline for the run
+        time_budget: Optional time budget in seconds
+
+    Returns:
+        ResearchRun with results in configuration order, run metadata and
+        the written paths (None unless write_outputs)
+    """
+    config = resolve_config(config)
+    context = context or RunContext()
+    run = _PreparedRun(config, context, workers or config.workers, cassette, deadline, time_budget)
+
+    try:
+        results_by_topic = run.run_all()
+    finally:
+        run.release_cassette()
+
+    return run.finish(results_by_topic, write_outputs)
+
+
+async def iter_research(
+    config: ConfigSource,
+    context: Optional[RunContext] = None,
+    write_outputs: bool = False,
+    cassette: Optional[Cassette] = None,
+    deadline: Optional[datetime] = None,
+    time_budget: Optional[float] = None
+) -> AsyncIterator[Tuple[str, List[Result]]]:
+    """
+    Run the pipeline and yield (topic name, ranked results) as each topic is final.
+
+    Topics are processed one at a time on a background thread, in priority
+    order when a deadline applies, so the event loop stays free. When the
+    final selection spans topics (total_max_results or min_unique_sources
+    set), no topic is final until all are scored, so every topic is yielded
+    after the last one. Domain statistics, history and optional outputs are
+    written after the last topic; if iteration stops early they are not.
+
+    Args:
+        config: SearchConfig, dict in the config.yaml layout, or YAML path
+        context: Optional RunContext to reuse or inject clients and caches
+        write_outputs: Also write the Markdown, JSON and browser files
+        cassette: Optional Cassette to record into or replay from
+        deadline: Optional wall-clock deadline for the run
+        time_budget: Optional time budget in seconds
+
+    Yields:
+        Tuples of topic name and ranked results
+    """
+    config = resolve_config(config)
+    context = context or RunContext()
+    run = _PreparedRun(config, context, 1, cassette, deadline, time_budget)
+    global_selection = selection_is_global(run.config)
+
+    candidates_by_topic = {}
+    results_by_topic = {}
+    try:
+        for topic in run.ordered_topics():
+            candidates = await asyncio.to_thread(run.topic_candidates, topic)
+            if global_selection:
+                candidates_by_topic[topic.name] = candidates
+                continue
+            selected = await asyncio.to_thread(run.select, {topic.name: candidates})
+            results_by_topic[topic.name] = selected[topic.name]
+            yield topic.name, results_by_topic[topic.name]
+
+        if global_selection:
+            ordered = {topic.name: candidates_by_topic[topic.name] for topic in run.config.topics}
+            results_by_topic = await asyncio.to_thread(run.select, ordered)
+            for topic in run.ordered_topics():
+                yield topic.name, results_by_topic[topic.name]
+    finally:
+        run.release_cassette()
+
+    ordered = {topic.name: results_by_topic[topic.name] for topic in run.config.topics}
+    await asyncio.to_thread(run.finish, ordered, write_outputs)
@@ -1,6 +1,28 @@
 """Core module for data models and configuration."""
 
-from .models import Result, Topic, SearchConfig
-from .config import load_config
+from .models import (
+    Result, Topic, SearchConfig, ScheduleConfig, HedgeConfig, FetchConfig,
+    DomainExclusionConfig, HistoryConfig, ServiceConfig, ClassifierConfig, SelectionConfig,
+    PipelineConfig, CompressionConfig, result_to_dict, result_from_dict
+)
+from .config import load_config, parse_config
 
-__all__ = ['Result', 'Topic', 'SearchConfig', 'load_config']
+__all__ = [
+    'Result',
+    'Topic',
+    'SearchConfig',
+    'ScheduleConfig',
+    'HedgeConfig',
+    'FetchConfig',
+    'DomainExclusionConfig',
+    'HistoryConfig',
+    'ServiceConfig',
+    'ClassifierConfig',
+    'SelectionConfig',
+    'PipelineConfig',
+    'CompressionConfig',
+    'result_to_dict',
+    'result_from_dict',
+    'load_config',
+    'parse_config'
+]
@@ -0,0 +1,95 @@
+"""
+Small persistent key-value cache stored as JSON files on disk.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Persistent cache with one JSON file per key.
+
+    Keys are hashed into a two-level directory layout so lookups stay cheap
+    as the cache grows. Writes are atomic, so concurrent threads or processes
+    never observe a partially written entry.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Root directory for cache entries (created on demand)
+        """
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for `key`, or None if missing or unreadable."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def touch(self, key: str) -> None:
+        """Mark the entry for `key` as recently used, so pruning keeps it."""
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def prune(self, max_age_seconds: float) -> int:
+        """
+        Delete entries not written or touched within `max_age_seconds`.
+
+        Args:
+            max_age_seconds: Age after which an entry is removed
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.directory.is_dir():
+            return 0
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for path in self.directory.glob('*/*.json'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError as e:
+                logger.debug(f"Could not prune cache entry {path}: {e}")
+        if removed:
+            logger.info(f"Pruned {removed} cache entries older than {max_age_seconds / 86400:g} days from {self.directory}")
+        return removed
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serializable value under `key`."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
@@ -0,0 +1,181 @@
+"""
+Record/replay of external API interactions.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class CassetteMiss(KeyError):
+    """Raised in replay mode when no interaction was recorded for a request."""
+
+
+class Cassette:
+    """
+    A file of recorded request/response pairs for search, page and LLM calls.
+
+    In record mode every interaction is captured together with its latency
+    and written by save(). In replay mode responses are served from the file,
+    in recorded order for repeated identical requests, optionally sleeping
+    for the original latency. Paths ending in .gz are compressed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: str,
+        replay_latency: bool = False,
+        latency_scale: float = 1.0
+    ):
+        """
+        Args:
+            path: Cassette file path
+            mode: "record" or "replay"
+            replay_latency: Sleep for the recorded latency when replaying
+            latency_scale: Multiplier applied to recorded latencies
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.latency_scale = latency_scale
+        self.interactions: List[Dict[str, Any]] = []
+        self.metadata: Dict[str, Any] = {}
+        self.misses = 0
+        self._queues: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._positions: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+        if mode == REPLAY:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_key(kind: str, request: Dict[str, Any]) -> str:
+        """Stable hash identifying a request."""
+        canonical = json.dumps([kind, request], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _open(self, mode: str):
+        if self.path.suffix == '.gz':
+            return gzip.open(self.path, mode + 't', encoding='utf-8')
+        return open(self.path, mode, encoding='utf-8')
+
+    def _load(self) -> None:
+        with self._open('r') as f:
+            data = json.load(f)
+        self.interactions = data.get('interactions', [])
+        self.metadata = data.get('metadata', {})
+        for interaction in self.interactions:
+            self._queues[interaction['key']].append(interaction)
+        logger.info(f"Loaded {len(self.interactions)} interactions from cassette {self.path}")
+
+    def record(
+        self,
+        kind: str,
+        request: Dict[str, Any],
+        response: Any,
+        latency: float
+    ) -> None:
+        """
+        Capture one interaction.
+
+        Args:
+            kind: Interaction type ("tavily", "brave", "page", "llm")
+            request: JSON-serializable request description (no secrets)
+            response: JSON-serializable response payload
+            latency: Seconds the live call took
+        """
+        with self._lock:
+            self.interactions.append({
+                'kind': kind,
+                'key': self.request_key(kind, request),
+                'request': request,
+                'response': response,
+                'latency': round(latency, 4)
+            })
+
+    def play(self, kind: str, request: Dict[str, Any]) -> Any:
+        """
+        Return the recorded response for a request.
+
+        Args:
+            kind: Interaction type
+            request: Request description, as passed to record()
+
+        Returns:
+            Recorded response payload
+        """
+        key = self.request_key(kind, request)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                self.misses += 1
+                raise CassetteMiss(f"No recorded {kind} interaction for {request}")
+            # Serve repeats in recorded order, then keep returning the last one
+            position = self._positions[key]
+            interaction = queue[min(position, len(queue) - 1)]
+            self._positions[key] = position + 1
+
+        if self.replay_latency:
+            time.sleep(interaction['latency'] * self.latency_scale)
+        return interaction['response']
+
+    def save(self) -> None:
+        """Write recorded interactions to the cassette file."""
+        if not self.recording:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._open('w') as f:
+            json.dump(
+                {'version': 1, 'metadata': self.metadata, 'interactions': self.interactions},
+                f,
+                ensure_ascii=False
+            )
+        logger.info(f"Saved {len(self.interactions)} interactions to cassette {self.path}")
+
+
+# Cassette used by the search clients, page fetcher and LLM factory
+_ACTIVE_CASSETTE: Optional[Cassette] = None
+
+
+def activate_cassette(cassette: Optional[Cassette]) -> None:
+    """Install (or clear, with None) the process-wide cassette."""
+    global _ACTIVE_CASSETTE
+    _ACTIVE_CASSETTE = cassette
+
+
+def get_active_cassette() -> Optional[Cassette]:
+    """Return the process-wide cassette, if any."""
+    return _ACTIVE_CASSETTE
@@ -3,14 +3,22 @@ Configuration loading and validation.
 """
 
 import logging
-from typing import List
+from datetime import date
+from typing import Any, Dict, List
 import yaml
 
-from .models import Topic, SearchConfig
+from .models import (
+    Topic, SearchConfig, ScheduleConfig, HedgeConfig, FetchConfig, DomainExclusionConfig,
+    HistoryConfig, ServiceConfig, ClassifierConfig, SelectionConfig,
+    PipelineConfig, CompressionConfig
+)
 
 
 logger = logging.getLogger(__name__)
 
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+FREQUENCIES = ('hourly', 'daily', 'weekly', 'monthly')
+
 
 def load_config(config_path: str = "config.yaml") -> SearchConfig:
     """
@@ -27,6 +35,32 @@ def load_config(config_path: str = "config.yaml") -> SearchConfig:
     with open(config_path, 'r') as f:
         config_data = yaml.safe_load(f)
     
+    return parse_config(config_data)
+
+
+def _validate_schedule(schedule: ScheduleConfig) -> None:
+    """Reject schedule values the daemon could only guess at."""
+    if schedule.frequency not in FREQUENCIES:
+        raise ValueError(f"schedule.frequency must be one of {', '.join(FREQUENCIES)}, got {schedule.frequency!r}")
+    hour, _, minute = schedule.time.partition(':')
+    if not (hour.isdigit() and minute.isdigit() and int(hour) < 24 and int(minute) < 60):
+        raise ValueError(f"schedule.time must be HH:MM, got {schedule.time!r}")
+    if schedule.frequency == 'weekly' and schedule.day not in WEEKDAYS:
+        raise ValueError(f"schedule.day must be a weekday name for weekly runs, got {schedule.day!r}")
+    if schedule.frequency == 'monthly' and not (schedule.day.isdigit() and 1 <= int(schedule.day) <= 31):
+        raise ValueError(f"schedule.day must be a day of the month (1-31) for monthly runs, got {schedule.day!r}")
+
+
+def parse_config(config_data: Dict[str, Any]) -> SearchConfig:
+    """
+    Build a SearchConfig from configuration data in the config.yaml layout.
+    
+    Args:
+        config_data: Dictionary as loaded from a YAML configuration file
+        
+    Returns:
+        SearchConfig object with validated configuration
+    """
     # Parse topics - support both old 'topics' and new 'topic_clusters' format
     topics = []
     
@@ -36,7 +70,8 @@ def load_config(config_path: str = "config.yaml") -> SearchConfig:
             topics.append(Topic(
                 name=cluster.get('cluster_name', cluster.get('name', 'Unnamed')),
                 keywords=cluster.get('keywords', []),
-                search_variations=cluster.get('search_queries', cluster.get('search_variations', []))
+                search_variations=cluster.get('search_queries', cluster.get('search_variations', [])),
+                priority=int(cluster.get('priority', 1))
             ))
     elif 'topics' in config_data:
         # Old format (backward compatibility)
@@ -44,7 +79,8 @@ def load_config(config_path: str = "config.yaml") -> SearchConfig:
             topics.append(Topic(
                 name=t['name'],
                 keywords=t.get('keywords', []),
-                search_variations=t.get('search_variations', [])
+                search_variations=t.get('search_variations', []),
+                priority=int(t.get('priority', 1))
             ))
     else:
         raise ValueError("No 'topics' or 'topic_clusters' found in config.yaml")
@@ -63,6 +99,18 @@ def load_config(config_path: str = "config.yaml") -> SearchConfig:
         include_domains = tavily_config.get('include_domains', [])
         exclude_domains = tavily_config.get('exclude_domains', [])
     
+    # Domains excluded automatically from cross-run statistics
+    learned_config = (domains_config or {}).get('learned_exclusion', {}) or {}
+    learned_exclusion = DomainExclusionConfig(
+        enabled=learned_config.get('enabled', False),
+        min_samples=int(learned_config.get('min_samples', 10)),
+        max_pass_rate=float(learned_config.get('max_pass_rate', 0.1)),
+        decay=float(learned_config.get('decay', 0.9)),
+        stats_file=learned_config.get('stats_file')
+    )
+    if not 0.0 < learned_exclusion.decay <= 1.0:
+        raise ValueError("domains.learned_exclusion.decay must be in (0, 1]")
+    
     filtering = config_data.get('filtering', {})
     output_config = config_data.get('output', {})
     ai_config = config_data.get('ai', {})
@@ -74,21 +122,153 @@ def load_config(config_path: str = "config.yaml") -> SearchConfig:
         output_dir = 'outputs'
     
     # Handle filtering configuration
+    date_range = filtering.get('date_range', {}) or {}
     if 'date_range' in filtering:
-        min_year = int(filtering['date_range'].get('min_date', '2024-01-01')[:4])
+        # Unquoted YAML dates load as date objects
+        min_date = str(date_range.get('min_date', '2024-01-01'))[:10]
+        try:
+            date.fromisoformat(min_date)
+        except ValueError:
+            raise ValueError(f"filtering.date_range.min_date must be YYYY-MM-DD, got {min_date!r}")
+        min_year = int(min_date[:4])
     else:
         min_year = filtering.get('min_year', 2024)
+        min_date = f"{min_year}-01-01"
     
+    output_limits = filtering.get('output_limits', {}) or {}
     if 'output_limits' in filtering:
-        top_n = filtering['output_limits'].get('top_n_per_cluster', 10)
+        top_n = output_limits.get('top_n_per_cluster', 10)
     else:
         top_n = filtering.get('top_n_per_topic', 15)
     
+    # Cross-topic caps and diversity penalties for the final selection
+    diversity = filtering.get('diversity', {}) or {}
+    selection_defaults = SelectionConfig()
+    total_max_results = output_limits.get('total_max_results')
+    selection = SelectionConfig(
+        total_max_results=int(total_max_results) if total_max_results is not None else None,
+        min_unique_sources=int(output_limits.get('min_unique_sources', 0)),
+        domain_penalty=float(diversity.get('domain_penalty', selection_defaults.domain_penalty)),
+        similarity_penalty=float(diversity.get('similarity_penalty', selection_defaults.similarity_penalty))
+    )
+    
+    # Handle scheduling configuration (daemon mode)
+    schedule_config = config_data.get('schedule', {}) or {}
+    frequency = str(schedule_config.get('frequency', 'weekly')).lower()
+    schedule = ScheduleConfig(
+        frequency=frequency,
+        day=str(schedule_config.get('day', '1' if frequency == 'monthly' else 'monday')).lower(),
+        time=str(schedule_config.get('time', '09:00')),
+        archive_previous=schedule_config.get('archive_previous', False),
+        retention_days=schedule_config.get('retention_days', 30)
+    )
+    _validate_schedule(schedule)
+    
+    execution_config = config_data.get('execution', {}) or {}
+    
+    # Handle search provider configuration
+    brave_config = config_data.get('brave', {}) or {}
+    hedging_config = config_data.get('hedging', {}) or {}
+    hedging = HedgeConfig(
+        enabled=hedging_config.get('enabled', False),
+        secondary_provider=hedging_config.get('secondary_provider', 'brave'),
+        latency_percentile=float(hedging_config.get('latency_percentile', 0.9)),
+        min_samples=int(hedging_config.get('min_samples', 5)),
+        initial_delay_seconds=float(hedging_config.get('initial_delay_seconds', 4.0))
+    )
+    
+    # Handle full-page fetch configuration
+    fetching_config = config_data.get('fetching', {}) or {}
+    fetch_defaults = FetchConfig()
+    fetching = FetchConfig(
+        enabled=fetching_config.get('enabled', False),
+        max_workers=int(fetching_config.get('max_workers', fetch_defaults.max_workers)),
+        per_host_limit=int(fetching_config.get('per_host_limit', fetch_defaults.per_host_limit)),
+        max_bytes=int(fetching_config.get('max_bytes', fetch_defaults.max_bytes)),
+        max_words=int(fetching_config.get('max_words', fetch_defaults.max_words)),
+        timeout_seconds=float(fetching_config.get('timeout_seconds', fetch_defaults.timeout_seconds)),
+        cache_dir=fetching_config.get('cache_dir', fetch_defaults.cache_dir)
+    )
+    # Handle content fingerprint history
+    history_config = config_data.get('history', {}) or {}
+    history_defaults = HistoryConfig()
+    history = HistoryConfig(
+        enabled=history_config.get('enabled', False),
+        path=history_config.get('path'),
+        near_duplicate_distance=int(history_config.get(
+            'near_duplicate_distance', history_defaults.near_duplicate_distance
+        )),
+        change_distance=int(history_config.get('change_distance', history_defaults.change_distance))
+    )
+    # Handle on-demand HTTP service configuration
+    service_config = config_data.get('service', {}) or {}
+    service_defaults = ServiceConfig()
+    service = ServiceConfig(
+        host=service_config.get('host', service_defaults.host),
+        port=int(service_config.get('port', service_defaults.port)),
+        max_concurrency=int(service_config.get('max_concurrency', service_defaults.max_concurrency)),
+        queue_timeout_seconds=float(service_config.get(
+            'queue_timeout_seconds', service_defaults.queue_timeout_seconds
+        )),
+        cache_size=int(service_config.get('cache_size', service_defaults.cache_size)),
+        cache_ttl_seconds=float(service_config.get('cache_ttl_seconds', service_defaults.cache_ttl_seconds))
+    )
+    # Handle the local relevance classifier
+    classifier_config = ai_config.get('classifier', {}) or {}
+    classifier_defaults = ClassifierConfig()
+    classifier = ClassifierConfig(
+        enabled=classifier_config.get('enabled', False),
+        model_path=classifier_config.get('model_path'),
+        lower=float(classifier_config.get('lower', classifier_defaults.lower)),
+        upper=float(classifier_config.get('upper', classifier_defaults.upper)),
+        audit_rate=float(classifier_config.get('audit_rate', classifier_defaults.audit_rate)),
+        record_verdicts=classifier_config.get('record_verdicts', classifier_defaults.record_verdicts),
+        min_examples=int(classifier_config.get('min_examples', classifier_defaults.min_examples))
+    )
+    if not 0.0 <= classifier.lower <= classifier.upper <= 1.0:
+        raise ValueError("ai.classifier needs 0 <= lower <= upper <= 1")
+    # Handle pre-LLM compression of result text
+    compression_config = ai_config.get('compression', {}) or {}
+    compression_defaults = CompressionConfig()
+    compression = CompressionConfig(
+        enabled=compression_config.get('enabled', False),
+        snippet_tokens=int(compression_config.get('snippet_tokens', compression_defaults.snippet_tokens)),
+        content_tokens=int(compression_config.get('content_tokens', compression_defaults.content_tokens)),
+        min_support=int(compression_config.get('min_support', compression_defaults.min_support))
+    )
+    if compression.snippet_tokens < 1 or compression.content_tokens < 1 or compression.min_support < 2:
+        raise ValueError("ai.compression needs positive token budgets and min_support of at least 2")
+    min_word_count = filtering.get('content_requirements', {}).get('min_word_count', 0)
+    
+    # Handle the filter and rank stage graph
+    pipeline_config = config_data.get('pipeline', {}) or {}
+    pipeline_defaults = PipelineConfig()
+    stages = pipeline_config.get('stages')
+    if stages is not None and (not isinstance(stages, list) or not all(isinstance(s, str) for s in stages)):
+        raise ValueError("pipeline.stages must be a list of stage names")
+    pipeline = PipelineConfig(
+        stages=stages,
+        max_workers=int(pipeline_config.get('max_workers', pipeline_defaults.max_workers)),
+        memoize=pipeline_config.get('memoize', pipeline_defaults.memoize),
+        cache_dir=pipeline_config.get('cache_dir', pipeline_defaults.cache_dir),
+        cache_max_age_days=float(pipeline_config.get('cache_max_age_days', pipeline_defaults.cache_max_age_days))
+    )
+    if pipeline.cache_max_age_days <= 0:
+        raise ValueError("pipeline.cache_max_age_days must be positive")
+    
+    # Summaries are requested under output.linkedin_prep
+    linkedin_prep = output_config.get('linkedin_prep', {}) if isinstance(output_config, dict) else {}
+    output_formats = output_config.get('formats', {}) if isinstance(output_config, dict) else {}
+    delta_config = (output_formats or {}).get('delta', {}) or {}
+    
     return SearchConfig(
         topics=topics,
         search_depth=tavily_config.get('search_depth', 'basic'),
         max_results_per_query=tavily_config.get('max_results', 10),
         min_year=min_year,
+        min_date=min_date,
+        date_pushdown=date_range.get('push_down', True),
+        keep_undated=date_range.get('keep_undated', True),
         top_n_results=top_n,
         output_dir=output_dir,
         include_domains=include_domains,
@@ -96,5 +276,32 @@ def load_config(config_path: str = "config.yaml") -> SearchConfig:
         required_keywords=filtering.get('required_keywords', filtering.get('content_requirements', {}).get('must_contain_one_of', [])),
         ai_model=ai_config.get('primary_model', 'gpt-4o-mini'),
         ai_temperature=ai_config.get('temperature', 0.3),
-        use_ai_filtering=ai_config.get('use_ai_filtering', True)
+        use_ai_filtering=ai_config.get('use_ai_filtering', True),
+        schedule=schedule,
+        workers=int(execution_config.get('workers', 1)),
+        search_provider=config_data.get('search_provider', 'tavily'),
+        tavily_api_url=tavily_config.get('api_url'),
+        brave_api_url=brave_config.get('api_url'),
+        brave_count=brave_config.get('count'),
+        brave_freshness=brave_config.get('freshness'),
+        hedging=hedging,
+        fetching=fetching,
+        min_word_count=int(min_word_count or 0),
+        generate_summaries=linkedin_prep.get('generate_summaries', False),
+        summary_batch_size=int(ai_config.get('summary_batch_size', 5)),
+        summary_cache_dir=ai_config.get('summary_cache_dir', '.cache/summaries'),
+        ai_structured_output=ai_config.get('structured_output', True),
+        ai_parse_retries=int(ai_config.get('parse_retries', 1)),
+        learned_exclusion=learned_exclusion,
+        authority_domains=(domains_config or {}).get('authority_boost', []),
+        time_budget_seconds=execution_config.get('time_budget_seconds'),
+        history=history,
+        service=service,
+        classifier=classifier,
+        selection=selection,
+        delta_report=delta_config.get('enabled', False),
+        relevance_threshold=float(ai_config.get('relevance_threshold', 0.6)),
+        store_candidates=output_config.get('store_candidates', True) if isinstance(output_config, dict) else True,
+        pipeline=pipeline,
+        compression=compression
     )
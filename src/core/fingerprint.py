@@ -0,0 +1,77 @@
+"""
+SimHash content fingerprints for near-duplicate and change detection.
+"""
+
+import hashlib
+import re
+from typing import List
+
+from .models import Result
+
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def _shingles(text: str) -> List[str]:
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) < SHINGLE_SIZE:
+        return [' '.join(tokens)] if tokens else []
+    return [' '.join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)]
+
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of a text over word 3-gram shingles.
+
+    Similar texts get fingerprints that differ in few bits, so the Hamming
+    distance between fingerprints approximates how much the text changed.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        Unsigned 64-bit fingerprint
+    """
+    shingles = _shingles(text)
+    # One fixed-width bit string per shingle hash, concatenated: every
+    # FINGERPRINT_BITS-th character is the same bit, so each bit's vote is
+    # counted by a single slice instead of a Python loop per shingle
+    bits = ''.join(
+        format(int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big'), '064b')
+        for shingle in shingles
+    )
+
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        # A bit is set when more shingles have it set than not
+        if 2 * bits[FINGERPRINT_BITS - 1 - bit::FINGERPRINT_BITS].count('1') > len(shingles):
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return bin(a ^ b).count('1')
+
+
+def fingerprint_basis(result: Result) -> str:
+    """Which text a result's fingerprint is computed from: 'content' or 'snippet'."""
+    return 'content' if result.content else 'snippet'
+
+
+def fingerprint_result(result: Result) -> int:
+    """
+    Fingerprint a result's fetched page text, or its title and snippet.
+
+    Args:
+        result: Result to fingerprint
+
+    Returns:
+        Unsigned 64-bit fingerprint
+    """
+    if result.content:
+        return simhash(result.content)
+    return simhash(f"{result.title} {result.snippet}")
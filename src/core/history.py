@@ -0,0 +1,254 @@
+"""
+Cross-run content history stored in SQLite.
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .fingerprint import FINGERPRINT_BITS, hamming_distance
+
+
+logger = logging.getLogger(__name__)
+
+# Fingerprints are indexed in BANDS equal slices. Two fingerprints within
+# BANDS - 1 bits of each other share at least one slice exactly, so a
+# near-duplicate lookup only scans the few rows matching one of its slices.
+BANDS = 4
+BAND_BITS = FINGERPRINT_BITS // BANDS
+MAX_NEAR_DISTANCE = BANDS - 1
+
+# (url, fingerprint, basis, relevance_score)
+HistoryRow = Tuple[str, int, str, float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    fingerprint INTEGER NOT NULL,
+    basis TEXT NOT NULL,
+    relevance_score REAL,
+    first_seen TEXT,
+    last_seen TEXT
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    value INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    PRIMARY KEY (band, value, url)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS bands_url ON bands (url);
+CREATE TABLE IF NOT EXISTS run_results (
+    run_id TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    url TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    title TEXT,
+    relevance_score REAL,
+    fingerprint INTEGER,
+    PRIMARY KEY (run_id, topic, url)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS run_results_url ON run_results (topic, url, run_id);
+"""
+
+# (topic, url, rank, title, relevance_score, fingerprint)
+RunResultRow = Tuple[str, str, int, str, float, int]
+
+
+def _to_signed(fingerprint: int) -> int:
+    # SQLite integers are signed 64-bit
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def _bands(fingerprint: int) -> List[int]:
+    mask = (1 << BAND_BITS) - 1
+    return [fingerprint >> (band * BAND_BITS) & mask for band in range(BANDS)]
+
+
+class ContentHistory:
+    """
+    Fingerprints of every URL the pipeline has evaluated, across runs.
+
+    Rows are looked up by URL (primary key) to detect changed pages and by
+    fingerprint band to find the same content under a different URL.
+    Writes are staged in memory and committed by flush(), so worker
+    processes can hand their staged rows back to the parent.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: SQLite database file, or ":memory:"
+        """
+        self.path = path
+        self.pending: List[HistoryRow] = []
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Workers reopen the database file; in-memory histories travel as rows
+        rows = self.export_rows() if self.path == ":memory:" else None
+        return {'path': self.path, 'pending': self.pending, 'rows': rows}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state['path'])
+        self.pending = state['pending']
+        if state['rows']:
+            self.import_rows(state['rows'])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def lookup(self, url: str) -> Optional[Tuple[int, str, float]]:
+        """
+        Return the stored (fingerprint, basis, relevance_score) of a URL, if any.
+
+        Args:
+            url: Result URL
+
+        Returns:
+            Tuple of fingerprint, basis and score, or None for an unseen URL
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, basis, relevance_score FROM urls WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return _to_unsigned(row[0]), row[1], row[2]
+
+    def find_near(self, fingerprint: int, basis: str, max_distance: int) -> Optional[str]:
+        """
+        Find a stored URL whose content is within max_distance bits.
+
+        Args:
+            fingerprint: Fingerprint to match
+            basis: Only fingerprints computed from the same basis are compared
+            max_distance: Maximum Hamming distance (capped at MAX_NEAR_DISTANCE)
+
+        Returns:
+            URL of a near-duplicate, or None
+        """
+        max_distance = min(max_distance, MAX_NEAR_DISTANCE)
+        with self._lock:
+            for band, value in enumerate(_bands(fingerprint)):
+                rows = self._conn.execute(
+                    "SELECT u.url, u.fingerprint FROM bands b JOIN urls u ON u.url = b.url "
+                    "WHERE b.band = ? AND b.value = ? AND u.basis = ?",
+                    (band, value, basis)
+                ).fetchall()
+                for url, stored in rows:
+                    if hamming_distance(fingerprint, _to_unsigned(stored)) <= max_distance:
+                        return url
+        return None
+
+    def stage(self, url: str, fingerprint: int, basis: str, relevance_score: float) -> None:
+        """Queue a row to be written by flush()."""
+        self.pending.append((url, fingerprint, basis, relevance_score))
+
+    def take_pending(self) -> List[HistoryRow]:
+        """Remove and return the staged rows."""
+        rows, self.pending = self.pending, []
+        return rows
+
+    def flush(self, seen_at: Optional[str] = None) -> int:
+        """
+        Write staged rows to the database.
+
+        Args:
+            seen_at: Timestamp recorded as last_seen (default: now)
+
+        Returns:
+            Number of rows written
+        """
+        rows = self.take_pending()
+        if rows:
+            self._write(rows, seen_at or datetime.now().isoformat(timespec='seconds'))
+        return len(rows)
+
+    def _write(self, rows: Iterable[HistoryRow], seen_at: str) -> None:
+        with self._lock, self._conn:
+            for url, fingerprint, basis, score in rows:
+                self._conn.execute(
+                    "INSERT INTO urls (url, fingerprint, basis, relevance_score, first_seen, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET fingerprint = excluded.fingerprint, "
+                    "basis = excluded.basis, relevance_score = excluded.relevance_score, "
+                    "last_seen = excluded.last_seen",
+                    (url, _to_signed(fingerprint), basis, score, seen_at, seen_at)
+                )
+                self._conn.execute("DELETE FROM bands WHERE url = ?", (url,))
+                self._conn.executemany(
+                    "INSERT INTO bands (band, value, url) VALUES (?, ?, ?)",
+                    [(band, value, url) for band, value in enumerate(_bands(fingerprint))]
+                )
+
+    def export_rows(self) -> List[HistoryRow]:
+        """All stored rows, e.g. to snapshot the history into a cassette."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, fingerprint, basis, relevance_score FROM urls ORDER BY url"
+            ).fetchall()
+        return [(url, _to_unsigned(fp), basis, score) for url, fp, basis, score in rows]
+
+    def import_rows(self, rows: Iterable[HistoryRow], seen_at: str = "") -> None:
+        """Write rows directly, bypassing the staging queue."""
+        self._write((tuple(row) for row in rows), seen_at)
+
+    def record_run(self, run_id: str, rows: Iterable[RunResultRow]) -> None:
+        """
+        Store the ranked results a run reported, replacing any earlier copy.
+
+        Args:
+            run_id: Run identifier (YYYYMMDD_HHMMSS)
+            rows: (topic, url, rank, title, relevance_score, fingerprint) rows
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM run_results WHERE run_id = ?", (run_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO run_results "
+                "(run_id, topic, url, rank, title, relevance_score, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, topic, url, rank, title, score, _to_signed(fingerprint))
+                    for topic, url, rank, title, score, fingerprint in rows
+                ]
+            )
+
+    def latest_run(self, before: Optional[str] = None) -> Optional[str]:
+        """Most recent recorded run id, optionally strictly before a given one."""
+        query = "SELECT MAX(run_id) FROM run_results"
+        params: Tuple[str, ...] = ()
+        if before is not None:
+            query += " WHERE run_id < ?"
+            params = (before,)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def run_results(self, run_id: str, topic: str) -> List[RunResultRow]:
+        """A recorded run's rows for one topic, best rank first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT topic, url, rank, title, relevance_score, fingerprint FROM run_results "
+                "WHERE run_id = ? AND topic = ? ORDER BY rank",
+                (run_id, topic)
+            ).fetchall()
+        return [row[:5] + (_to_unsigned(row[5]),) for row in rows]
+
+    def last_reported(self, topic: str, url: str) -> Optional[str]:
+        """Id of the latest recorded run that reported a URL under a topic."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT MAX(run_id) FROM run_results WHERE topic = ? AND url = ?", (topic, url)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
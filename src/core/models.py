@@ -2,8 +2,8 @@
 Core data models for the research automation tool.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -16,6 +16,28 @@ class Result:
     domain: Optional[str] = None
     relevance_score: float = 0.0
     ai_summary: Optional[str] = None
+    word_count: Optional[int] = None
+    status: Optional[str] = None  # "updated" when a seen page changed materially
+    content: Optional[str] = field(default=None, repr=False)
+    fingerprint: Optional[int] = field(default=None, repr=False)
+    compressed: Optional[str] = field(default=None, repr=False)  # token-bounded LLM input
+    score_source: Optional[str] = field(default=None, repr=False)  # "llm", "classifier", "failed" or "heuristic"
+
+
+def result_to_dict(result: Result) -> Dict[str, Any]:
+    """Serialize a Result for output files, omitting fetched page text, fingerprint, LLM input and score source."""
+    data = asdict(result)
+    data.pop('content', None)
+    data.pop('fingerprint', None)
+    data.pop('compressed', None)
+    data.pop('score_source', None)
+    return data
+
+
+def result_from_dict(data: Dict[str, Any]) -> Result:
+    """Rebuild a Result from stored output data, ignoring unknown keys."""
+    known = {f.name for f in fields(Result)}
+    return Result(**{k: v for k, v in data.items() if k in known})
 
 
 @dataclass
@@ -24,6 +46,109 @@ class Topic:
     name: str
     keywords: List[str]
     search_variations: List[str]
+    priority: int = 1
+
+
+@dataclass
+class ScheduleConfig:
+    """Cadence and retention settings for daemon mode."""
+    frequency: str = "weekly"
+    day: str = "monday"
+    time: str = "09:00"
+    archive_previous: bool = False
+    retention_days: int = 30
+
+
+@dataclass
+class HedgeConfig:
+    """Settings for hedged requests across two search providers."""
+    enabled: bool = False
+    secondary_provider: str = "brave"
+    latency_percentile: float = 0.9
+    min_samples: int = 5
+    initial_delay_seconds: float = 4.0
+
+
+@dataclass
+class FetchConfig:
+    """Settings for the optional full-page fetch stage."""
+    enabled: bool = False
+    max_workers: int = 8
+    per_host_limit: int = 2
+    max_bytes: int = 2_000_000
+    max_words: int = 20_000
+    timeout_seconds: float = 15.0
+    cache_dir: str = ".cache/pages"
+
+
+@dataclass
+class DomainExclusionConfig:
+    """Settings for excluding domains whose results rarely pass AI filtering."""
+    enabled: bool = False
+    min_samples: int = 10
+    max_pass_rate: float = 0.1
+    decay: float = 0.9  # share of older counts kept per run, so excluded domains get re-tested
+    stats_file: Optional[str] = None  # defaults to <output_dir>/domain_stats.json
+
+
+@dataclass
+class HistoryConfig:
+    """Settings for the cross-run content fingerprint history."""
+    enabled: bool = False
+    path: Optional[str] = None  # defaults to <output_dir>/history.sqlite
+    near_duplicate_distance: int = 3
+    change_distance: int = 10
+
+
+@dataclass
+class ServiceConfig:
+    """Settings for the on-demand HTTP research service."""
+    host: str = "127.0.0.1"
+    port: int = 8765
+    max_concurrency: int = 2
+    queue_timeout_seconds: float = 30.0
+    cache_size: int = 64
+    cache_ttl_seconds: float = 900.0
+
+
+@dataclass
+class SelectionConfig:
+    """Settings for the diversity-aware selection of a run's final results."""
+    total_max_results: Optional[int] = None
+    min_unique_sources: int = 0
+    domain_penalty: float = 0.1
+    similarity_penalty: float = 0.2
+
+
+@dataclass
+class ClassifierConfig:
+    """Settings for the local relevance classifier that pre-screens AI verdicts."""
+    enabled: bool = False
+    model_path: Optional[str] = None  # defaults to <output_dir>/relevance_classifier.json
+    lower: float = 0.2
+    upper: float = 0.8
+    audit_rate: float = 0.05
+    record_verdicts: bool = True
+    min_examples: int = 200
+
+
+@dataclass
+class CompressionConfig:
+    """Settings for compressing result text before it is sent to the LLM."""
+    enabled: bool = False
+    snippet_tokens: int = 75
+    content_tokens: int = 250
+    min_support: int = 2  # pages of a domain a sentence must repeat on to be boilerplate
+
+
+@dataclass
+class PipelineConfig:
+    """Stage list and execution settings for the filter and rank pipeline."""
+    stages: Optional[List[str]] = None  # defaults to the built-in stage order
+    max_workers: int = 4
+    memoize: bool = False
+    cache_dir: str = ".cache/stages"
+    cache_max_age_days: float = 14  # memo entries unused for longer are pruned
 
 
 @dataclass
@@ -41,3 +166,33 @@ class SearchConfig:
     ai_model: str
     ai_temperature: float
     use_ai_filtering: bool
+    schedule: ScheduleConfig = field(default_factory=ScheduleConfig)
+    workers: int = 1
+    search_provider: str = "tavily"
+    tavily_api_url: Optional[str] = None
+    brave_api_url: Optional[str] = None
+    brave_count: Optional[int] = None
+    brave_freshness: Optional[str] = None
+    hedging: HedgeConfig = field(default_factory=HedgeConfig)
+    fetching: FetchConfig = field(default_factory=FetchConfig)
+    min_word_count: int = 0
+    generate_summaries: bool = False
+    summary_batch_size: int = 5
+    summary_cache_dir: str = ".cache/summaries"
+    ai_structured_output: bool = True
+    ai_parse_retries: int = 1
+    learned_exclusion: DomainExclusionConfig = field(default_factory=DomainExclusionConfig)
+    authority_domains: List[str] = field(default_factory=list)
+    time_budget_seconds: Optional[float] = None
+    history: HistoryConfig = field(default_factory=HistoryConfig)
+    service: ServiceConfig = field(default_factory=ServiceConfig)
+    classifier: ClassifierConfig = field(default_factory=ClassifierConfig)
+    selection: SelectionConfig = field(default_factory=SelectionConfig)
+    delta_report: bool = False
+    relevance_threshold: float = 0.6
+    store_candidates: bool = True
+    min_date: Optional[str] = None  # YYYY-MM-DD; defaults to January 1 of min_year
+    date_pushdown: bool = True
+    keep_undated: bool = True
+    pipeline: PipelineConfig = field(default_factory=PipelineConfig)
+    compression: CompressionConfig = field(default_factory=CompressionConfig)
@@ -3,11 +3,20 @@
 from .date_filter import filter_by_date
 from .deduplicator import deduplicate_results
 from .keyword_filter import filter_by_keywords
+from .content_filter import filter_by_word_count
 from .ranking import rank_and_filter_results
+from .domain_stats import DomainStats
+from .selection import select_results
+from .stage_graph import StageRun, register_stage
 
 __all__ = [
     'filter_by_date',
     'deduplicate_results',
     'filter_by_keywords',
-    'rank_and_filter_results'
+    'filter_by_word_count',
+    'rank_and_filter_results',
+    'DomainStats',
+    'select_results',
+    'StageRun',
+    'register_stage'
 ]
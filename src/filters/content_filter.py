@@ -0,0 +1,37 @@
+"""
+Content-length filtering for fetched results.
+"""
+
+import logging
+from typing import List
+
+from ..core.models import Result
+
+
+logger = logging.getLogger(__name__)
+
+
+def filter_by_word_count(results: List[Result], min_word_count: int) -> List[Result]:
+    """
+    Filter out fetched pages whose main text is shorter than the minimum.
+    
+    Results without a word count (not fetched, or fetch failed) are kept.
+    
+    Args:
+        results: List of Result objects
+        min_word_count: Minimum number of words in the extracted main text
+        
+    Returns:
+        Filtered list of results
+    """
+    if min_word_count <= 0:
+        return results
+    
+    filtered = []
+    for result in results:
+        if result.word_count is not None and result.word_count < min_word_count:
+            logger.debug(f"Filtered by word count ({result.word_count}): {result.title}")
+        else:
+            filtered.append(result)
+    
+    return filtered
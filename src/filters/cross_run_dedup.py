@@ -1,14 +1,16 @@
 """
 Cross-run deduplication utility.
-Checks previous JSON outputs to avoid re-processing duplicate URLs.
+Checks previous runs (live and archived) to avoid re-processing duplicate URLs,
+or, with the content history, unchanged and duplicated content.
 """
 
-import json
 import logging
-from pathlib import Path
 from typing import List, Set
 
+from ..core.fingerprint import fingerprint_basis, fingerprint_result, hamming_distance
+from ..core.history import ContentHistory
 from ..core.models import Result
+from ..output.archive import iter_result_rows
 
 
 logger = logging.getLogger(__name__)
@@ -16,27 +18,15 @@ logger = logging.getLogger(__name__)
 
 def load_previous_urls(output_dir: str = "outputs") -> Set[str]:
     """
-    Load URLs from all previous JSON outputs.
+    Load URLs from all previous runs, live JSON outputs and the archive.
     
     Returns:
         Set of URLs that have been processed before
     """
-    outputs_path = Path(output_dir)
-    if not outputs_path.exists():
-        return set()
-    
     seen_urls = set()
     
-    for json_file in outputs_path.glob("research_data_*.json"):
-        try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-                for topic_results in data.get('topics', {}).values():
-                    for result in topic_results:
-                        if 'url' in result:
-                            seen_urls.add(result['url'])
-        except Exception as e:
-            logger.warning(f"Could not load {json_file}: {e}")
+    for _, rows in iter_result_rows(output_dir):
+        seen_urls.update(url for url, _, _ in rows)
     
     logger.info(f"Loaded {len(seen_urls)} URLs from previous runs")
     return seen_urls
@@ -63,3 +53,109 @@ def filter_seen_urls(results: List[Result], seen_urls: Set[str]) -> List[Result]
         logger.info(f"Removed {removed} duplicate URLs from previous runs")
     
     return filtered
+
+
+def bootstrap_history(history: ContentHistory, output_dir: str = "outputs") -> int:
+    """
+    Seed an empty content history from previous runs, live and archived.
+    
+    Stored runs only keep snippets, so these rows are fingerprinted from
+    title and snippet.
+    
+    Args:
+        history: ContentHistory to fill
+        output_dir: Output directory
+        
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    for run_id, rows in iter_result_rows(output_dir):
+        history.import_rows(
+            [(url, fingerprint, 'snippet', score) for url, fingerprint, score in rows], seen_at=run_id
+        )
+        count += len(rows)
+    
+    logger.info(f"Bootstrapped content history with {count} results from previous runs")
+    return count
+
+
+def filter_by_history(
+    results: List[Result],
+    history: ContentHistory,
+    near_duplicate_distance: int = 3,
+    change_distance: int = 10
+) -> List[Result]:
+    """
+    Drop unchanged and duplicated content, keeping materially changed pages.
+    
+    Every result gets a content fingerprint. A URL seen before is skipped
+    unless its fetched page text moved by more than change_distance bits,
+    in which case it is kept with status "updated". Snippet fingerprints
+    never mark a page as updated: providers cut snippets around the query,
+    so the same page differs between queries. A new URL is skipped when its
+    content matches a stored fingerprint (or an earlier result in this batch)
+    within near_duplicate_distance bits.
+    
+    Args:
+        results: List of Result objects
+        history: ContentHistory from previous runs
+        near_duplicate_distance: Max bits apart for the same content
+        change_distance: Min bits apart (exclusive) for a material change
+        
+    Returns:
+        Filtered list of results
+    """
+    filtered = []
+    batch_fingerprints: Set[int] = set()
+    unchanged = duplicates = updated = 0
+    
+    for result in results:
+        result.fingerprint = fingerprint_result(result)
+        basis = fingerprint_basis(result)
+        stored = history.lookup(result.url)
+        
+        if stored is not None:
+            stored_fingerprint, stored_basis, stored_score = stored
+            if stored_basis != basis:
+                # Fingerprints of different texts are not comparable: treat the
+                # page as unchanged and store the new basis for the next run
+                history.stage(result.url, result.fingerprint, basis, stored_score)
+                unchanged += 1
+                continue
+            if basis == 'snippet' or hamming_distance(result.fingerprint, stored_fingerprint) <= change_distance:
+                unchanged += 1
+                continue
+            result.status = "updated"
+            updated += 1
+        elif (
+            result.fingerprint in batch_fingerprints
+            or history.find_near(result.fingerprint, basis, near_duplicate_distance)
+        ):
+            duplicates += 1
+            continue
+        
+        batch_fingerprints.add(result.fingerprint)
+        filtered.append(result)
+    
+    if unchanged or duplicates or updated:
+        logger.info(
+            f"Content history: skipped {unchanged} unchanged and {duplicates} duplicated, "
+            f"{updated} updated"
+        )
+    
+    return filtered
+
+
+def stage_history(results: List[Result], history: ContentHistory) -> None:
+    """
+    Queue evaluated results for the content history.
+    
+    Args:
+        results: Results that went through ranking, with their final scores
+        history: ContentHistory receiving the rows at the end of the run
+    """
+    for result in results:
+        if result.fingerprint is None:
+            result.fingerprint = fingerprint_result(result)
+        history.stage(result.url, result.fingerprint, fingerprint_basis(result), result.relevance_score)
@@ -3,39 +3,46 @@ Date-based filtering for search results.
 """
 
 import logging
-from typing import List
+from typing import List, Union
 
 from ..core.models import Result
+from ..search.dates import is_on_or_after, parse_date
 
 
 logger = logging.getLogger(__name__)
 
 
-def filter_by_date(results: List[Result], min_year: int) -> List[Result]:
+def filter_by_date(
+    results: List[Result],
+    min_date: Union[int, str],
+    keep_undated: bool = True
+) -> List[Result]:
     """
-    Filter results by minimum publication year.
+    Filter results by minimum publication date.
+    
+    Dates are compared at the precision they are known: a result dated
+    only by year passes when that year reaches min_date's year.
     
     Args:
         results: List of Result objects
-        min_year: Minimum year to include
+        min_date: Minimum date (YYYY-MM-DD) or year to include
+        keep_undated: Keep results without a recognizable date
         
     Returns:
         Filtered list of results
     """
+    min_date = str(min_date)
     filtered = []
     for r in results:
-        if r.published_date:
-            try:
-                year = int(r.published_date)
-                if year >= min_year:
-                    filtered.append(r)
-                else:
-                    logger.debug(f"Filtered out (old): {r.title}")
-            except ValueError:
-                # Keep if can't parse year
+        published = parse_date(r.published_date)
+        if published is None:
+            if keep_undated:
                 filtered.append(r)
-        else:
-            # Keep if no date available
+            else:
+                logger.debug(f"Filtered out (undated): {r.title}")
+        elif is_on_or_after(published, min_date):
             filtered.append(r)
+        else:
+            logger.debug(f"Filtered out (old): {r.title}")
     
     return filtered
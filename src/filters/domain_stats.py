@@ -0,0 +1,185 @@
+"""
+Per-domain funnel statistics tracked across runs, and learned exclusions.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from ..core.models import Result
+
+
+logger = logging.getLogger(__name__)
+
+# Rough prompt + reply size of one relevance verdict, used for savings estimates
+EST_TOKENS_PER_VERDICT = 450
+
+COUNTERS = ('returned', 'passed_keywords', 'ai_scored', 'ai_passed')
+
+
+def normalize_domain(domain: str) -> str:
+    """Lower-case a host and strip a leading www."""
+    domain = (domain or '').lower()
+    return domain[4:] if domain.startswith('www.') else domain
+
+
+class DomainStats:
+    """
+    Counts how far each domain's results get through the pipeline.
+
+    For every domain it records results returned by search, results that
+    passed the keyword filter, results scored by the AI, results that passed
+    the AI threshold and the sum of AI scores.
+    """
+
+    def __init__(self):
+        self.domains: Dict[str, Dict[str, float]] = {}
+        self.runs = 0
+        self.savings = {'runs': 0, 'llm_calls': 0.0, 'tokens': 0.0, 'result_slots': 0.0}
+        self._seen_this_run: set = set()
+
+    def _entry(self, domain: str) -> Dict[str, float]:
+        if domain not in self.domains:
+            self.domains[domain] = {**{c: 0 for c in COUNTERS}, 'score_sum': 0.0, 'runs': 0}
+        return self.domains[domain]
+
+    def count(self, counter: str, results: Iterable[Result]) -> None:
+        """Increment a funnel counter for each result's domain."""
+        for result in results:
+            domain = normalize_domain(result.domain)
+            if not domain:
+                continue
+            self._entry(domain)[counter] += 1
+            if counter == 'returned':
+                self._seen_this_run.add(domain)
+
+    def record_scores(self, results: Iterable[Result], threshold: float) -> None:
+        """Record LLM verdicts; classifier-local scores and failed parses are not verdicts."""
+        for result in results:
+            domain = normalize_domain(result.domain)
+            if not domain or result.score_source != 'llm':
+                continue
+            entry = self._entry(domain)
+            entry['ai_scored'] += 1
+            entry['score_sum'] += result.relevance_score
+            if result.relevance_score >= threshold:
+                entry['ai_passed'] += 1
+
+    def merge(self, other: "DomainStats") -> None:
+        """Add counts collected elsewhere (e.g. in a worker process)."""
+        for domain, counts in other.domains.items():
+            entry = self._entry(domain)
+            for key in (*COUNTERS, 'score_sum'):
+                entry[key] += counts[key]
+        self._seen_this_run |= other._seen_this_run
+
+    def finish_run(self, decay: float = 1.0) -> None:
+        """
+        Close the current run: bump run counters for every domain that appeared.
+
+        Args:
+            decay: Share of the older counts kept. Pass rates and per-run
+                averages are unchanged, but an excluded domain, which gets
+                no new verdicts, falls below min_samples after a few runs
+                and is searched and scored again.
+        """
+        self.runs += 1
+        if decay < 1.0:
+            for entry in self.domains.values():
+                for key in entry:
+                    entry[key] *= decay
+        for domain in self._seen_this_run:
+            self._entry(domain)['runs'] += 1
+        self._seen_this_run = set()
+
+    def pass_rate(self, domain: str) -> float:
+        """AI pass rate for a domain (0 if never scored)."""
+        entry = self.domains.get(domain)
+        if not entry or not entry['ai_scored']:
+            return 0.0
+        return entry['ai_passed'] / entry['ai_scored']
+
+    def learned_exclusions(self, min_samples: int, max_pass_rate: float) -> List[str]:
+        """
+        Domains with enough AI-scored samples and a pass rate below the limit.
+
+        Args:
+            min_samples: Minimum number of AI-scored results
+            max_pass_rate: Domains passing the AI threshold less often are excluded
+
+        Returns:
+            Sorted list of domains
+        """
+        return sorted(
+            domain for domain, entry in self.domains.items()
+            if entry['ai_scored'] >= min_samples and self.pass_rate(domain) < max_pass_rate
+        )
+
+    def estimate_savings(self, excluded: List[str]) -> Dict[str, float]:
+        """
+        Estimate per-run work avoided by excluding domains before search.
+
+        Uses each domain's historical per-run averages: results returned
+        (search slots reclaimed for other domains) and AI verdicts requested.
+
+        Args:
+            excluded: Domains excluded this run
+
+        Returns:
+            Dictionary with result_slots, llm_calls and tokens
+        """
+        slots = 0.0
+        calls = 0.0
+        for domain in excluded:
+            entry = self.domains.get(domain)
+            if not entry or not entry['runs']:
+                continue
+            slots += entry['returned'] / entry['runs']
+            calls += entry['ai_scored'] / entry['runs']
+        return {
+            'result_slots': round(slots, 1),
+            'llm_calls': round(calls, 1),
+            'tokens': round(calls * EST_TOKENS_PER_VERDICT)
+        }
+
+    def add_savings(self, savings: Dict[str, float]) -> None:
+        """Accumulate one run's estimated savings into the running totals."""
+        self.savings['runs'] += 1
+        for key in ('llm_calls', 'tokens', 'result_slots'):
+            self.savings[key] += savings[key]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'runs': self.runs, 'savings': self.savings, 'domains': self.domains}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DomainStats":
+        stats = cls()
+        stats.runs = data.get('runs', 0)
+        stats.savings.update(data.get('savings', {}))
+        for domain, counts in data.get('domains', {}).items():
+            stats._entry(domain).update(counts)
+        return stats
+
+    @classmethod
+    def load(cls, path: str) -> "DomainStats":
+        """Load statistics from a JSON file, or start empty."""
+        if not Path(path).exists():
+            return cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load domain statistics from {path}: {e}")
+            return cls()
+
+    def save(self, path: str) -> None:
+        """Write statistics to a JSON file atomically."""
+        directory = Path(path).parent
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
@@ -0,0 +1,88 @@
+"""
+Heuristic relevance scoring used when AI ranking is skipped.
+"""
+
+import logging
+from datetime import date
+from typing import List, Optional
+
+from ..core.models import Result
+
+
+logger = logging.getLogger(__name__)
+
+BASE_SCORE = 0.4
+AUTHORITY_BOOST = 0.2  # matches the domains.authority_boost comment in config.yaml
+FRESHNESS_WEIGHT = 0.3
+KEYWORD_WEIGHT = 0.1
+
+
+def heuristic_score(
+    result: Result,
+    authority_domains: List[str],
+    keywords: List[str],
+    min_year: int,
+    current_year: Optional[int] = None
+) -> float:
+    """
+    Score a result from its domain, publication year and keyword hits.
+    
+    Args:
+        result: Result to score
+        authority_domains: Domains that get the authority boost
+        keywords: Topic keywords looked up in the title and snippet
+        min_year: Oldest accepted publication year (freshness 0)
+        current_year: Year treated as freshest (default: this year)
+        
+    Returns:
+        Score between 0.0 and 1.0
+    """
+    score = BASE_SCORE
+    
+    domain = (result.domain or '').lower()
+    if any(domain == d or domain.endswith('.' + d) for d in authority_domains):
+        score += AUTHORITY_BOOST
+    
+    current_year = current_year or date.today().year
+    try:
+        year = int((result.published_date or '')[:4])
+    except ValueError:
+        year = None
+    if year is not None:
+        span = max(current_year - min_year, 1)
+        freshness = 1 - (current_year - year) / span
+        score += FRESHNESS_WEIGHT * min(max(freshness, 0.0), 1.0)
+    
+    if keywords:
+        text = f"{result.title} {result.snippet}".lower()
+        hits = sum(1 for k in keywords if k.lower() in text)
+        score += KEYWORD_WEIGHT * hits / len(keywords)
+    
+    return round(min(score, 1.0), 3)
+
+
+def rank_by_heuristic(
+    results: List[Result],
+    authority_domains: List[str],
+    keywords: List[str],
+    min_year: int
+) -> List[Result]:
+    """
+    Set heuristic relevance scores and sort results by them.
+
+    Results are marked with score source "heuristic", so the final
+    selection can rank them after AI-scored results.
+    
+    Args:
+        results: List of Result objects
+        authority_domains: Domains that get the authority boost
+        keywords: Topic keywords
+        min_year: Oldest accepted publication year
+        
+    Returns:
+        Results sorted by heuristic score (descending)
+    """
+    for result in results:
+        result.relevance_score = heuristic_score(result, authority_domains, keywords, min_year)
+        result.score_source = 'heuristic'
+    return sorted(results, key=lambda r: r.relevance_score, reverse=True)
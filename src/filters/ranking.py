@@ -3,87 +3,139 @@ Ranking and filtering orchestration.
 """
 
 import logging
-from typing import List
-
-from langchain_openai import ChatOpenAI
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from ..core.models import Result, SearchConfig, Topic
-from ..ai.analyzer import analyze_result_with_ai, generate_summary_with_ai
-from .date_filter import filter_by_date
-from .deduplicator import deduplicate_results
-from .keyword_filter import filter_by_keywords
-from .cross_run_dedup import load_previous_urls, filter_seen_urls
+from ..ai.llm_factory import create_llm
+from ..ai.summarizer import summarize_results
+from ..core.cache import DiskCache
+from ..core.cassette import get_active_cassette
+from .stage_graph import StageGraph, StageRun
+from .stages import DEFAULT_STAGES
+
+if TYPE_CHECKING:
+    from ..pipeline.context import RunContext
 
 
 logger = logging.getLogger(__name__)
 
-# Load previous URLs once at module level
-PREVIOUS_URLS = load_previous_urls()
+
+@lru_cache(maxsize=16)
+def build_stage_graph(stages: Tuple[str, ...]) -> StageGraph:
+    """Return the (cached) stage graph for an ordered tuple of stage names."""
+    return StageGraph(stages)
 
 
 def rank_and_filter_results(
     results: List[Result],
     config: SearchConfig,
     topic: Topic,
-    use_ai: bool = True
+    use_ai: bool = True,
+    context: Optional["RunContext"] = None,
+    heuristic: bool = False,
+    limit: bool = True
 ) -> List[Result]:
     """
     Apply all filtering and ranking steps.
     
+    The steps are the stages listed in config.pipeline (see stages.py for
+    the built-in ones), run as a graph: independent stages overlap, and
+    memoizable stages reuse outputs stored for identical inputs.
+    
     Args:
         results: List of raw results
         config: SearchConfig object
         topic: Topic context for AI analysis
         use_ai: Whether to use AI for ranking
+        context: Optional RunContext providing a shared LLM client and
+            seen-URL index; without it both are created for this call.
+            If it carries domain statistics, funnel counts are recorded.
+            With history enabled, its content history replaces the seen-URL
+            filter and receives every evaluated result. With the classifier
+            enabled, only uncertain results are sent to the LLM, and a
+            verdict log on the context receives the LLM verdicts. Stage
+            timings are added to its stage_timings, and every scored
+            candidate to its candidate_log, when set.
+        heuristic: Without AI, rank by authority, freshness and keyword
+            hits instead of by date alone
+        limit: Cut to top_n_results and summarize; pass False to get every
+            scored candidate for a later cross-topic selection
         
     Returns:
         Filtered and ranked list of results
     """
     logger.info(f"Starting with {len(results)} raw results")
+    history = None
+    if context is not None and config.history.enabled:
+        history = context.get_history(config)
     
-    # Step 1: Filter by date
-    results = filter_by_date(results, config.min_year)
-    logger.info(f"After date filter: {len(results)} results")
-    
-    # Step 2: Remove duplicates within this run
-    results = deduplicate_results(results)
+    # Memoized outputs would hide calls from cassette recording and replay
+    memo_cache = None
+    if config.pipeline.memoize and get_active_cassette() is None:
+        if context is not None:
+            memo_cache = context.get_stage_cache(config)
+        else:
+            memo_cache = DiskCache(config.pipeline.cache_dir)
     
-    # Step 3: Remove URLs seen in previous runs
-    results = filter_seen_urls(results, PREVIOUS_URLS)
+    graph = build_stage_graph(tuple(config.pipeline.stages or DEFAULT_STAGES))
+    values = graph.run(
+        {'results': results},
+        StageRun(config, topic, context, use_ai, heuristic, history),
+        max_workers=config.pipeline.max_workers,
+        memo_cache=memo_cache,
+        timings=context.stage_timings if context is not None else None
+    )
+    results = values['results']
     
-    # Step 4: Filter by required keywords
-    results = filter_by_keywords(results, config.required_keywords)
-    logger.info(f"After keyword filter: {len(results)} results")
+    # Keep the scored candidates from before the threshold for offline re-ranks
+    if context is not None and context.candidate_log is not None:
+        if use_ai and config.use_ai_filtering:
+            scoring = 'ai'
+        else:
+            scoring = 'heuristic' if heuristic else 'date'
+        context.candidate_log[topic.name] = (scoring, values.get('candidates', results))
     
-    # Step 5: AI-powered analysis and ranking
-    if use_ai and config.use_ai_filtering and results:
-        logger.info("Analyzing results with AI...")
-        llm = ChatOpenAI(model=config.ai_model, temperature=config.ai_temperature)
-        
-        for result in results:
-            # Analyze relevance
-            analysis = analyze_result_with_ai(result, topic, llm)
-            result.relevance_score = analysis['relevance_score']
-            
-            # DISABLED: Summary generation to save tokens (50% reduction)
-            # result.ai_summary = generate_summary_with_ai(result, llm)
-        
-        # Filter by AI relevance (keep score >= 0.6)
-        results = [r for r in results if r.relevance_score >= 0.6]
-        logger.info(f"After AI filtering: {len(results)} results")
-        
-        # Sort by relevance score (descending)
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
-    else:
-        # Simple sorting by date if available
-        results.sort(
-            key=lambda x: x.published_date if x.published_date else '0000',
-            reverse=True
-        )
+    if not limit:
+        logger.info(f"Scored candidates: {len(results)}")
+        return results
     
-    # Step 6: Limit to top N
+    # Limit to top N
     results = results[:config.top_n_results]
     logger.info(f"Final result count: {len(results)}")
     
+    # Summarize only the results that survived the cut
+    if use_ai:
+        summarize_final_results(results, config, context)
+    
     return results
 
+
+def summarize_final_results(
+    results: List[Result],
+    config: SearchConfig,
+    context: Optional["RunContext"] = None
+) -> None:
+    """
+    Add AI summaries to final results, when summaries are enabled.
+    
+    Args:
+        results: Results that made the final cut
+        config: SearchConfig object
+        context: Optional RunContext providing the LLM client and summary cache
+    """
+    if not (config.use_ai_filtering and config.generate_summaries and results):
+        return
+    if context is not None:
+        llm = context.get_llm(config)
+        cache = context.get_summary_cache(config)
+    else:
+        llm = create_llm(config.ai_model, config.ai_temperature)
+        cache = DiskCache(config.summary_cache_dir)
+    summarize_results(
+        results,
+        llm,
+        config.ai_model,
+        cache=cache,
+        batch_size=config.summary_batch_size
+    )
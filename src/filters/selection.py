@@ -0,0 +1,185 @@
+"""
+Diversity-aware selection of the final results across topics.
+"""
+
+import heapq
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+
+from ..core.fingerprint import FINGERPRINT_BITS, hamming_distance, simhash
+from ..core.models import Result, SearchConfig, SelectionConfig
+
+
+logger = logging.getLogger(__name__)
+
+# Fingerprints are indexed in SIMILARITY_BANDS slices; any two within
+# SIMILARITY_BANDS - 1 bits share a slice, so similar selected results are
+# found by a few bucket probes instead of a scan of the whole selection.
+SIMILARITY_BANDS = 8
+BAND_BITS = FINGERPRINT_BITS // SIMILARITY_BANDS
+SIMILAR_BITS = SIMILARITY_BANDS - 1
+
+
+def _bands(fingerprint: int) -> List[Tuple[int, int]]:
+    mask = (1 << BAND_BITS) - 1
+    return [(band, fingerprint >> (band * BAND_BITS) & mask) for band in range(SIMILARITY_BANDS)]
+
+
+class _Selection:
+    """Chosen results with the per-domain counts and fingerprint buckets the penalty needs."""
+
+    def __init__(self, settings: SelectionConfig):
+        self.settings = settings
+        self.domains: Counter = Counter()
+        self.per_topic: Counter = Counter()
+        self.buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self.chosen: List[Tuple[str, Result]] = []
+
+    def __len__(self) -> int:
+        return len(self.chosen)
+
+    def similarity(self, fingerprint: int) -> float:
+        """Similarity in [0, 1] to the closest selected result within SIMILAR_BITS."""
+        closest = SIMILAR_BITS + 1
+        for key in _bands(fingerprint):
+            for other in self.buckets.get(key, ()):
+                closest = min(closest, hamming_distance(fingerprint, other))
+        return max(0.0, 1.0 - closest / (SIMILAR_BITS + 1))
+
+    def marginal(self, base: float, domain: str, fingerprint: int) -> float:
+        return (
+            base
+            - self.settings.domain_penalty * self.domains[domain]
+            - self.settings.similarity_penalty * self.similarity(fingerprint)
+        )
+
+    def add(self, topic: str, result: Result, fingerprint: int) -> None:
+        self.chosen.append((topic, result))
+        self.domains[result.domain] += 1
+        self.per_topic[topic] += 1
+        for key in _bands(fingerprint):
+            self.buckets[key].append(fingerprint)
+
+
+def _base_scores(results: List[Result]) -> List[float]:
+    # Unscored lists (AI filtering off) fall back to their rank order
+    if any(r.relevance_score for r in results):
+        return [r.relevance_score for r in results]
+    return [1.0 - index / len(results) for index in range(len(results))]
+
+
+def select_results(
+    candidates_by_topic: Dict[str, List[Result]],
+    config: SearchConfig
+) -> Dict[str, List[Result]]:
+    """
+    Pick the final results of a run from the scored candidates of every topic.
+
+    Greedy maximal marginal relevance: each step takes the candidate whose
+    score minus a penalty for its domain's selected count and its content
+    similarity to selected results is highest. Marginal scores only fall as
+    the selection grows, so they are kept in a heap and recomputed lazily
+    when a stale entry reaches the top. Constraints enforced together:
+    at most top_n_results per topic, at most total_max_results overall and,
+    while enough candidates remain, at least min_unique_sources domains.
+    Heuristically ranked results (topics degraded to fit a deadline) are
+    only taken once no AI-scored candidate can fill a slot.
+
+    Args:
+        candidates_by_topic: Scored candidates per topic, best first
+        config: SearchConfig with the per-topic cap and selection settings
+
+    Returns:
+        Dictionary mapping topic names to selected results, in selection
+        order, with the same keys as candidates_by_topic
+    """
+    settings = config.selection
+    per_topic_cap = config.top_n_results
+    total_cap = settings.total_max_results
+    if total_cap is None:
+        total_cap = per_topic_cap * len(candidates_by_topic)
+
+    entries: List[Tuple[str, Result, float, int]] = []
+    for topic, results in candidates_by_topic.items():
+        for result, base in zip(results, _base_scores(results)):
+            fingerprint = result.fingerprint
+            if fingerprint is None:
+                fingerprint = simhash(f"{result.title} {result.snippet}")
+            entries.append((topic, result, base, fingerprint))
+
+    # Heuristic scores of topics degraded to fit a deadline are not on the
+    # LLM relevance scale, so those results only fill slots AI-scored ones leave
+    tiers = [int(result.score_source == 'heuristic') for _, result, _, _ in entries]
+
+    # (tier, -marginal, index, selection size the marginal was computed for)
+    heap = [(tiers[index], -base, index, 0) for index, (_, _, base, _) in enumerate(entries)]
+    heapq.heapify(heap)
+    selection = _Selection(settings)
+    deferred: List[int] = []
+    relaxed = False
+    # Candidates per topic not yet selected or dropped at the per-topic cap
+    remaining: Counter = Counter(topic for topic, _, _, _ in entries)
+
+    def reachable() -> int:
+        # Slots the remaining candidates can still fill under both caps
+        open_slots = sum(
+            min(per_topic_cap - selection.per_topic[topic], left) for topic, left in remaining.items()
+        )
+        return min(total_cap - len(selection), open_slots)
+
+    while len(selection) < total_cap:
+        if not heap:
+            if not deferred:
+                break
+            # Not enough distinct domains left: fill the remaining slots anyway
+            relaxed = True
+            heap = [(tiers[i], -entries[i][2], i, -1) for i in deferred]
+            heapq.heapify(heap)
+            deferred = []
+
+        _, _, index, computed_at = heapq.heappop(heap)
+        topic, result, base, fingerprint = entries[index]
+        if selection.per_topic[topic] >= per_topic_cap:
+            remaining[topic] -= 1
+            continue
+
+        needed = settings.min_unique_sources - len(selection.domains)
+        if not relaxed and needed > 0 and result.domain in selection.domains and reachable() <= needed:
+            deferred.append(index)
+            continue
+
+        if computed_at != len(selection):
+            marginal = selection.marginal(base, result.domain, fingerprint)
+            heapq.heappush(heap, (tiers[index], -marginal, index, len(selection)))
+            continue
+
+        selection.add(topic, result, fingerprint)
+        remaining[topic] -= 1
+
+    if len(selection.domains) < settings.min_unique_sources:
+        available = len({result.domain for _, result, _, _ in entries})
+        if available < settings.min_unique_sources:
+            logger.warning(
+                f"Only {available} distinct sources among the candidates; "
+                f"min_unique_sources is {settings.min_unique_sources}"
+            )
+        else:
+            logger.warning(
+                f"Selected {len(selection.domains)} distinct sources; the per-topic and total caps "
+                f"left no room for min_unique_sources {settings.min_unique_sources}"
+            )
+    logger.info(
+        f"Selected {len(selection)} of {len(entries)} candidates from "
+        f"{len(selection.domains)} sources across {len(candidates_by_topic)} topics"
+    )
+
+    selected: Dict[str, List[Result]] = {topic: [] for topic in candidates_by_topic}
+    for topic, result in selection.chosen:
+        selected[topic].append(result)
+    return selected
+
+
+def selection_is_global(config: SearchConfig) -> bool:
+    """Whether selecting one topic's results depends on the other topics."""
+    return config.selection.total_max_results is not None or config.selection.min_unique_sources > 0
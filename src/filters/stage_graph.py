@@ -0,0 +1,317 @@
+"""
+Declarative stage graph for the filter and rank pipeline.
+
+Stages are registered by name with the values they read and write:
+
+    @register_stage("keyword_filter", memo=SELECTION_MEMO, params=lambda run: run.config.required_keywords)
+    def keyword_filter(run, results):
+        return filter_by_keywords(results, run.config.required_keywords)
+
+A pipeline is an ordered list of stage names (`pipeline.stages` in
+config.yaml). Each input is wired to the nearest earlier stage that writes
+it, so the order defines a dependency graph. Stages whose inputs are ready
+run concurrently, and memoizable stages reuse their stored output when
+their inputs and parameters hash to a value seen in an earlier run.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from ..core.cache import DiskCache
+from ..core.history import ContentHistory
+from ..core.models import Result, SearchConfig, Topic
+
+if TYPE_CHECKING:
+    from ..pipeline.context import RunContext
+
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every memoized stage output
+MEMO_VERSION = 2
+
+
+@dataclass
+class StageRun:
+    """Per-call settings and resources every stage receives."""
+    config: SearchConfig
+    topic: Topic
+    context: Optional["RunContext"] = None
+    use_ai: bool = True
+    heuristic: bool = False
+    history: Optional[ContentHistory] = None
+    # Stages whose output this call should not be memoized (e.g. after a failed LLM reply)
+    skip_memo: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class StageMemo:
+    """How a stage's output is stored and rebuilt around the current inputs."""
+    encode: Callable[[Any, List[Result]], Any]
+    decode: Callable[[Any, List[Result]], Any]
+
+
+def _encode_selection(output: List[Result], results: List[Result]) -> List[int]:
+    positions = {id(result): index for index, result in enumerate(results)}
+    return [positions[id(result)] for result in output]
+
+
+def _decode_selection(payload: List[int], results: List[Result]) -> List[Result]:
+    return [results[index] for index in payload]
+
+
+# Memo for stages whose output is a subset or reordering of their input:
+# positions are stored, so a hit returns the caller's own Result objects
+SELECTION_MEMO = StageMemo(_encode_selection, _decode_selection)
+
+
+@dataclass
+class Stage:
+    """A registered pipeline stage."""
+    name: str
+    func: Callable[..., Any]
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    memo: Optional[StageMemo] = None
+    params: Optional[Callable[[StageRun], Any]] = None
+    offline: Union[bool, str] = True
+
+
+STAGES: Dict[str, Stage] = {}
+
+
+def register_stage(
+    name: str,
+    inputs: Sequence[str] = ('results',),
+    outputs: Sequence[str] = ('results',),
+    memo: Optional[StageMemo] = None,
+    params: Optional[Callable[[StageRun], Any]] = None,
+    offline: Union[bool, str] = True
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator registering a stage function under a name.
+
+    The function is called as func(run, **inputs) and returns its single
+    output, a tuple of outputs, or None when it declares none.
+
+    Args:
+        name: Stage name used in pipeline.stages
+        inputs: Names of the values the stage reads
+        outputs: Names of the values the stage writes
+        memo: Optional StageMemo making the stage memoizable; its first
+            input must be a list of results
+        params: For memoizable stages, everything besides the inputs that
+            affects the output (settings, model names), as JSON-able data
+        offline: Whether the stage can rerun on stored results without
+            network access or earlier runs' state; False skips it in
+            offline re-ranks, a stage name runs that stage in its place
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        STAGES[name] = Stage(name, func, tuple(inputs), tuple(outputs), memo, params, offline)
+        return func
+    return decorator
+
+
+def results_digest(results: List[Result]) -> str:
+    """Hash of the result fields stages read, including fetched page text and the compressed LLM input."""
+    digest = hashlib.sha256()
+    for result in results:
+        digest.update(json.dumps([
+            result.url, result.title, result.snippet, result.published_date, result.domain,
+            result.word_count, result.status,
+            hashlib.sha256(result.content.encode('utf-8')).hexdigest() if result.content else None,
+            result.compressed
+        ]).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class StageTimings:
+    """Wall time and memo hits per stage, accumulated over topics."""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.memo_hits: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'seconds': self.seconds, 'calls': self.calls, 'memo_hits': self.memo_hits}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__()
+        self.seconds, self.calls, self.memo_hits = state['seconds'], state['calls'], state['memo_hits']
+
+    def add(self, name: str, seconds: float, memo_hit: bool = False) -> None:
+        with self._lock:
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+            self.calls[name] = self.calls.get(name, 0) + 1
+            if memo_hit:
+                self.memo_hits[name] = self.memo_hits.get(name, 0) + 1
+
+    def merge(self, other: "StageTimings") -> None:
+        with self._lock:
+            for name, seconds in other.seconds.items():
+                self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+                self.calls[name] = self.calls.get(name, 0) + other.calls[name]
+            for name, hits in other.memo_hits.items():
+                self.memo_hits[name] = self.memo_hits.get(name, 0) + hits
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                name: {
+                    'seconds': round(self.seconds[name], 4),
+                    'calls': self.calls[name],
+                    'memo_hits': self.memo_hits.get(name, 0)
+                }
+                for name in self.seconds
+            }
+
+
+class StageGraph:
+    """
+    Dependency graph of an ordered stage list.
+
+    Each input is read from the nearest earlier stage writing that name,
+    or from the initial values passed to run().
+    """
+
+    def __init__(self, names: Sequence[str], initial: Sequence[str] = ('results',)):
+        """
+        Args:
+            names: Stage names in pipeline order
+            initial: Names of the values supplied to run()
+
+        Raises:
+            ValueError: For unknown stages or inputs no earlier stage writes
+        """
+        unknown = [name for name in names if name not in STAGES]
+        if unknown:
+            raise ValueError(f"Unknown pipeline stages: {', '.join(unknown)} (known: {', '.join(sorted(STAGES))})")
+
+        self.stages = [STAGES[name] for name in names]
+        # (producing stage index or -1 for initial values, value name) per input
+        self.sources: List[List[Tuple[int, str]]] = []
+        writers: Dict[str, int] = {name: -1 for name in initial}
+        for stage in self.stages:
+            sources = []
+            for value in stage.inputs:
+                if value not in writers:
+                    raise ValueError(f"Stage '{stage.name}' reads '{value}', which no earlier stage writes")
+                sources.append((writers[value], value))
+            self.sources.append(sources)
+            for value in stage.outputs:
+                writers[value] = len(self.sources) - 1
+        self.final = writers
+        self.dependencies = [
+            {producer for producer, _ in sources if producer >= 0} for sources in self.sources
+        ]
+
+    def run(
+        self,
+        initial: Dict[str, Any],
+        run: StageRun,
+        max_workers: int = 1,
+        memo_cache: Optional[DiskCache] = None,
+        timings: Optional[StageTimings] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute the stages, concurrently where the graph allows.
+
+        Args:
+            initial: Initial values by name
+            run: StageRun handed to every stage
+            max_workers: Threads for stages that are ready at the same time
+            memo_cache: Optional DiskCache for memoizable stage outputs
+            timings: Optional StageTimings receiving per-stage wall time
+
+        Returns:
+            Latest value of every name, after the last stage writing it
+        """
+        outputs: Dict[int, Dict[str, Any]] = {-1: dict(initial)}
+        remaining = set(range(len(self.stages)))
+        running: Dict[Future, int] = {}
+        local_timings = StageTimings()
+
+        def ready() -> List[int]:
+            return sorted(
+                index for index in remaining
+                if index not in running.values() and self.dependencies[index] <= outputs.keys()
+            )
+
+        def execute(index: int) -> Dict[str, Any]:
+            stage = self.stages[index]
+            inputs = {value: outputs[producer][value] for producer, value in self.sources[index]}
+            start = time.perf_counter()
+            result, memo_hit = self._execute(stage, inputs, run, memo_cache)
+            local_timings.add(stage.name, time.perf_counter() - start, memo_hit)
+            return result
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            while remaining:
+                batch = ready()
+                if len(batch) == 1 and not running:
+                    # Nothing to overlap with: run inline
+                    index = batch[0]
+                    outputs[index] = execute(index)
+                    remaining.discard(index)
+                    continue
+                for index in batch:
+                    running[pool.submit(execute, index)] = index
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    outputs[index] = future.result()
+                    remaining.discard(index)
+
+        logger.info("Stage timings: " + ", ".join(
+            f"{name} {local_timings.seconds[name] * 1000:.1f}ms"
+            + (" (memo)" if local_timings.memo_hits.get(name) else "")
+            for name in local_timings.seconds
+        ))
+        if timings is not None:
+            timings.merge(local_timings)
+        return {value: outputs[producer][value] for value, producer in self.final.items()}
+
+    def offline(self) -> "StageGraph":
+        """The graph with every stage replaced by its offline counterpart, or dropped."""
+        names = []
+        for stage in self.stages:
+            if stage.offline is True:
+                names.append(stage.name)
+            elif stage.offline:
+                names.append(stage.offline)
+        return StageGraph(names)
+
+    @staticmethod
+    def _execute(
+        stage: Stage,
+        inputs: Dict[str, Any],
+        run: StageRun,
+        memo_cache: Optional[DiskCache]
+    ) -> Tuple[Dict[str, Any], bool]:
+        key = None
+        if stage.memo is not None and memo_cache is not None:
+            results = inputs[stage.inputs[0]]
+            params = stage.params(run) if stage.params is not None else None
+            key = json.dumps(
+                [MEMO_VERSION, stage.name, params, results_digest(results)], sort_keys=True, default=str
+            )
+            cached = memo_cache.get(key)
+            if cached is not None:
+                memo_cache.touch(key)
+                return {stage.outputs[0]: stage.memo.decode(cached['output'], results)}, True
+
+        value = stage.func(run, **inputs)
+        if not stage.outputs:
+            return {}, False
+        values = value if len(stage.outputs) > 1 else (value,)
+        if key is not None and stage.name not in run.skip_memo:
+            memo_cache.set(key, {'output': stage.memo.encode(values[0], inputs[stage.inputs[0]])})
+        return dict(zip(stage.outputs, values)), False
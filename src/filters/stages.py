@@ -0,0 +1,284 @@
+"""
+Built-in stages of the filter and rank pipeline.
+
+Values passed between stages:
+    results: The surviving results, narrowed by each filter
+    candidates: Every result that reached scoring, with its score
+"""
+
+import logging
+from typing import Any, List
+
+from ..ai.analyzer import analyze_result_with_ai, log_parse_stats, with_json_mode
+from ..ai.classifier import record_audits, screen_results
+from ..ai.compressor import SnippetCompressor
+from ..ai.llm_factory import create_llm
+from ..ai.prompt_loader import load_prompt_text
+from ..core.models import Result
+from ..search.content_fetcher import ContentFetcher
+from ..search.dates import config_min_date
+from .content_filter import filter_by_word_count
+from .cross_run_dedup import filter_by_history, filter_seen_urls, load_previous_urls, stage_history
+from .date_filter import filter_by_date
+from .deduplicator import deduplicate_results
+from .heuristic import rank_by_heuristic
+from .keyword_filter import filter_by_keywords
+from .stage_graph import SELECTION_MEMO, StageMemo, StageRun, register_stage
+
+
+logger = logging.getLogger(__name__)
+
+# Order used when config.yaml has no pipeline.stages list
+DEFAULT_STAGES = [
+    'count_returned',
+    'date_filter',
+    'dedup',
+    'cross_run_filter',
+    'keyword_filter',
+    'count_keywords',
+    'fetch_content',
+    'word_count_filter',
+    'compress_text',
+    'ai_score',
+    'record_scores',
+    'rank',
+    'stage_history'
+]
+
+
+def _scoring(run: StageRun) -> bool:
+    return run.use_ai and run.config.use_ai_filtering
+
+
+@register_stage('count_returned', outputs=())
+def count_returned(run: StageRun, results: List[Result]) -> None:
+    if run.context is not None and run.context.domain_stats is not None:
+        run.context.domain_stats.count('returned', results)
+
+
+@register_stage(
+    'date_filter',
+    memo=SELECTION_MEMO,
+    params=lambda run: [config_min_date(run.config), run.config.keep_undated]
+)
+def date_filter(run: StageRun, results: List[Result]) -> List[Result]:
+    results = filter_by_date(results, config_min_date(run.config), run.config.keep_undated)
+    logger.info(f"After date filter: {len(results)} results")
+    return results
+
+
+@register_stage('dedup', memo=SELECTION_MEMO)
+def dedup(run: StageRun, results: List[Result]) -> List[Result]:
+    return deduplicate_results(results)
+
+
+def _log_carried(run: StageRun, results: List[Result], kept: List[Result]) -> None:
+    """Keep the results a cross-run filter dropped, so delta reports see them as carried over."""
+    log = run.context.carried_log if run.context is not None else None
+    if log is None:
+        return
+    kept_ids = {id(result) for result in kept}
+    log.setdefault(run.topic.name, []).extend(result for result in results if id(result) not in kept_ids)
+
+
+@register_stage('cross_run_filter', offline=False)
+def cross_run_filter(run: StageRun, results: List[Result]) -> List[Result]:
+    """Drop URLs seen in earlier runs, or unchanged and duplicated content when history is on."""
+    config = run.config
+    if run.history is not None:
+        # With fetching, fingerprints come from full pages: fetch_content filters instead
+        if config.fetching.enabled:
+            return results
+        kept = filter_by_history(
+            results, run.history, config.history.near_duplicate_distance, config.history.change_distance
+        )
+    else:
+        if run.context is not None:
+            seen_urls = run.context.get_seen_urls(config.output_dir)
+        else:
+            seen_urls = load_previous_urls(config.output_dir)
+        kept = filter_seen_urls(results, seen_urls)
+    _log_carried(run, results, kept)
+    return kept
+
+
+@register_stage('keyword_filter', memo=SELECTION_MEMO, params=lambda run: run.config.required_keywords)
+def keyword_filter(run: StageRun, results: List[Result]) -> List[Result]:
+    results = filter_by_keywords(results, run.config.required_keywords)
+    logger.info(f"After keyword filter: {len(results)} results")
+    return results
+
+
+@register_stage('count_keywords', outputs=())
+def count_keywords(run: StageRun, results: List[Result]) -> None:
+    if run.context is not None and run.context.domain_stats is not None:
+        run.context.domain_stats.count('passed_keywords', results)
+
+
+@register_stage('fetch_content', offline=False)
+def fetch_content(run: StageRun, results: List[Result]) -> List[Result]:
+    """Fetch full pages when fetching is enabled, then apply the history filter to them."""
+    config = run.config
+    if not (config.fetching.enabled and results):
+        return results
+    if run.context is not None:
+        fetcher = run.context.get_content_fetcher(config)
+    else:
+        fetcher = ContentFetcher(config.fetching)
+    fetcher.fetch_all(results)
+    if run.history is not None:
+        kept = filter_by_history(
+            results, run.history, config.history.near_duplicate_distance, config.history.change_distance
+        )
+        _log_carried(run, results, kept)
+        results = kept
+    return results
+
+
+@register_stage(
+    'word_count_filter',
+    memo=SELECTION_MEMO,
+    params=lambda run: [run.config.fetching.enabled, run.config.min_word_count]
+)
+def word_count_filter(run: StageRun, results: List[Result]) -> List[Result]:
+    # Word counts are only known for fetched pages
+    if not run.config.fetching.enabled:
+        return results
+    results = filter_by_word_count(results, run.config.min_word_count)
+    logger.info(f"After word count filter: {len(results)} results")
+    return results
+
+
+@register_stage('compress_text')
+def compress_text(run: StageRun, results: List[Result]) -> List[Result]:
+    """Set each result's token-bounded LLM input when compression is enabled and results are AI-scored."""
+    config = run.config
+    if not (config.compression.enabled and _scoring(run) and results):
+        return results
+    # Boilerplate is learned from this topic's results only, so serial and
+    # parallel runs send the LLM the same inputs
+    compressor = SnippetCompressor(config.compression)
+    before, after = compressor.compress_all(results, run.topic)
+    logger.info(f"Compressed LLM inputs of {len(results)} results: ~{before} -> ~{after} tokens")
+    return results
+
+
+def _encode_scores(output: List[Result], results: List[Result]) -> List[List[Any]]:
+    return [[result.relevance_score, result.score_source] for result in output]
+
+
+def _decode_scores(payload: List[List[Any]], results: List[Result]) -> List[Result]:
+    for result, (score, source) in zip(results, payload):
+        result.relevance_score = score
+        result.score_source = source
+    return list(results)
+
+
+def _scoring_params(run: StageRun) -> Any:
+    config = run.config
+    classifier = None
+    if config.classifier.enabled and run.context is not None:
+        # Model file and modification time identify the trained model
+        run.context.get_classifier(config)
+        classifier = [config.classifier.lower, config.classifier.upper, run.context.classifier_key]
+    return [
+        _scoring(run), config.ai_model, config.ai_temperature, config.ai_structured_output,
+        load_prompt_text("relevance_analysis"), run.topic.name, run.topic.keywords, classifier
+    ]
+
+
+@register_stage(
+    'ai_score',
+    outputs=('candidates',),
+    memo=StageMemo(_encode_scores, _decode_scores),
+    params=_scoring_params,
+    offline='stored_scores'
+)
+def ai_score(run: StageRun, results: List[Result]) -> List[Result]:
+    """
+    Score each result's relevance with the LLM, or the local classifier when confident.
+
+    A memo hit restores the scores without LLM calls, so nothing is added
+    to the verdict log for it. Calls with a failed reply are not memoized.
+    """
+    config, topic, context = run.config, run.topic, run.context
+    candidates = list(results)
+    if not (_scoring(run) and candidates):
+        return candidates
+
+    logger.info("Analyzing results with AI...")
+    if context is not None:
+        llm = context.get_llm(config)
+    else:
+        llm = create_llm(config.ai_model, config.ai_temperature)
+    scoring_llm = with_json_mode(llm) if config.ai_structured_output else llm
+    verdict_log = context.verdict_log if context is not None else None
+
+    # Let the local classifier decide the confident cases
+    to_analyze, audits = candidates, {}
+    classifier = None
+    if context is not None and config.classifier.enabled:
+        classifier = context.get_classifier(config)
+    if classifier is not None:
+        to_analyze, audits = screen_results(candidates, topic, classifier, config.classifier, verdict_log)
+        logger.info(f"Classifier decided {len(candidates) - len(to_analyze)} results locally")
+
+    for result in to_analyze:
+        analysis = analyze_result_with_ai(
+            result,
+            topic,
+            scoring_llm,
+            model=config.ai_model,
+            max_retries=config.ai_parse_retries,
+            parse_stats=context.parse_stats if context is not None else None,
+            relevance_threshold=config.relevance_threshold
+        )
+        result.relevance_score = analysis['relevance_score']
+        result.score_source = 'failed' if analysis.get('parse_failed') else 'llm'
+        if analysis.get('parse_failed'):
+            run.skip_memo.add('ai_score')
+        elif verdict_log is not None:
+            verdict_log.record(topic, result, result.relevance_score)
+    if context is None or context.parse_stats is None:
+        log_parse_stats()
+    if audits and verdict_log is not None:
+        record_audits(to_analyze, audits, verdict_log, config.relevance_threshold)
+    return candidates
+
+
+@register_stage('stored_scores', outputs=('candidates',))
+def stored_scores(run: StageRun, results: List[Result]) -> List[Result]:
+    """Take the scores results already carry, as stored by an earlier run."""
+    return list(results)
+
+
+@register_stage('record_scores', inputs=('candidates',), outputs=())
+def record_scores(run: StageRun, candidates: List[Result]) -> None:
+    if _scoring(run) and run.context is not None and run.context.domain_stats is not None:
+        run.context.domain_stats.record_scores(candidates, run.config.relevance_threshold)
+
+
+@register_stage('rank', inputs=('candidates',))
+def rank(run: StageRun, candidates: List[Result]) -> List[Result]:
+    """Keep relevant results best first; without AI, rank heuristically or by date."""
+    if _scoring(run) and candidates:
+        results = [r for r in candidates if r.relevance_score >= run.config.relevance_threshold]
+        logger.info(f"After AI filtering: {len(results)} results")
+        return sorted(results, key=lambda x: x.relevance_score, reverse=True)
+    if run.heuristic:
+        return rank_by_heuristic(
+            candidates, run.config.authority_domains, run.topic.keywords, run.config.min_year
+        )
+    return sorted(
+        candidates,
+        key=lambda x: x.published_date if x.published_date else '0000',
+        reverse=True
+    )
+
+
+@register_stage('stage_history', inputs=('candidates', 'results'), outputs=())
+def record_history(run: StageRun, candidates: List[Result], results: List[Result]) -> None:
+    """Stage every evaluated result for the content history, with its final score."""
+    # Reads results only to run after rank, which sets heuristic scores
+    if run.history is not None:
+        stage_history(candidates, run.history)
@@ -8,17 +8,17 @@ in engineering projects. Refactored for clarity and extensibility.
 
 import os
 import logging
-from pathlib import Path
-from dotenv import load_dotenv
 from datetime import datetime
+from typing import List, Optional
+
+from dotenv import load_dotenv
 
+from src.api import run_research
+from src.core.cassette import Cassette
 from src.core.config import load_config
-from src.search.query_builder import build_queries_for_topic
-from src.search.tavily_client import tavily_search
-from src.filters.ranking import rank_and_filter_results
-from src.output.markdown_generator import to_markdown_report
-from src.output.json_generator import to_json_file
-from src.ui.browser_view import generate_browser_view
+from src.pipeline.batch import run_batch
+from src.pipeline.context import RunContext
+from src.search.providers import required_api_keys
 
 
 # Configure logging
@@ -29,81 +29,88 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main(config_path: str = "config.yaml") -> None:
+def main(
+    config_path: str = "config.yaml",
+    context: Optional[RunContext] = None,
+    workers: Optional[int] = None,
+    cassette: Optional[Cassette] = None,
+    deadline: Optional[datetime] = None,
+    time_budget: Optional[float] = None
+) -> None:
     """
     Main execution function.
     
     Args:
         config_path: Path to configuration file
+        context: Optional RunContext to reuse clients and indexes across runs
+        workers: Number of worker processes, overriding execution.workers
+        cassette: Optional Cassette to record API interactions into, or to
+            replay them from without network access or API keys
+        deadline: Optional wall-clock deadline for the run
+        time_budget: Optional time budget in seconds, overriding
+            execution.time_budget_seconds
     """
     # Load environment variables
     load_dotenv()
     
-    # Verify API keys
-    required_keys = ['TAVILY_API_KEY', 'OPENAI_API_KEY']
-    missing_keys = [key for key in required_keys if not os.getenv(key)]
-    if missing_keys:
-        raise ValueError(f"Missing required API keys: {', '.join(missing_keys)}")
-    
     # Load configuration
     config = load_config(config_path)
     
-    # Create output directory
-    output_dir = Path(config.output_dir)
-    output_dir.mkdir(exist_ok=True)
-    
-    # Process each topic
-    results_by_topic = {}
+    # Verify API keys (a replayed run never touches the network)
+    replaying = cassette is not None and cassette.replaying
+    if not replaying:
+        required_keys = required_api_keys(config) + ['OPENAI_API_KEY']
+        missing_keys = [key for key in required_keys if not os.getenv(key)]
+        if missing_keys:
+            raise ValueError(f"Missing required API keys: {', '.join(missing_keys)}")
     
-    for topic in config.topics:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing topic: {topic.name}")
-        logger.info(f"{'='*60}")
-        
-        # Build queries
-        queries = build_queries_for_topic(topic, config.min_year)
-        
-        # Execute searches
-        all_results = []
-        for query in queries:
-            results = tavily_search(
-                query=query,
-                max_results=config.max_results_per_query,
-                search_depth=config.search_depth,
-                include_domains=config.include_domains,
-                exclude_domains=config.exclude_domains
-            )
-            all_results.extend(results)
-        
-        logger.info(f"Total results from all queries: {len(all_results)}")
-        
-        # Filter and rank
-        filtered_results = rank_and_filter_results(
-            all_results,
-            config,
-            topic,
-            use_ai=config.use_ai_filtering
-        )
-        
-        results_by_topic[topic.name] = filtered_results
+    run = run_research(
+        config,
+        context=context,
+        write_outputs=True,
+        workers=workers,
+        cassette=cassette,
+        deadline=deadline,
+        time_budget=time_budget
+    )
+    paths = run.paths
     
-    # Generate outputs
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    logger.info(f"\n{'='*60}")
+    logger.info("✅ Research automation completed successfully!")
+    logger.info(f"📄 Markdown report: {paths['markdown']}")
+    logger.info(f"📊 JSON data: {paths['json']}")
+    logger.info(f"🌐 Browser view: {paths['browser']}")
+    if 'delta' in paths:
+        logger.info(f"🆕 Delta report: {paths['delta']}")
+    logger.info(f"{'='*60}\n")
+
+
+def run_batch_main(config_paths: List[str]) -> None:
+    """
+    Batch execution function for several configuration files.
     
-    markdown_path = output_dir / f"research_report_{timestamp}.md"
-    to_markdown_report(results_by_topic, config, str(markdown_path))
+    Args:
+        config_paths: Paths to configuration files
+    """
+    load_dotenv()
     
-    json_path = output_dir / f"research_data_{timestamp}.json"
-    to_json_file(results_by_topic, str(json_path))
+    # Verify API keys for every config up front
+    required_keys = {'OPENAI_API_KEY'}
+    for config_path in config_paths:
+        required_keys.update(required_api_keys(load_config(config_path)))
+    missing_keys = sorted(key for key in required_keys if not os.getenv(key))
+    if missing_keys:
+        raise ValueError(f"Missing required API keys: {', '.join(missing_keys)}")
     
-    browser_path = output_dir / f"research_browser_{timestamp}.html"
-    generate_browser_view(results_by_topic, str(browser_path))
+    report = run_batch(config_paths)
     
     logger.info(f"\n{'='*60}")
-    logger.info("✅ Research automation completed successfully!")
-    logger.info(f"📄 Markdown report: {markdown_path}")
-    logger.info(f"📊 JSON data: {json_path}")
-    logger.info(f"🌐 Browser view: {browser_path}")
+    logger.info(f"✅ Batch of {len(config_paths)} configs completed!")
+    for name, entry in report['configs'].items():
+        logger.info(f"📄 {name}: {entry['paths'].get('markdown')}")
+    for kind, label in (('searches', 'Searches'), ('ai_calls', 'AI calls')):
+        usage = report[kind]
+        logger.info(f"♻️  {label}: {usage['executed']} executed for {usage['requested']} requested ({usage['saved']} saved)")
     logger.info(f"{'='*60}\n")
 
 
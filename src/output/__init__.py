@@ -2,5 +2,19 @@
 
 from .markdown_generator import to_markdown_report
 from .json_generator import to_json_file
+from .retention import apply_retention
+from .archive import RunArchive, iter_result_rows, iter_run_data, load_run_data, results_from_run_data
+from .delta_report import compute_delta, to_delta_report
 
-__all__ = ['to_markdown_report', 'to_json_file']
+__all__ = [
+    'to_markdown_report',
+    'to_json_file',
+    'apply_retention',
+    'RunArchive',
+    'iter_result_rows',
+    'iter_run_data',
+    'load_run_data',
+    'results_from_run_data',
+    'compute_delta',
+    'to_delta_report'
+]
@@ -0,0 +1,276 @@
+"""
+Compressed, append-only archive of past run data.
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..core.fingerprint import fingerprint_result
+from ..core.models import Result, result_from_dict
+
+
+logger = logging.getLogger(__name__)
+
+# Segments are rolled over once they reach this size
+SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+
+RUN_ID_PATTERN = re.compile(r'research_data_(\d{8}_\d{6})\.json$')
+
+# (url, title-and-snippet fingerprint, relevance score) of a stored result
+ResultRow = Tuple[str, int, float]
+
+
+def run_id_from_path(path: Path) -> Optional[str]:
+    """Extract the YYYYMMDD_HHMMSS run id from a research_data_*.json path."""
+    match = RUN_ID_PATTERN.search(path.name)
+    return match.group(1) if match else None
+
+
+def result_rows(data: Dict[str, Any]) -> List[ResultRow]:
+    """URL, snippet fingerprint and score of every result in stored run data."""
+    rows = []
+    for items in data.get('topics', {}).values():
+        for item in items:
+            if 'url' in item:
+                result = result_from_dict(item)
+                rows.append((result.url, fingerprint_result(result), result.relevance_score))
+    return rows
+
+
+class RunArchive:
+    """
+    Past runs stored as gzip members appended to segment files.
+
+    Each run's JSON data is compressed independently and appended to the
+    current segment; index.json records the segment, byte offset and length
+    of every run, so a single run can be read without touching the others.
+    The index also keeps each run's result rows (URL, fingerprint, score),
+    so cross-run deduplication never decompresses the runs themselves.
+    """
+
+    def __init__(self, output_dir: str = "outputs"):
+        """
+        Args:
+            output_dir: Output directory; the archive lives in its archive/ subfolder
+        """
+        self.root = Path(output_dir) / "archive"
+        self.index_path = self.root / "index.json"
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_mtime: Optional[float] = None
+
+    @property
+    def index(self) -> Dict[str, Dict[str, Any]]:
+        """Run id -> {segment, offset, length, generated_at, result_count, results}."""
+        mtime = self.index_path.stat().st_mtime if self.index_path.exists() else None
+        if self._index is None or mtime != self._index_mtime:
+            if mtime is None:
+                self._index = {}
+            else:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            self._index_mtime = mtime
+        return self._index
+
+    def run_ids(self) -> List[str]:
+        """Archived run ids in chronological order."""
+        return sorted(self.index)
+
+    def __contains__(self, run_id: str) -> bool:
+        return run_id in self.index
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+        self._index = index
+        self._index_mtime = self.index_path.stat().st_mtime
+
+    def _current_segment(self, index: Dict[str, Dict[str, Any]]) -> Path:
+        segments = sorted(entry['segment'] for entry in index.values())
+        if segments:
+            latest = self.root / segments[-1]
+            if latest.exists() and latest.stat().st_size < SEGMENT_MAX_BYTES:
+                return latest
+        return self.root / f"segment_{len(set(segments)) + 1:04d}.gz"
+
+    def append_run(self, run_id: str, data: Dict[str, Any]) -> None:
+        """
+        Compress and append one run's data. Existing runs are never rewritten.
+
+        Args:
+            run_id: Run identifier (YYYYMMDD_HHMMSS)
+            data: Run data as written by to_json_file
+        """
+        index = dict(self.index)
+        if run_id in index:
+            logger.debug(f"Run {run_id} already archived")
+            return
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = gzip.compress(
+            json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        )
+
+        segment = self._current_segment(index)
+        with open(segment, 'ab') as f:
+            offset = f.tell()
+            f.write(payload)
+
+        index[run_id] = {
+            'segment': segment.name,
+            'offset': offset,
+            'length': len(payload),
+            'generated_at': data.get('generated_at'),
+            'result_count': sum(len(r) for r in data.get('topics', {}).values()),
+            'results': result_rows(data)
+        }
+        self._write_index(index)
+
+    def load_run(self, run_id: str) -> Dict[str, Any]:
+        """
+        Read a single archived run.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Run data dictionary
+        """
+        entry = self.index[run_id]
+        with open(self.root / entry['segment'], 'rb') as f:
+            f.seek(entry['offset'])
+            payload = f.read(entry['length'])
+        return json.loads(gzip.decompress(payload))
+
+    def iter_result_rows(self) -> Iterator[Tuple[str, List[ResultRow]]]:
+        """
+        Yield (run_id, result rows) for every archived run in chronological order.
+
+        Rows come from the index. Runs archived before the index kept them
+        are read once and their rows added to the index.
+        """
+        index = self.index
+        missing = {}
+        for run_id in self.run_ids():
+            rows = index[run_id].get('results')
+            if rows is None:
+                try:
+                    rows = missing[run_id] = result_rows(self.load_run(run_id))
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"Could not read archived run {run_id}: {e}")
+                    continue
+            yield run_id, [tuple(row) for row in rows]
+        if missing:
+            updated = {run_id: dict(entry) for run_id, entry in self.index.items()}
+            for run_id, rows in missing.items():
+                if run_id in updated:
+                    updated[run_id]['results'] = rows
+            self._write_index(updated)
+
+    def iter_runs(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (run_id, data) for every archived run in chronological order."""
+        for run_id in self.run_ids():
+            try:
+                yield run_id, self.load_run(run_id)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Could not read archived run {run_id}: {e}")
+
+
+def iter_run_data(output_dir: str = "outputs") -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield (run_id, data) for every stored run, archived or live.
+
+    Args:
+        output_dir: Output directory
+
+    Returns:
+        Iterator over runs in chronological order
+    """
+    archive = RunArchive(output_dir)
+    archived = set(archive.run_ids())
+    yield from archive.iter_runs()
+
+    for json_file in sorted(Path(output_dir).glob("research_data_*.json")):
+        run_id = run_id_from_path(json_file)
+        if run_id is None or run_id in archived:
+            continue
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                yield run_id, json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load {json_file}: {e}")
+
+
+def iter_result_rows(output_dir: str = "outputs") -> Iterator[Tuple[str, List[ResultRow]]]:
+    """
+    Yield (run_id, result rows) for every stored run, archived or live.
+
+    Archived runs are read from the archive index only; live runs, which
+    retention keeps few of, from their JSON files.
+
+    Args:
+        output_dir: Output directory
+
+    Returns:
+        Iterator over runs in chronological order
+    """
+    archive = RunArchive(output_dir)
+    archived = set(archive.run_ids())
+    yield from archive.iter_result_rows()
+
+    for json_file in sorted(Path(output_dir).glob("research_data_*.json")):
+        run_id = run_id_from_path(json_file)
+        if run_id is None or run_id in archived:
+            continue
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                yield run_id, result_rows(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load {json_file}: {e}")
+
+
+def stored_run_ids(output_dir: str = "outputs") -> List[str]:
+    """Ids of every stored run, archived or live, in chronological order."""
+    run_ids = set(RunArchive(output_dir).run_ids())
+    run_ids.update(
+        run_id for run_id in map(run_id_from_path, Path(output_dir).glob("research_data_*.json")) if run_id
+    )
+    return sorted(run_ids)
+
+
+def load_run_data(output_dir: str, run_id: str) -> Dict[str, Any]:
+    """
+    Load one run's data from its live JSON file or from the archive.
+
+    Args:
+        output_dir: Output directory
+        run_id: Run identifier (YYYYMMDD_HHMMSS)
+
+    Returns:
+        Run data dictionary
+    """
+    live_path = Path(output_dir) / f"research_data_{run_id}.json"
+    if live_path.exists():
+        with open(live_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    archive = RunArchive(output_dir)
+    if run_id in archive:
+        return archive.load_run(run_id)
+
+    raise FileNotFoundError(f"Run {run_id} not found in {output_dir}")
+
+
+def results_from_run_data(data: Dict[str, Any]) -> Dict[str, List[Result]]:
+    """Rebuild results_by_topic from stored run data."""
+    return {
+        topic_name: [result_from_dict(item) for item in items]
+        for topic_name, items in data.get('topics', {}).items()
+    }
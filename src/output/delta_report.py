@@ -0,0 +1,239 @@
+"""
+"What's new since the last run" reports backed by the history index.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.fingerprint import hamming_distance, simhash
+from ..core.history import ContentHistory, RunResultRow
+from ..core.models import Result
+from .archive import load_run_data, results_from_run_data, stored_run_ids
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TopicDelta:
+    """How one topic's results differ from the baseline run."""
+    new: List[Result] = field(default_factory=list)
+    returning: List[Tuple[Result, str]] = field(default_factory=list)
+    # (result, previous rank, content changed)
+    changed: List[Tuple[Result, int, bool]] = field(default_factory=list)
+    unchanged: int = 0
+    removed: List[RunResultRow] = field(default_factory=list)
+    # Baseline rows found again but dropped as already reported, recorded again with this run
+    carried: List[RunResultRow] = field(default_factory=list)
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            'new': len(self.new),
+            'returning': len(self.returning),
+            'changed': len(self.changed),
+            'unchanged': self.unchanged,
+            'removed': len(self.removed)
+        }
+
+
+def report_fingerprint(result: Result) -> int:
+    """Fingerprint of what a report shows: the title and snippet."""
+    return simhash(f"{result.title} {result.snippet}")
+
+
+def run_rows(
+    results_by_topic: Dict[str, List[Result]],
+    deltas: Optional[Dict[str, TopicDelta]] = None
+) -> List[RunResultRow]:
+    """Rows recording a run's ranked results in the history, plus the baseline results it carried over."""
+    rows = [
+        (topic, result.url, rank, result.title, result.relevance_score, report_fingerprint(result))
+        for topic, results in results_by_topic.items()
+        for rank, result in enumerate(results, 1)
+    ]
+    for delta in (deltas or {}).values():
+        rows.extend(delta.carried)
+    return rows
+
+
+def bootstrap_runs(history: ContentHistory, output_dir: str) -> Optional[str]:
+    """
+    Seed an empty run index with the latest stored run, so the first delta has a baseline.
+
+    Args:
+        history: ContentHistory to seed
+        output_dir: Output directory with live and archived runs
+
+    Returns:
+        The seeded run id, or None when there is nothing to seed
+    """
+    if history.latest_run() is not None:
+        return None
+    run_ids = stored_run_ids(output_dir)
+    if not run_ids:
+        return None
+    latest = run_ids[-1]
+    history.record_run(latest, run_rows(results_from_run_data(load_run_data(output_dir, latest))))
+    logger.info(f"Seeded the run index with run {latest}")
+    return latest
+
+
+def compute_delta(
+    history: ContentHistory,
+    results_by_topic: Dict[str, List[Result]],
+    change_distance: int = 10,
+    carried_over: Optional[Dict[str, List[Result]]] = None
+) -> Tuple[Optional[str], Dict[str, TopicDelta]]:
+    """
+    Compare a run's ranked results with the latest recorded run.
+
+    The cross-run filter drops results an earlier run already reported, so
+    baseline results the search returned again arrive in carried_over
+    rather than in the ranked results. They count as unchanged, or as
+    changed when their content moved, instead of as removed.
+
+    Each topic costs one indexed range read of the baseline's rows, plus
+    one indexed lookup per result the baseline did not report.
+
+    Args:
+        history: ContentHistory holding the recorded runs
+        results_by_topic: This run's ranked results per topic
+        change_distance: Fingerprint bits a result must move to count as changed
+        carried_over: Results per topic dropped by the cross-run filter
+
+    Returns:
+        Tuple of (baseline run id or None, TopicDelta per topic)
+    """
+    baseline = history.latest_run()
+    deltas = {}
+    for topic, results in results_by_topic.items():
+        delta = TopicDelta()
+        previous = {}
+        if baseline is not None:
+            previous = {row[1]: row for row in history.run_results(baseline, topic)}
+
+        for rank, result in enumerate(results, 1):
+            row = previous.pop(result.url, None)
+            if row is None:
+                last_run = history.last_reported(topic, result.url)
+                if last_run is None:
+                    delta.new.append(result)
+                else:
+                    delta.returning.append((result, last_run))
+                continue
+            _, _, previous_rank, _, _, fingerprint = row
+            content_changed = hamming_distance(report_fingerprint(result), fingerprint) > change_distance
+            if content_changed or previous_rank != rank or result.status == "updated":
+                delta.changed.append((result, previous_rank, content_changed or result.status == "updated"))
+            else:
+                delta.unchanged += 1
+
+        for result in (carried_over or {}).get(topic, []):
+            row = previous.pop(result.url, None)
+            if row is None:
+                continue
+            _, url, previous_rank, _, score, fingerprint = row
+            current = report_fingerprint(result)
+            if hamming_distance(current, fingerprint) > change_distance:
+                delta.changed.append((result, previous_rank, True))
+            else:
+                delta.unchanged += 1
+            delta.carried.append((topic, url, previous_rank, result.title, score, current))
+
+        delta.removed = sorted(previous.values(), key=lambda row: row[2])
+        deltas[topic] = delta
+    return baseline, deltas
+
+
+def delta_summary(baseline: Optional[str], deltas: Dict[str, TopicDelta]) -> Dict[str, Any]:
+    """Per-topic counts for the run metadata."""
+    return {'baseline': baseline, 'topics': {topic: delta.counts() for topic, delta in deltas.items()}}
+
+
+def delta_note(baseline: Optional[str], deltas: Dict[str, TopicDelta]) -> str:
+    """One-line summary for the run notes."""
+    totals = {key: sum(delta.counts()[key] for delta in deltas.values()) for key in ('new', 'changed', 'removed')}
+    if baseline is None:
+        return f"Delta report: {totals['new']} new results (no earlier run to compare with)"
+    return (
+        f"Delta report vs run {baseline}: {totals['new']} new, {totals['changed']} changed, "
+        f"{totals['removed']} removed"
+    )
+
+
+def _rank_move(previous_rank: int, rank: Optional[int]) -> str:
+    if rank is None:
+        return f"#{previous_rank} (carried over)"
+    if rank < previous_rank:
+        return f"▲ #{previous_rank} → #{rank}"
+    if rank > previous_rank:
+        return f"▼ #{previous_rank} → #{rank}"
+    return f"#{rank}"
+
+
+def to_delta_report(
+    baseline: Optional[str],
+    deltas: Dict[str, TopicDelta],
+    results_by_topic: Dict[str, List[Result]],
+    output_path: str
+) -> None:
+    """
+    Write a compact Markdown report of new, changed and removed results.
+
+    Args:
+        baseline: Run id compared against, or None for the first run
+        deltas: TopicDelta per topic from compute_delta()
+        results_by_topic: This run's ranked results, for current ranks
+        output_path: Path to save the Markdown file
+    """
+    logger.info(f"Generating delta report: {output_path}")
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write("# What's New Since the Last Run\n\n")
+        f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        if baseline is None:
+            f.write("**Compared with:** no earlier run; every result is new\n\n")
+        else:
+            f.write(f"**Compared with:** run {baseline}\n\n")
+        f.write("---\n\n")
+
+        for topic, delta in deltas.items():
+            ranks = {result.url: rank for rank, result in enumerate(results_by_topic[topic], 1)}
+            counts = delta.counts()
+            f.write(f"## {topic}\n\n")
+            f.write(
+                f"{counts['new']} new · {counts['returning']} returning · {counts['changed']} changed · "
+                f"{counts['unchanged']} unchanged · {counts['removed']} removed\n\n"
+            )
+
+            if delta.new:
+                f.write("### 🆕 New\n\n")
+                for result in delta.new:
+                    f.write(f"- #{ranks[result.url]} [{result.title}]({result.url}) · {result.domain}\n")
+                f.write("\n")
+            if delta.returning:
+                f.write("### ↩️ Returning\n\n")
+                for result, last_run in delta.returning:
+                    f.write(
+                        f"- #{ranks[result.url]} [{result.title}]({result.url}) · last reported in run {last_run}\n"
+                    )
+                f.write("\n")
+            if delta.changed:
+                f.write("### 🔄 Changed\n\n")
+                for result, previous_rank, content_changed in delta.changed:
+                    line = f"- {_rank_move(previous_rank, ranks.get(result.url))} [{result.title}]({result.url})"
+                    if content_changed:
+                        line += " · content updated"
+                    f.write(line + "\n")
+                f.write("\n")
+            if delta.removed:
+                f.write("### ➖ Removed\n\n")
+                for _, url, rank, title, _, _ in delta.removed:
+                    f.write(f"- was #{rank} [{title}]({url})\n")
+                f.write("\n")
+            if not (delta.new or delta.returning or delta.changed or delta.removed):
+                f.write("_No changes._\n\n")
+
+    logger.info("Delta report generated successfully")
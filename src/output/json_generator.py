@@ -4,11 +4,10 @@ JSON data export.
 
 import json
 import logging
-from dataclasses import asdict
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
-from ..core.models import Result
+from ..core.models import Result, result_to_dict
 
 
 logger = logging.getLogger(__name__)
@@ -16,7 +15,8 @@ logger = logging.getLogger(__name__)
 
 def to_json_file(
     results_by_topic: Dict[str, List[Result]],
-    output_path: str
+    output_path: str,
+    metadata: Optional[Dict[str, Any]] = None
 ) -> None:
     """
     Generate a machine-friendly JSON file.
@@ -24,6 +24,7 @@ def to_json_file(
     Args:
         results_by_topic: Dictionary mapping topic names to result lists
         output_path: Path to save the JSON file
+        metadata: Optional run metadata (notes, domain exclusion report)
     """
     logger.info(f"Generating JSON output: {output_path}")
     
@@ -31,10 +32,12 @@ def to_json_file(
         "generated_at": datetime.now().isoformat(),
         "topics": {}
     }
+    if metadata:
+        output_data["metadata"] = metadata
     
     for topic_name, results in results_by_topic.items():
         output_data["topics"][topic_name] = [
-            asdict(result) for result in results
+            result_to_dict(result) for result in results
         ]
     
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -4,7 +4,7 @@ Markdown report generation.
 
 import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 from ..core.models import Result, SearchConfig
 
@@ -15,7 +15,8 @@ logger = logging.getLogger(__name__)
 def to_markdown_report(
     results_by_topic: Dict[str, List[Result]],
     config: SearchConfig,
-    output_path: str
+    output_path: str,
+    metadata: Optional[Dict[str, Any]] = None
 ) -> None:
     """
     Generate a human-readable Markdown report.
@@ -24,6 +25,7 @@ def to_markdown_report(
         results_by_topic: Dictionary mapping topic names to result lists
         config: SearchConfig object
         output_path: Path to save the Markdown file
+        metadata: Optional run metadata; its 'notes' are listed under Run Notes
     """
     logger.info(f"Generating Markdown report: {output_path}")
     
@@ -33,6 +35,13 @@ def to_markdown_report(
         f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
         f.write(f"**Topics Searched:** {len(results_by_topic)}\n\n")
         
+        notes = (metadata or {}).get('notes', [])
+        if notes:
+            f.write("## Run Notes\n\n")
+            for note in notes:
+                f.write(f"- {note}\n")
+            f.write("\n")
+        
         f.write("---\n\n")
         
         # Results by topic
@@ -45,6 +54,8 @@ def to_markdown_report(
                 
                 # Metadata
                 metadata_parts = []
+                if result.status == "updated":
+                    metadata_parts.append("🔄 Updated since last seen")
                 if result.published_date:
                     metadata_parts.append(f"📅 {result.published_date}")
                 if result.domain:
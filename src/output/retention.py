@@ -0,0 +1,85 @@
+"""
+Retention of previous run outputs.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from .archive import RunArchive, run_id_from_path
+
+
+logger = logging.getLogger(__name__)
+
+
+def _remove_run_files(directory: Path, run_id: str) -> None:
+    for file in directory.glob(f"research_*_{run_id}.*"):
+        file.unlink()
+
+
+def apply_retention(
+    output_dir: str = "outputs",
+    days_to_keep: int = 30,
+    archive: bool = False
+) -> int:
+    """
+    Delete or archive output files older than the retention window.
+    
+    With `archive`, each expired run's JSON data is compacted into the
+    compressed RunArchive; its Markdown and HTML files are removed because
+    they can be regenerated from the archived data. Uncompressed files left
+    in outputs/archive/ by earlier versions are compacted as well; without
+    `archive` they are kept, since the user archived them on purpose.
+    
+    Args:
+        output_dir: Directory containing research_* output files
+        days_to_keep: Age in days after which a run is expired
+        archive: Compact expired runs into the archive instead of deleting them
+        
+    Returns:
+        Number of runs deleted or archived
+    """
+    outputs_path = Path(output_dir)
+    if not outputs_path.exists():
+        return 0
+    
+    cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+    run_archive = RunArchive(output_dir)
+    processed = 0
+    
+    candidates = []
+    for file in outputs_path.glob("research_data_*.json"):
+        if datetime.fromtimestamp(file.stat().st_mtime) < cutoff_date:
+            candidates.append((outputs_path, file))
+    if archive:
+        for file in (outputs_path / "archive").glob("research_data_*.json"):
+            candidates.append((file.parent, file))
+    
+    for directory, json_file in sorted(candidates, key=lambda c: c[1].name):
+        run_id = run_id_from_path(json_file)
+        if run_id is None:
+            continue
+        
+        if archive:
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not archive {json_file}: {e}")
+                continue
+            run_archive.append_run(run_id, data)
+        
+        _remove_run_files(directory, run_id)
+        processed += 1
+    
+    # Reports whose data file is already gone
+    for file in list(outputs_path.glob("research_report_*")) + list(outputs_path.glob("research_browser_*")):
+        if datetime.fromtimestamp(file.stat().st_mtime) < cutoff_date:
+            file.unlink()
+    
+    if processed > 0:
+        action = "Archived" if archive else "Deleted"
+        logger.info(f"{action} {processed} run(s) older than {days_to_keep} days")
+    
+    return processed
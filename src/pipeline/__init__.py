@@ -0,0 +1,7 @@
+"""Pipeline execution: shared run context, topic processing and daemon mode."""
+
+from .context import RunContext
+from .runner import process_topic, run_pipeline, write_outputs
+from .rerank import rerank_runs
+
+__all__ = ['RunContext', 'process_topic', 'run_pipeline', 'write_outputs', 'rerank_runs']
@@ -0,0 +1,365 @@
+"""
+Multi-config batch runs sharing searches and AI verdicts.
+"""
+
+import copy
+import json
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from ..ai.llm_factory import create_llm
+from ..core.config import load_config
+from ..core.models import Result, SearchConfig
+from ..search.base import SearchProvider
+from ..search.providers import create_search_provider
+from ..search.query_builder import build_queries_for_topic
+from .context import RunContext, search_provider_key
+from .exclusions import apply_learned_exclusions
+
+
+logger = logging.getLogger(__name__)
+
+
+class CallUsage:
+    """Which configs asked for which call, to report what sharing saved."""
+
+    def __init__(self):
+        self.requests: Counter = Counter()
+        self.tenants: Dict[str, set] = {}
+
+    def add(self, tenant: Optional[str], key: str) -> None:
+        if tenant is None:
+            return
+        self.requests[tenant] += 1
+        self.tenants.setdefault(key, set()).add(tenant)
+
+    def summary(self) -> Dict[str, int]:
+        requested = sum(self.requests.values())
+        return {'requested': requested, 'executed': len(self.tenants), 'saved': requested - len(self.tenants)}
+
+    def shared_keys(self, tenant: str) -> int:
+        """Distinct calls of a config that other configs asked for too."""
+        return sum(1 for tenants in self.tenants.values() if tenant in tenants and len(tenants) > 1)
+
+
+class SearchPool:
+    """
+    Executes each distinct search once for every config in a batch.
+
+    Searches are identified by provider settings, query, result count,
+    depth and domain lists. Callers receive copies, since the pipeline
+    mutates results while ranking.
+    """
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+        self._providers: Dict[str, SearchProvider] = {}
+        self._results: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.usage = CallUsage()
+
+    def provider_for(self, config: SearchConfig, tenant: Optional[str]) -> "PooledSearchProvider":
+        """
+        Args:
+            config: SearchConfig with the provider settings
+            tenant: Config name the calls are counted for; None for prefetching
+        """
+        key = search_provider_key(config)
+        with self._lock:
+            if key not in self._providers:
+                self._providers[key] = create_search_provider(config, self.session)
+        return PooledSearchProvider(self, key, tenant)
+
+    def search(self, provider_key: str, tenant: Optional[str], **params: Any) -> List[Result]:
+        key = json.dumps([provider_key, params], sort_keys=True)
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._results[key] = future
+            self.usage.add(tenant, key)
+
+        if owner:
+            try:
+                future.set_result(self._providers[provider_key].search(**params))
+            except BaseException as e:
+                future.set_exception(e)
+        return copy.deepcopy(future.result())
+
+    def close(self) -> None:
+        for provider in self._providers.values():
+            provider.close()
+
+
+class PooledSearchProvider(SearchProvider):
+    """One config's view of a SearchPool."""
+
+    name = "pooled"
+
+    def __init__(self, pool: SearchPool, provider_key: str, tenant: Optional[str]):
+        self.pool = pool
+        self.provider_key = provider_key
+        self.tenant = tenant
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        search_depth: str = "basic",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None
+    ) -> List[Result]:
+        return self.pool.search(
+            self.provider_key,
+            self.tenant,
+            query=query,
+            max_results=max_results,
+            search_depth=search_depth,
+            include_domains=sorted(include_domains or []),
+            exclude_domains=sorted(exclude_domains or [])
+        )
+
+
+class VerdictPool:
+    """
+    Shares LLM replies for identical prompts across the configs of a batch.
+
+    A relevance prompt contains the topic name and keywords together with
+    the result's URL, title and text, so identical (url, content, topic
+    prompt) verdicts are requested once, even when several configs send the
+    prompt at the same time. Identical summary batches are shared the same
+    way.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, float], Any] = {}
+        self._replies: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.usage = CallUsage()
+
+    def llm_for(self, config: SearchConfig, tenant: str) -> "PooledLLM":
+        key = (config.ai_model, config.ai_temperature)
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = create_llm(config.ai_model, config.ai_temperature)
+        return PooledLLM(self, self._clients[key], key, tenant)
+
+    def invoke(self, llm: Any, request_key: str, tenant: str, messages: List[Any]) -> Any:
+        with self._lock:
+            future = self._replies.get(request_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._replies[request_key] = future
+            self.usage.add(tenant, request_key)
+
+        if owner:
+            try:
+                future.set_result(llm.invoke(messages))
+            except BaseException as e:
+                # Callers already waiting share the failure; later ones retry
+                with self._lock:
+                    del self._replies[request_key]
+                future.set_exception(e)
+        return future.result()
+
+
+class PooledLLM:
+    """One config's view of a VerdictPool, exposing invoke() and bind()."""
+
+    def __init__(
+        self,
+        pool: VerdictPool,
+        llm: Any,
+        model_key: Tuple[str, float],
+        tenant: str,
+        bound_kwargs: Optional[Dict[str, Any]] = None
+    ):
+        self.pool = pool
+        self.llm = llm
+        self.model_key = model_key
+        self.tenant = tenant
+        self.bound_kwargs = bound_kwargs or {}
+
+    def bind(self, **kwargs: Any) -> "PooledLLM":
+        return PooledLLM(
+            self.pool, self.llm.bind(**kwargs), self.model_key, self.tenant,
+            {**self.bound_kwargs, **kwargs}
+        )
+
+    def invoke(self, messages: List[Any]) -> Any:
+        request_key = json.dumps(
+            [self.model_key, self.bound_kwargs, [(m.type, m.content) for m in messages]],
+            sort_keys=True,
+            default=str
+        )
+        return self.pool.invoke(self.llm, request_key, self.tenant, messages)
+
+
+@dataclass
+class BatchMember:
+    """One configuration taking part in a batch."""
+    name: str
+    config: SearchConfig
+    context: RunContext
+
+
+def plan_searches(members: List[BatchMember]) -> Dict[str, int]:
+    """
+    Count planned and distinct searches across the batch.
+
+    Args:
+        members: Batch members with their effective configurations
+
+    Returns:
+        Dictionary with planned and unique search counts
+    """
+    planned = 0
+    unique = set()
+    for member in members:
+        config = member.config
+        for topic in config.topics:
+            for query in build_queries_for_topic(topic, config.min_year):
+                planned += 1
+                unique.add(json.dumps([
+                    search_provider_key(config), query, config.max_results_per_query,
+                    config.search_depth, sorted(config.include_domains), sorted(config.exclude_domains)
+                ]))
+    return {'planned': planned, 'unique': len(unique)}
+
+
+def _prefetch(member: BatchMember, searches: SearchPool) -> None:
+    config = member.config
+    provider = searches.provider_for(config, tenant=None)
+    for topic in config.topics:
+        for query in build_queries_for_topic(topic, config.min_year):
+            provider.search(
+                query=query,
+                max_results=config.max_results_per_query,
+                search_depth=config.search_depth,
+                include_domains=config.include_domains,
+                exclude_domains=config.exclude_domains
+            )
+
+
+def _unique_names(config_paths: List[str]) -> List[str]:
+    names = []
+    for path in config_paths:
+        name = Path(path).stem
+        suffix = 2
+        while name in names:
+            name = f"{Path(path).stem}_{suffix}"
+            suffix += 1
+        names.append(name)
+    return names
+
+
+def run_batch(
+    config_paths: List[str],
+    search_workers: int = 4,
+    write_files: bool = True
+) -> Dict[str, Any]:
+    """
+    Run several configurations jointly, sharing searches and AI verdicts.
+
+    All distinct searches of the batch run first, on search_workers threads.
+    Each configuration is then filtered, ranked and written separately, with
+    its own seen-URL history and outputs. Configurations that share an
+    output directory write to a subdirectory named after the config file.
+
+    Args:
+        config_paths: Paths to configuration files
+        search_workers: Threads used to execute the distinct searches
+        write_files: Write each configuration's reports
+
+    Returns:
+        Batch report: search plan, overall requested/executed/saved calls,
+        and per-config results, paths and shared call counts
+    """
+    # Imported here: src.api imports the pipeline package
+    from ..api import _PreparedRun
+
+    names = _unique_names(config_paths)
+    configs = [load_config(path) for path in config_paths]
+
+    output_dirs = Counter(config.output_dir for config in configs)
+    configs = [
+        replace(config, output_dir=str(Path(config.output_dir) / name))
+        if output_dirs[config.output_dir] > 1 else config
+        for name, config in zip(names, configs)
+    ]
+
+    session = requests.Session()
+    searches = SearchPool(session)
+    verdicts = VerdictPool()
+
+    members = []
+    for name, config in zip(names, configs):
+        context = RunContext(
+            session=session,
+            search_provider=searches.provider_for(config, name),
+            llm=verdicts.llm_for(config, name)
+        )
+        effective, _ = apply_learned_exclusions(config, context)
+        members.append(BatchMember(name, effective, context))
+
+    plan = plan_searches(members)
+    logger.info(
+        f"Batch of {len(members)} configs: {plan['planned']} searches planned, "
+        f"{plan['unique']} distinct"
+    )
+    with ThreadPoolExecutor(max_workers=max(1, search_workers)) as pool:
+        list(pool.map(lambda member: _prefetch(member, searches), members))
+
+    # Runs are finished later, once every config's sharing counts are known
+    runs = []
+    try:
+        for path, name, config, member in zip(config_paths, names, configs, members):
+            logger.info(f"\n{'='*60}\nBatch config: {name} ({path})\n{'='*60}")
+            prepared = _PreparedRun(config, member.context, 1, None, None, None)
+            runs.append((prepared, prepared.run_all()))
+    finally:
+        searches.close()
+        session.close()
+
+    report: Dict[str, Any] = {
+        'plan': plan,
+        'searches': searches.usage.summary(),
+        'ai_calls': verdicts.usage.summary(),
+        'configs': {}
+    }
+
+    # Outputs are written last so every config can report what it shared.
+    # finish() records the run and writes its delta report like a single run.
+    for path, name, (prepared, results_by_topic) in zip(config_paths, names, runs):
+        shared = {
+            'searches_shared': searches.usage.shared_keys(name),
+            'searches': searches.usage.requests[name],
+            'ai_calls_shared': verdicts.usage.shared_keys(name),
+            'ai_calls': verdicts.usage.requests[name]
+        }
+        notes = [
+            f"Batch run: {shared['searches_shared']} of {shared['searches']} searches and "
+            f"{shared['ai_calls_shared']} of {shared['ai_calls']} AI calls were shared with other configs"
+        ]
+        run = prepared.finish(results_by_topic, write_files, {'notes': notes, 'batch': shared})
+
+        report['configs'][name] = {
+            'path': path,
+            'results': {topic: len(results) for topic, results in run.results_by_topic.items()},
+            'paths': {kind: str(p) for kind, p in (run.paths or {}).items()},
+            **shared
+        }
+    logger.info(
+        f"Batch complete: {report['searches']['saved']} searches and "
+        f"{report['ai_calls']['saved']} AI calls saved by sharing"
+    )
+    return report
@@ -0,0 +1,227 @@
+"""
+Long-lived resources shared across pipeline runs.
+"""
+
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import requests
+
+from ..ai.classifier import RelevanceClassifier, VerdictLog, classifier_path
+from ..ai.llm_factory import create_llm
+from ..core.cache import DiskCache
+from ..core.cassette import get_active_cassette
+from ..core.history import ContentHistory
+from ..core.models import Result, SearchConfig
+from ..filters.cross_run_dedup import bootstrap_history, load_previous_urls
+from ..filters.domain_stats import DomainStats
+from ..filters.stage_graph import StageTimings
+from ..search.base import SearchProvider
+from ..search.content_fetcher import ContentFetcher
+from ..search.dates import config_min_date
+from ..search.providers import create_search_provider
+
+
+logger = logging.getLogger(__name__)
+
+
+def domain_stats_path(config: SearchConfig) -> str:
+    """Location of the per-domain statistics file for a configuration."""
+    return config.learned_exclusion.stats_file or str(Path(config.output_dir) / 'domain_stats.json')
+
+
+def search_provider_key(config: SearchConfig) -> str:
+    """Identity of the provider settings; equal keys can share one provider."""
+    return repr((
+        config.search_provider, config.tavily_api_url, config.brave_api_url,
+        config.brave_count, config.brave_freshness, config.hedging,
+        config_min_date(config) if config.date_pushdown else None
+    ))
+
+
+def history_path(config: SearchConfig) -> str:
+    """Location of the content history database for a configuration."""
+    return config.history.path or str(Path(config.output_dir) / 'history.sqlite')
+
+
+@dataclass
+class RunContext:
+    """
+    Clients and indexes reused between pipeline runs.
+    
+    One-shot runs create a fresh context; daemon mode keeps a single
+    context alive so the HTTP pool, LLM client and seen-URL index stay warm.
+    Clients and caches passed to the constructor (an LLM, search provider
+    or classifier without a key, a summary cache) are used as given. A
+    verdict log, when set, collects the LLM relevance verdicts of a run,
+    stage timings the time spent in each pipeline stage, a candidate log
+    the scored candidates of each topic, and a carried log the results
+    of each topic the cross-run filter dropped as already reported.
+    Parse stats, when set, count the run's verdict parse outcomes.
+    """
+    session: requests.Session = field(default_factory=requests.Session)
+    seen_urls: Optional[Set[str]] = None
+    llm: Any = None
+    llm_key: Optional[Tuple[str, float, int]] = None
+    search_provider: Optional[SearchProvider] = None
+    search_provider_key: Optional[str] = None
+    content_fetcher: Optional[ContentFetcher] = None
+    domain_stats: Optional[DomainStats] = None
+    history: Optional[ContentHistory] = None
+    summary_cache: Optional[DiskCache] = None
+    classifier: Optional[RelevanceClassifier] = None
+    classifier_key: Optional[Tuple[str, Optional[float]]] = None
+    verdict_log: Optional[VerdictLog] = None
+    stage_cache: Optional[DiskCache] = None
+    stage_timings: Optional[StageTimings] = None
+    # Topic name -> (scoring mode, scored candidates) for offline re-ranks
+    candidate_log: Optional[Dict[str, Tuple[str, List[Result]]]] = None
+    # Topic name -> results dropped as already reported, for delta reports
+    carried_log: Optional[Dict[str, List[Result]]] = None
+    # Model name -> relevance-verdict parse counters of the run
+    parse_stats: Optional[Dict[str, Counter]] = None
+    # Guards lazy initialisation; the HTTP service shares a context across threads
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+    
+    def get_llm(self, config: SearchConfig) -> Any:
+        """Return the cached LLM client, rebuilding it if the model settings or cassette changed."""
+        with self._lock:
+            if self.llm is not None and self.llm_key is None:
+                return self.llm
+            key = (config.ai_model, config.ai_temperature, id(get_active_cassette()))
+            if self.llm is None or self.llm_key != key:
+                self.llm = create_llm(config.ai_model, config.ai_temperature)
+                self.llm_key = key
+            return self.llm
+    
+    def get_search_provider(self, config: SearchConfig) -> SearchProvider:
+        """Return the cached search provider, rebuilding it if provider settings changed."""
+        with self._lock:
+            if self.search_provider is not None and self.search_provider_key is None:
+                return self.search_provider
+            key = search_provider_key(config)
+            if self.search_provider is None or self.search_provider_key != key:
+                if self.search_provider is not None:
+                    self.search_provider.close()
+                self.search_provider = create_search_provider(config, self.session)
+                self.search_provider_key = key
+            return self.search_provider
+    
+    def get_content_fetcher(self, config: SearchConfig) -> ContentFetcher:
+        """Return the cached page fetcher, rebuilding it if fetch settings changed."""
+        with self._lock:
+            if self.content_fetcher is None or self.content_fetcher.config != config.fetching:
+                self.content_fetcher = ContentFetcher(config.fetching, self.session)
+            return self.content_fetcher
+    
+    def get_summary_cache(self, config: SearchConfig) -> DiskCache:
+        """Return the summary cache, opening the configured directory on first use."""
+        with self._lock:
+            if self.summary_cache is None:
+                self.summary_cache = DiskCache(config.summary_cache_dir)
+            return self.summary_cache
+    
+    def get_stage_cache(self, config: SearchConfig) -> DiskCache:
+        """
+        Return the memo cache of pipeline stage outputs.
+
+        The configured directory is opened on first use, and entries unused
+        for longer than pipeline.cache_max_age_days are pruned then.
+        """
+        with self._lock:
+            if self.stage_cache is None:
+                self.stage_cache = DiskCache(config.pipeline.cache_dir)
+                self.stage_cache.prune(config.pipeline.cache_max_age_days * 86400)
+            return self.stage_cache
+    
+    def get_seen_urls(self, output_dir: str) -> Set[str]:
+        """Return the seen-URL index, scanning previous outputs on first use."""
+        with self._lock:
+            if self.seen_urls is None:
+                self.seen_urls = load_previous_urls(output_dir)
+            return self.seen_urls
+    
+    def get_domain_stats(self, config: SearchConfig) -> DomainStats:
+        """Return per-domain statistics, loading them from disk on first use."""
+        with self._lock:
+            if self.domain_stats is None:
+                self.domain_stats = DomainStats.load(domain_stats_path(config))
+            return self.domain_stats
+    
+    def get_history(self, config: SearchConfig) -> ContentHistory:
+        """Return the content history, opening (and first seeding) it on first use."""
+        with self._lock:
+            if self.history is None:
+                path = history_path(config)
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self.history = ContentHistory(path)
+                if not len(self.history):
+                    bootstrap_history(self.history, config.output_dir)
+            return self.history
+    
+    def get_classifier(self, config: SearchConfig) -> Optional[RelevanceClassifier]:
+        """Return the relevance classifier, reloading it when the model file changes; None without a model."""
+        with self._lock:
+            if self.classifier is not None and self.classifier_key is None:
+                return self.classifier
+            path = classifier_path(config)
+            try:
+                key = (path, Path(path).stat().st_mtime)
+            except OSError:
+                if self.classifier_key != (path, None):
+                    logger.warning(f"No relevance classifier at {path}; train one with --train-classifier")
+                self.classifier, self.classifier_key = None, (path, None)
+                return None
+            if self.classifier_key != key:
+                try:
+                    self.classifier = RelevanceClassifier.load(path)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Could not load relevance classifier {path}: {e}")
+                    self.classifier = None
+                self.classifier_key = key
+            return self.classifier
+    
+    def has_injected_clients(self) -> bool:
+        """Whether an LLM, search provider or classifier was passed in rather than built from the config."""
+        return (
+            (self.llm is not None and self.llm_key is None)
+            or (self.search_provider is not None and self.search_provider_key is None)
+            or (self.classifier is not None and self.classifier_key is None)
+        )
+    
+    def remember_results(self, results_by_topic: Dict[str, List[Result]]) -> None:
+        """Add URLs written by the latest run to the in-memory seen-URL index."""
+        if self.seen_urls is None:
+            return
+        for results in results_by_topic.values():
+            self.seen_urls.update(r.url for r in results)
+    
+    def reset_caches(self) -> None:
+        """
+        Drop caches and indexes opened under a previous configuration.
+
+        The summary and stage caches, seen-URL index, domain statistics and
+        content history are reopened on next use. Clients keyed on their
+        settings (LLM, search provider, page fetcher, classifier) rebuild
+        themselves when those change.
+        """
+        with self._lock:
+            if self.history is not None:
+                self.history.close()
+            self.summary_cache = None
+            self.stage_cache = None
+            self.seen_urls = None
+            self.domain_stats = None
+            self.history = None
+    
+    def close(self) -> None:
+        """Release pooled HTTP connections, provider threads and the history database."""
+        if self.search_provider is not None:
+            self.search_provider.close()
+        if self.history is not None:
+            self.history.close()
+        self.session.close()
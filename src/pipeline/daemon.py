@@ -0,0 +1,201 @@
+"""
+Long-running scheduler that executes the pipeline on the configured cadence.
+"""
+
+import calendar
+import logging
+import signal
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..core.config import WEEKDAYS, load_config
+from ..core.models import ScheduleConfig, SearchConfig
+from ..main import main
+from ..output.retention import apply_retention
+from .context import RunContext
+
+
+logger = logging.getLogger(__name__)
+
+
+def _day_in_month(year: int, month: int, day: int) -> int:
+    """The given day of month, or the month's last day when it is shorter."""
+    return min(day, calendar.monthrange(year, month)[1])
+
+
+def next_run_time(schedule: ScheduleConfig, now: datetime) -> datetime:
+    """
+    Compute the next scheduled run strictly after `now`.
+
+    Args:
+        schedule: ScheduleConfig with frequency, day and time of day
+        now: Reference time
+
+    Returns:
+        Datetime of the next run
+
+    Raises:
+        ValueError: For a frequency or day the config loader would reject
+    """
+    hour, minute = (int(part) for part in schedule.time.split(':', 1))
+
+    if schedule.frequency == 'hourly':
+        candidate = now.replace(minute=minute, second=0, microsecond=0)
+        if candidate <= now:
+            candidate += timedelta(hours=1)
+        return candidate
+
+    candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+    if schedule.frequency == 'daily':
+        if candidate <= now:
+            candidate += timedelta(days=1)
+        return candidate
+
+    if schedule.frequency == 'weekly':
+        weekday = WEEKDAYS.index(schedule.day)
+        candidate += timedelta(days=(weekday - now.weekday()) % 7)
+        if candidate <= now:
+            candidate += timedelta(days=7)
+        return candidate
+
+    if schedule.frequency == 'monthly':
+        day = int(schedule.day)
+        candidate = candidate.replace(day=_day_in_month(candidate.year, candidate.month, day))
+        if candidate <= now:
+            year, month = divmod(candidate.month, 12)
+            year, month = candidate.year + year, month + 1
+            candidate = candidate.replace(year=year, month=month, day=_day_in_month(year, month, day))
+        return candidate
+
+    raise ValueError(f"Unsupported schedule frequency: {schedule.frequency}")
+
+
+class ResearchDaemon:
+    """
+    Runs the research pipeline on the `schedule:` cadence from config.yaml.
+
+    The daemon keeps one RunContext for its lifetime, reloads the config
+    file when it changes and applies output retention on a background thread.
+    """
+
+    def __init__(
+        self,
+        config_path: str = "config.yaml",
+        poll_interval: float = 30.0,
+        run_func: Optional[Callable[[str, RunContext], None]] = None
+    ):
+        """
+        Args:
+            config_path: Path to configuration file
+            poll_interval: Seconds between config-change and schedule checks
+            run_func: Pipeline entry point, defaults to src.main.main
+        """
+        self.config_path = config_path
+        self.poll_interval = poll_interval
+        self.run_func = run_func or main
+        self.context = RunContext()
+        self.config: SearchConfig = load_config(config_path)
+        self.config_mtime = self._read_mtime()
+        self.next_run = next_run_time(self.config.schedule, datetime.now())
+        self._stop = threading.Event()
+        self._retention_due = threading.Event()
+        self._retention_thread: Optional[threading.Thread] = None
+
+    def _read_mtime(self) -> float:
+        return Path(self.config_path).stat().st_mtime
+
+    def reload_config_if_changed(self) -> bool:
+        """
+        Reload config.yaml if it was modified since the last load.
+
+        Returns:
+            True if a new configuration was loaded
+        """
+        try:
+            mtime = self._read_mtime()
+        except OSError as e:
+            logger.warning(f"Cannot stat {self.config_path}: {e}")
+            return False
+
+        if mtime == self.config_mtime:
+            return False
+
+        try:
+            config = load_config(self.config_path)
+        except Exception as e:
+            logger.error(f"Config reload failed, keeping previous configuration: {e}")
+            self.config_mtime = mtime
+            return False
+
+        self.config = config
+        self.config_mtime = mtime
+        # Caches and indexes were opened under the old settings
+        self.context.reset_caches()
+        self.next_run = next_run_time(config.schedule, datetime.now())
+        logger.info(f"Configuration reloaded, next run at {self.next_run:%Y-%m-%d %H:%M}")
+        return True
+
+    def run_once(self) -> None:
+        """Execute the pipeline once with the warm context."""
+        logger.info("Starting scheduled research run")
+        try:
+            self.run_func(self.config_path, self.context)
+        except Exception as e:
+            logger.error(f"Scheduled run failed: {e}", exc_info=True)
+        finally:
+            self._retention_due.set()
+
+    def _retention_loop(self) -> None:
+        while not self._stop.is_set():
+            self._retention_due.wait(timeout=3600)
+            self._retention_due.clear()
+            if self._stop.is_set():
+                break
+
+            schedule = self.config.schedule
+            try:
+                apply_retention(
+                    self.config.output_dir,
+                    days_to_keep=schedule.retention_days,
+                    archive=schedule.archive_previous
+                )
+            except Exception as e:
+                logger.warning(f"Output retention failed: {e}")
+
+    def stop(self, *_args) -> None:
+        """Request a graceful shutdown."""
+        self._stop.set()
+        self._retention_due.set()
+
+    def run_forever(self) -> None:
+        """Block, running the pipeline whenever the schedule is due."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        self._retention_thread = threading.Thread(
+            target=self._retention_loop, name="retention", daemon=True
+        )
+        self._retention_thread.start()
+        self._retention_due.set()
+
+        logger.info(f"Daemon started, next run at {self.next_run:%Y-%m-%d %H:%M}")
+
+        try:
+            while not self._stop.is_set():
+                self.reload_config_if_changed()
+
+                now = datetime.now()
+                if now >= self.next_run:
+                    self.run_once()
+                    self.next_run = next_run_time(self.config.schedule, datetime.now())
+                    logger.info(f"Next run at {self.next_run:%Y-%m-%d %H:%M}")
+                    continue
+
+                wait_seconds = (self.next_run - now).total_seconds()
+                self._stop.wait(timeout=min(self.poll_interval, wait_seconds))
+        finally:
+            self.context.close()
+            logger.info("Daemon stopped")
@@ -0,0 +1,122 @@
+"""
+Learned domain exclusions applied before search.
+"""
+
+import logging
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.cassette import Cassette
+from ..core.models import SearchConfig
+from ..filters.domain_stats import normalize_domain
+from .context import RunContext, domain_stats_path
+
+
+logger = logging.getLogger(__name__)
+
+
+def apply_learned_exclusions(
+    config: SearchConfig,
+    context: RunContext,
+    cassette: Optional[Cassette] = None
+) -> Tuple[SearchConfig, Dict[str, Any]]:
+    """
+    Add domains that rarely pass AI filtering to the search exclude list.
+
+    Domains listed under include_domains are never excluded. A recorded run
+    stores the learned list in the cassette so a replay sends the same
+    search payloads.
+
+    Args:
+        config: SearchConfig object
+        context: RunContext holding the domain statistics
+        cassette: Optional active cassette
+
+    Returns:
+        Tuple of (config with the extended exclude list, exclusion report)
+    """
+    settings = config.learned_exclusion
+    stats = context.get_domain_stats(config)
+
+    if cassette is not None and cassette.replaying:
+        learned = cassette.metadata.get('learned_exclusions', [])
+    elif settings.enabled:
+        protected = {normalize_domain(d) for d in config.include_domains + config.exclude_domains}
+        learned = [
+            domain for domain in stats.learned_exclusions(settings.min_samples, settings.max_pass_rate)
+            if domain not in protected
+        ]
+    else:
+        learned = []
+
+    if cassette is not None and cassette.recording:
+        cassette.metadata['learned_exclusions'] = learned
+
+    report = {
+        'domains': [
+            {
+                'domain': domain,
+                'pass_rate': round(stats.pass_rate(domain), 3),
+                'ai_scored': round(stats.domains.get(domain, {}).get('ai_scored', 0))
+            }
+            for domain in learned
+        ],
+        'estimated_savings': stats.estimate_savings(learned),
+    }
+
+    if learned:
+        logger.info(f"Excluding {len(learned)} learned low-yield domain(s): {', '.join(learned)}")
+        config = replace(config, exclude_domains=config.exclude_domains + learned)
+
+    return config, report
+
+
+def finish_domain_stats(
+    config: SearchConfig,
+    context: RunContext,
+    report: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Persist this run's domain statistics and build the run metadata.
+
+    Args:
+        config: SearchConfig object
+        context: RunContext holding the domain statistics
+        report: Exclusion report from apply_learned_exclusions()
+
+    Returns:
+        Run metadata with human-readable notes and the exclusion report
+    """
+    stats = context.get_domain_stats(config)
+    savings = report['estimated_savings']
+
+    stats.finish_run(config.learned_exclusion.decay)
+    if report['domains']:
+        stats.add_savings(savings)
+    stats.save(domain_stats_path(config))
+
+    report['cumulative_savings'] = dict(stats.savings)
+    return {'notes': exclusion_notes(report), 'domain_exclusion': report}
+
+
+def exclusion_notes(report: Dict[str, Any]) -> List[str]:
+    """Human-readable summary lines for an exclusion report."""
+    if not report['domains']:
+        return []
+
+    savings = report['estimated_savings']
+    total = report.get('cumulative_savings', {})
+    listed = ', '.join(
+        f"{d['domain']} ({d['pass_rate']:.0%} of {d['ai_scored']})" for d in report['domains']
+    )
+    notes = [
+        f"Learned exclusions: {listed}",
+        f"Estimated savings this run: {savings['llm_calls']:.0f} AI verdicts "
+        f"(~{savings['tokens']:,.0f} tokens), {savings['result_slots']:.0f} search result slots",
+    ]
+    if total.get('runs'):
+        notes.append(
+            f"Estimated savings over {total['runs']} run(s): {total['llm_calls']:.0f} AI verdicts "
+            f"(~{total['tokens']:,.0f} tokens)"
+        )
+    return notes
@@ -0,0 +1,174 @@
+"""
+Multi-process execution mode that shards topics across a worker pool.
+"""
+
+import logging
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..ai.analyzer import merge_parse_stats
+from ..ai.classifier import VerdictLog
+from ..core.cassette import Cassette, activate_cassette, get_active_cassette
+from ..core.history import ContentHistory, HistoryRow
+from ..core.models import Result, SearchConfig
+from ..filters.domain_stats import DomainStats
+from ..search.query_builder import build_queries_for_topic
+from .context import RunContext
+from ..filters.ranking import summarize_final_results
+from ..filters.selection import select_results
+from ..filters.stage_graph import StageTimings
+from .runner import rank_topic_results, search_query
+
+
+logger = logging.getLogger(__name__)
+
+# Per-process state installed by the pool initializer
+_WORKER_CONFIG: Optional[SearchConfig] = None
+_WORKER_CONTEXT: Optional[RunContext] = None
+_TRACK_DOMAINS = False
+_LOG_VERDICTS = False
+_KEEP_CANDIDATES = False
+_LOG_CARRIED = False
+
+
+def _init_worker(
+    config: SearchConfig,
+    seen_urls: Set[str],
+    cassette: Optional[Cassette],
+    track_domains: bool = False,
+    history: Optional[ContentHistory] = None,
+    log_verdicts: bool = False,
+    keep_candidates: bool = False,
+    log_carried: bool = False
+) -> None:
+    """Give each worker its own clients and a read-only copy of the seen-URL index."""
+    global _WORKER_CONFIG, _WORKER_CONTEXT, _TRACK_DOMAINS, _LOG_VERDICTS, _KEEP_CANDIDATES, _LOG_CARRIED
+    _WORKER_CONFIG = config
+    _WORKER_CONTEXT = RunContext(seen_urls=frozenset(seen_urls), history=history)
+    _TRACK_DOMAINS = track_domains
+    _LOG_VERDICTS = log_verdicts
+    _KEEP_CANDIDATES = keep_candidates
+    _LOG_CARRIED = log_carried
+    activate_cassette(cassette)
+
+
+def _search_chunk(chunk: Tuple[int, str]) -> List[Result]:
+    _, query = chunk
+    return search_query(query, _WORKER_CONFIG, _WORKER_CONTEXT)
+
+
+def _rank_shard(shard: Tuple[int, List[Result]]) -> Tuple[
+    List[Result], Optional[DomainStats], List[HistoryRow], Optional[VerdictLog], StageTimings,
+    Optional[Dict[str, Tuple[str, List[Result]]]], Optional[Dict[str, List[Result]]], Dict[str, Counter]
+]:
+    topic_index, all_results = shard
+    topic = _WORKER_CONFIG.topics[topic_index]
+    # Per-task domain counts, staged history rows, verdicts, timings,
+    # candidates, carried-over results and parse counters travel back to the parent
+    _WORKER_CONTEXT.domain_stats = DomainStats() if _TRACK_DOMAINS else None
+    _WORKER_CONTEXT.verdict_log = VerdictLog() if _LOG_VERDICTS else None
+    _WORKER_CONTEXT.stage_timings = StageTimings()
+    _WORKER_CONTEXT.candidate_log = {} if _KEEP_CANDIDATES else None
+    _WORKER_CONTEXT.carried_log = {} if _LOG_CARRIED else None
+    _WORKER_CONTEXT.parse_stats = defaultdict(Counter)
+    ranked = rank_topic_results(topic, all_results, _WORKER_CONFIG, _WORKER_CONTEXT, limit=False)
+    history = _WORKER_CONTEXT.history
+    return (
+        ranked,
+        _WORKER_CONTEXT.domain_stats,
+        history.take_pending() if history is not None else [],
+        _WORKER_CONTEXT.verdict_log,
+        _WORKER_CONTEXT.stage_timings,
+        _WORKER_CONTEXT.candidate_log,
+        _WORKER_CONTEXT.carried_log,
+        _WORKER_CONTEXT.parse_stats
+    )
+
+
+def _summarize_shard(results: List[Result]) -> List[Result]:
+    summarize_final_results(results, _WORKER_CONFIG, _WORKER_CONTEXT)
+    return results
+
+
+def run_pipeline_parallel(
+    config: SearchConfig,
+    context: RunContext,
+    workers: int
+) -> Dict[str, List[Result]]:
+    """
+    Process every configured topic on a pool of worker processes.
+
+    Searches are sharded as topic x query chunks, then each topic's combined
+    results are filtered and scored in its own task. Chunks are merged back in
+    configuration and query order, so the output matches the serial path.
+    The final selection across topics runs in the parent; the selected
+    results are summarized on the pool again, one task per topic.
+
+    Args:
+        config: SearchConfig object
+        context: RunContext whose seen-URL index is shared with the workers;
+            domain statistics, history rows, verdicts, stage timings,
+            candidates, carried-over results and parse counters collected by the workers are merged into it
+        workers: Number of worker processes
+
+    Returns:
+        Dictionary mapping topic names to ranked result lists
+    """
+    seen_urls = context.get_seen_urls(config.output_dir)
+    # Workers open their own connection to the history database for lookups
+    history = context.get_history(config) if config.history.enabled else None
+
+    chunks = [
+        (topic_index, query)
+        for topic_index, topic in enumerate(config.topics)
+        for query in build_queries_for_topic(topic, config.min_year)
+    ]
+    logger.info(
+        f"Running {len(config.topics)} topics ({len(chunks)} queries) "
+        f"on {workers} worker processes"
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(
+            config, seen_urls, get_active_cassette(), context.domain_stats is not None, history,
+            context.verdict_log is not None, context.candidate_log is not None,
+            context.carried_log is not None
+        )
+    ) as pool:
+        # Phase 1: searches, merged per topic in query order
+        results_per_topic: List[List[Result]] = [[] for _ in config.topics]
+        for (topic_index, _), results in zip(chunks, pool.map(_search_chunk, chunks)):
+            results_per_topic[topic_index].extend(results)
+
+        # Phase 2: filtering and ranking, one task per topic
+        shards = list(enumerate(results_per_topic))
+        ranked = []
+        for results, stats, history_rows, verdict_log, timings, candidates, carried, parse_stats in pool.map(
+            _rank_shard, shards
+        ):
+            ranked.append(results)
+            if candidates is not None:
+                context.candidate_log.update(candidates)
+            if carried is not None:
+                context.carried_log.update(carried)
+            if context.parse_stats is not None:
+                merge_parse_stats(context.parse_stats, parse_stats)
+            if context.stage_timings is not None:
+                context.stage_timings.merge(timings)
+            if verdict_log is not None:
+                context.verdict_log.merge(verdict_log)
+            if stats is not None:
+                context.domain_stats.merge(stats)
+            if history is not None:
+                history.pending.extend(history_rows)
+
+        # Phase 3: final selection across topics, then summaries per topic
+        selected = select_results(
+            {topic.name: results for topic, results in zip(config.topics, ranked)}, config
+        )
+        summarized = list(pool.map(_summarize_shard, selected.values()))
+
+    return dict(zip(selected, summarized))
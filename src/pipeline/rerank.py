@@ -0,0 +1,152 @@
+"""
+Offline re-ranking of stored runs with the current configuration.
+"""
+
+import logging
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..ai.summarizer import apply_cached_summaries
+from ..core.cache import DiskCache
+from ..core.models import Result, SearchConfig, Topic, result_from_dict, result_to_dict
+from ..filters.ranking import build_stage_graph
+from ..filters.selection import select_results
+from ..filters.stage_graph import StageRun
+from ..filters.stages import DEFAULT_STAGES
+from ..output.archive import load_run_data, results_from_run_data, stored_run_ids
+from .runner import write_outputs
+
+
+logger = logging.getLogger(__name__)
+
+# Topic name -> (scoring mode, scored candidates), as collected in RunContext.candidate_log
+CandidateLog = Dict[str, Tuple[str, List[Result]]]
+
+
+def candidates_to_dict(log: CandidateLog) -> Dict[str, Dict[str, Any]]:
+    """Serialize a run's candidate log for metadata['candidates']."""
+    return {
+        topic: {'scoring': scoring, 'results': [result_to_dict(result) for result in results]}
+        for topic, (scoring, results) in log.items()
+    }
+
+
+def stored_candidates(data: Dict[str, Any]) -> CandidateLog:
+    """
+    Read the scored candidates of a stored run.
+
+    Runs written before candidates were stored only have their final
+    results, which are re-ranked in their place.
+
+    Args:
+        data: Run data as written by to_json_file
+
+    Returns:
+        Scoring mode and candidates per topic
+    """
+    stored = (data.get('metadata') or {}).get('candidates')
+    if stored is not None:
+        return {
+            topic: (entry['scoring'], [result_from_dict(item) for item in entry['results']])
+            for topic, entry in stored.items()
+        }
+    log = {}
+    for topic, results in results_from_run_data(data).items():
+        scoring = 'ai' if any(result.relevance_score for result in results) else 'date'
+        log[topic] = (scoring, results)
+    return log
+
+
+def _topic(config: SearchConfig, name: str) -> Topic:
+    for topic in config.topics:
+        if topic.name == name:
+            return topic
+    return Topic(name=name, keywords=[], search_variations=[])
+
+
+def rerank_run(config: SearchConfig, run_id: str) -> Dict[str, Path]:
+    """
+    Re-apply filtering, ranking, selection and reports to a stored run, offline.
+
+    The run's scored candidates go through the offline counterparts of the
+    configured stages: stored AI scores replace AI scoring, and fetching
+    and the cross-run filter are skipped. Summaries come from the stored
+    run or the summary cache. No search, page or LLM request is made.
+    Reports are written to <output_dir>/rerank/<run_id>/, away from the
+    run history.
+
+    Args:
+        config: Current SearchConfig
+        run_id: Stored run identifier (YYYYMMDD_HHMMSS)
+
+    Returns:
+        Dictionary mapping output kind to the written file path
+    """
+    data = load_run_data(config.output_dir, run_id)
+    log = stored_candidates(data)
+    if (data.get('metadata') or {}).get('candidates') is None:
+        logger.warning(f"Run {run_id} has no stored candidates; re-ranking its final results")
+
+    graph = build_stage_graph(tuple(config.pipeline.stages or DEFAULT_STAGES)).offline()
+    candidates_by_topic = {}
+    for topic_name, (scoring, candidates) in log.items():
+        run = StageRun(
+            config, _topic(config, topic_name),
+            use_ai=scoring == 'ai', heuristic=scoring == 'heuristic'
+        )
+        candidates_by_topic[topic_name] = graph.run({'results': candidates}, run)['results']
+    selected = select_results(candidates_by_topic, config)
+
+    # Summaries without LLM calls: from the stored run, then from the cache
+    if config.use_ai_filtering and config.generate_summaries:
+        stored = {
+            result.url: result.ai_summary
+            for results in results_from_run_data(data).values() for result in results
+        }
+        missing = []
+        for results in selected.values():
+            for result in results:
+                result.ai_summary = result.ai_summary or stored.get(result.url)
+                if result.ai_summary is None:
+                    missing.append(result)
+        if missing:
+            pending = apply_cached_summaries(missing, config.ai_model, DiskCache(config.summary_cache_dir))
+            if pending:
+                logger.info(f"{len(pending)} re-ranked results have no stored summary")
+
+    total = sum(len(candidates) for _, candidates in log.values())
+    kept = sum(len(results) for results in selected.values())
+    metadata = {
+        'notes': [
+            f"Re-ranked offline from run {run_id} with the current configuration: "
+            f"{kept} of {total} stored candidates selected"
+        ],
+        'rerank': {'source_run': run_id, 'candidates': total, 'selected': kept}
+    }
+    output_dir = Path(config.output_dir) / "rerank" / run_id
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return write_outputs(selected, replace(config, output_dir=str(output_dir)), metadata)
+
+
+def rerank_runs(config: SearchConfig, run_ids: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Path]]:
+    """
+    Re-rank several stored runs offline.
+
+    Args:
+        config: Current SearchConfig
+        run_ids: Run identifiers; None for every stored run
+
+    Returns:
+        Written paths per run id; runs that cannot be read are logged and skipped
+    """
+    if run_ids is None:
+        run_ids = stored_run_ids(config.output_dir)
+    paths = {}
+    for run_id in run_ids:
+        try:
+            paths[run_id] = rerank_run(config, run_id)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not re-rank run {run_id}: {e}")
+    logger.info(f"Re-ranked {len(paths)} of {len(run_ids)} runs")
+    return paths
@@ -0,0 +1,238 @@
+"""
+Topic processing and output writing shared by every entry point.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+from ..core.models import Result, SearchConfig, Topic
+from ..search.query_builder import build_queries_for_topic
+from ..filters.ranking import rank_and_filter_results, summarize_final_results
+from ..filters.selection import select_results
+from ..output.markdown_generator import to_markdown_report
+from ..output.json_generator import to_json_file
+from ..output.archive import load_run_data, results_from_run_data
+from ..output.delta_report import TopicDelta, to_delta_report
+from ..ui.browser_view import generate_browser_view
+from .context import RunContext
+
+
+logger = logging.getLogger(__name__)
+
+
+def search_query(query: str, config: SearchConfig, context: RunContext) -> List[Result]:
+    """
+    Execute a single search query with the configured search provider.
+    
+    Args:
+        query: Search query string
+        config: SearchConfig object
+        context: RunContext with shared clients and indexes
+        
+    Returns:
+        List of raw results
+    """
+    provider = context.get_search_provider(config)
+    return provider.search(
+        query=query,
+        max_results=config.max_results_per_query,
+        search_depth=config.search_depth,
+        include_domains=config.include_domains,
+        exclude_domains=config.exclude_domains
+    )
+
+
+def rank_topic_results(
+    topic: Topic,
+    all_results: List[Result],
+    config: SearchConfig,
+    context: RunContext,
+    use_ai: Optional[bool] = None,
+    heuristic: bool = False,
+    limit: bool = True
+) -> List[Result]:
+    """
+    Filter and rank the combined search results of a topic.
+    
+    Args:
+        topic: Topic the results belong to
+        all_results: Raw results from every query of the topic, in query order
+        config: SearchConfig object
+        context: RunContext with shared clients and indexes
+        use_ai: Override for AI scoring (default: config.use_ai_filtering)
+        heuristic: Rank by heuristic score when AI scoring is off
+        limit: Cut to top_n_results and summarize; False returns every
+            scored candidate for finalize_results()
+        
+    Returns:
+        Filtered and ranked list of results
+    """
+    logger.info(f"Total results from all queries: {len(all_results)}")
+    
+    return rank_and_filter_results(
+        all_results,
+        config,
+        topic,
+        use_ai=config.use_ai_filtering if use_ai is None else use_ai,
+        context=context,
+        heuristic=heuristic,
+        limit=limit
+    )
+
+
+def search_topic(topic: Topic, config: SearchConfig, context: RunContext) -> List[Result]:
+    """
+    Search, filter and score the candidates of a single topic.
+    
+    Args:
+        topic: Topic to research
+        config: SearchConfig object
+        context: RunContext with shared clients and indexes
+        
+    Returns:
+        Every scored candidate, best first, before the final selection
+    """
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Processing topic: {topic.name}")
+    logger.info(f"{'='*60}")
+    
+    # Build queries and execute searches
+    all_results = []
+    for query in build_queries_for_topic(topic, config.min_year):
+        all_results.extend(search_query(query, config, context))
+    
+    return rank_topic_results(topic, all_results, config, context, limit=False)
+
+
+def finalize_results(
+    candidates_by_topic: Dict[str, List[Result]],
+    config: SearchConfig,
+    context: RunContext,
+    skip_summaries: Collection[str] = ()
+) -> Dict[str, List[Result]]:
+    """
+    Select the final results across topics and summarize them.
+    
+    Args:
+        candidates_by_topic: Scored candidates per topic
+        config: SearchConfig object
+        context: RunContext with shared clients and caches
+        skip_summaries: Topics whose results are not summarized (e.g.
+            ranked without AI to meet a deadline)
+        
+    Returns:
+        Dictionary mapping topic names to final result lists
+    """
+    selected = select_results(candidates_by_topic, config)
+    for topic_name, results in selected.items():
+        if topic_name not in skip_summaries:
+            summarize_final_results(results, config, context)
+    return selected
+
+
+def process_topic(topic: Topic, config: SearchConfig, context: RunContext) -> List[Result]:
+    """
+    Search, filter, rank and select the final results for a single topic.
+    
+    Args:
+        topic: Topic to research
+        config: SearchConfig object
+        context: RunContext with shared clients and indexes
+        
+    Returns:
+        Filtered and ranked list of results
+    """
+    candidates = search_topic(topic, config, context)
+    return finalize_results({topic.name: candidates}, config, context)[topic.name]
+
+
+def run_pipeline(config: SearchConfig, context: RunContext) -> Dict[str, List[Result]]:
+    """
+    Process every configured topic, then select the final results across topics.
+    
+    Args:
+        config: SearchConfig object
+        context: RunContext with shared clients and indexes
+        
+    Returns:
+        Dictionary mapping topic names to ranked result lists
+    """
+    candidates_by_topic = {}
+    
+    for topic in config.topics:
+        candidates_by_topic[topic.name] = search_topic(topic, config, context)
+    
+    return finalize_results(candidates_by_topic, config, context)
+
+
+def write_outputs(
+    results_by_topic: Dict[str, List[Result]],
+    config: SearchConfig,
+    metadata: Optional[Dict[str, Any]] = None,
+    delta: Optional[Tuple[Optional[str], Dict[str, TopicDelta]]] = None
+) -> Dict[str, Path]:
+    """
+    Write the Markdown, JSON and browser outputs for a run.
+    
+    Args:
+        results_by_topic: Dictionary mapping topic names to result lists
+        config: SearchConfig object
+        metadata: Optional run metadata stored in the JSON and shown as
+            notes in the Markdown report
+        delta: Optional (baseline run id, per-topic deltas) from
+            compute_delta(), written as a delta report
+        
+    Returns:
+        Dictionary mapping output kind to the written file path
+    """
+    output_dir = Path(config.output_dir)
+    output_dir.mkdir(exist_ok=True)
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    paths = {
+        'markdown': output_dir / f"research_report_{timestamp}.md",
+        'json': output_dir / f"research_data_{timestamp}.json",
+        'browser': output_dir / f"research_browser_{timestamp}.html",
+    }
+    
+    to_markdown_report(results_by_topic, config, str(paths['markdown']), metadata)
+    to_json_file(results_by_topic, str(paths['json']), metadata)
+    generate_browser_view(results_by_topic, str(paths['browser']))
+    if delta is not None:
+        paths['delta'] = output_dir / f"research_delta_{timestamp}.md"
+        to_delta_report(delta[0], delta[1], results_by_topic, str(paths['delta']))
+    
+    return paths
+
+
+def regenerate_reports(config: SearchConfig, run_id: str) -> Dict[str, Path]:
+    """
+    Rebuild the Markdown and browser reports of a stored run.
+    
+    The run is read from its live JSON file or, once compacted, from the archive.
+    
+    Args:
+        config: SearchConfig object
+        run_id: Run identifier (YYYYMMDD_HHMMSS)
+        
+    Returns:
+        Dictionary mapping output kind to the written file path
+    """
+    data = load_run_data(config.output_dir, run_id)
+    results_by_topic = results_from_run_data(data)
+    
+    output_dir = Path(config.output_dir)
+    output_dir.mkdir(exist_ok=True)
+    
+    paths = {
+        'markdown': output_dir / f"research_report_{run_id}.md",
+        'browser': output_dir / f"research_browser_{run_id}.html",
+    }
+    
+    to_markdown_report(results_by_topic, config, str(paths['markdown']), data.get('metadata'))
+    generate_browser_view(results_by_topic, str(paths['browser']))
+    
+    return paths
@@ -0,0 +1,331 @@
+"""
+Priority- and deadline-aware topic scheduling.
+"""
+
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.models import Result, SearchConfig, Topic
+from ..search.query_builder import build_queries_for_topic
+from .context import RunContext
+from .runner import finalize_results, rank_topic_results, search_query
+
+
+logger = logging.getLogger(__name__)
+
+# Cost guesses used until the run has measured its own
+DEFAULT_SECONDS_PER_QUERY = 3.0
+DEFAULT_SECONDS_PER_SCORED_RESULT = 1.5
+
+# Estimates are inflated by this factor before comparing with the time left
+SAFETY_FACTOR = 1.2
+
+
+@dataclass
+class TopicPlan:
+    """How much work a topic gets in this run."""
+    topic: Topic
+    queries: List[str]
+    total_queries: int
+    use_ai: bool
+    heuristic: bool = False
+    skipped: bool = False
+    seconds: float = 0.0
+
+    @property
+    def degradations(self) -> List[str]:
+        """Human-readable list of what was cut for this topic."""
+        if self.skipped:
+            return ["skipped"]
+        cuts = []
+        if len(self.queries) < self.total_queries:
+            cuts.append(f"{len(self.queries)} of {self.total_queries} queries")
+        if self.heuristic:
+            cuts.append("heuristic ranking")
+        return cuts
+
+    def to_dict(self) -> Dict[str, Any]:
+        if self.heuristic:
+            ranking = 'heuristic'
+        else:
+            ranking = 'ai' if self.use_ai else 'date'
+        return {
+            'topic': self.topic.name,
+            'priority': self.topic.priority,
+            'queries': 0 if self.skipped else len(self.queries),
+            'total_queries': self.total_queries,
+            'ranking': ranking,
+            'skipped': self.skipped,
+            'seconds': round(self.seconds, 2)
+        }
+
+
+class RunScheduler:
+    """
+    Orders topics by priority and fits lower-priority work into a deadline.
+
+    Priority-1 topics always get their full query set and AI scoring. Other
+    topics are planned against the time left, using per-query and per-result
+    costs measured earlier in the run: first with fewer queries, then with
+    heuristic ranking instead of AI scoring, and skipped once the deadline
+    has passed.
+    """
+
+    def __init__(
+        self,
+        config: SearchConfig,
+        deadline: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            config: SearchConfig object
+            deadline: Deadline on the clock's time scale, or None for no limit
+            clock: Monotonic clock function
+        """
+        self.config = config
+        self.deadline = deadline
+        self.clock = clock
+        self.plans: List[TopicPlan] = []
+        self._query_seconds = 0.0
+        self._queries = 0
+        self._raw_results = 0
+        self._scoring_seconds = 0.0
+        self._scored_results = 0
+
+    def order(self) -> List[Topic]:
+        """Topics by priority, keeping configuration order within a priority."""
+        return sorted(self.config.topics, key=lambda t: t.priority)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without one."""
+        if self.deadline is None:
+            return None
+        return self.deadline - self.clock()
+
+    def estimate(self, num_queries: int, use_ai: bool) -> float:
+        """Estimated seconds to search and rank a topic."""
+        if self._queries:
+            per_query = self._query_seconds / self._queries
+            results_per_query = self._raw_results / self._queries
+        else:
+            per_query = DEFAULT_SECONDS_PER_QUERY
+            results_per_query = self.config.max_results_per_query
+
+        seconds = num_queries * per_query
+        if use_ai:
+            if self._scored_results:
+                per_result = self._scoring_seconds / self._scored_results
+            else:
+                per_result = DEFAULT_SECONDS_PER_SCORED_RESULT
+            seconds += num_queries * results_per_query * per_result
+        return seconds * SAFETY_FACTOR
+
+    def plan(self, topic: Topic) -> TopicPlan:
+        """
+        Decide the queries and ranking mode for a topic.
+
+        Args:
+            topic: Topic about to be processed
+
+        Returns:
+            TopicPlan for the topic
+        """
+        queries = build_queries_for_topic(topic, self.config.min_year)
+        use_ai = self.config.use_ai_filtering
+        full = TopicPlan(topic, queries, len(queries), use_ai)
+
+        remaining = self.remaining()
+        if remaining is None or topic.priority <= 1:
+            return full
+        if remaining <= 0:
+            return TopicPlan(topic, [], len(queries), use_ai, skipped=True)
+
+        half = max(1, math.ceil(len(queries) / 2))
+        options = [(len(queries), use_ai), (half, use_ai)]
+        if use_ai:
+            options += [(half, False), (1, False)]
+        else:
+            options.append((1, False))
+
+        chosen = options[-1]
+        for num_queries, ai in options:
+            if self.estimate(num_queries, ai) <= remaining:
+                chosen = num_queries, ai
+                break
+
+        num_queries, ai = chosen
+        return TopicPlan(
+            topic,
+            queries[:num_queries],
+            len(queries),
+            use_ai=ai,
+            heuristic=use_ai and not ai
+        )
+
+    def run_topic(self, plan: TopicPlan, context: RunContext) -> List[Result]:
+        """
+        Search and rank a topic according to its plan, measuring costs.
+
+        Args:
+            plan: TopicPlan from plan()
+            context: RunContext with shared clients and indexes
+
+        Returns:
+            Every scored candidate, for finalize_results()
+        """
+        self.plans.append(plan)
+        if plan.skipped:
+            logger.warning(f"Deadline reached, skipping topic: {plan.topic.name}")
+            return []
+
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Processing topic: {plan.topic.name} (priority {plan.topic.priority})")
+        if plan.degradations:
+            logger.warning(f"Degraded to fit the deadline: {', '.join(plan.degradations)}")
+        logger.info(f"{'='*60}")
+
+        start = self.clock()
+        all_results = []
+        for query in plan.queries:
+            all_results.extend(search_query(query, self.config, context))
+        searched = self.clock()
+        self._query_seconds += searched - start
+        self._queries += len(plan.queries)
+        self._raw_results += len(all_results)
+
+        results = rank_topic_results(
+            plan.topic,
+            all_results,
+            self.config,
+            context,
+            use_ai=plan.use_ai,
+            heuristic=plan.heuristic,
+            limit=False
+        )
+        if plan.use_ai:
+            self._scoring_seconds += self.clock() - searched
+            self._scored_results += len(all_results)
+
+        plan.seconds = self.clock() - start
+        return results
+
+    def unsummarized(self) -> List[str]:
+        """Topics ranked without AI, whose results get no AI summaries."""
+        return [p.topic.name for p in self.plans if not p.use_ai]
+
+    def notes(self) -> List[str]:
+        """Report lines describing every degraded topic."""
+        return [
+            f"Degraded '{p.topic.name}' (priority {p.topic.priority}) to meet the deadline: "
+            f"{', '.join(p.degradations)}"
+            for p in self.plans if p.degradations
+        ]
+
+
+def run_scheduled(
+    config: SearchConfig,
+    context: RunContext,
+    scheduler: RunScheduler
+) -> Dict[str, List[Result]]:
+    """
+    Process topics in priority order under the scheduler's deadline.
+
+    Args:
+        config: SearchConfig object
+        context: RunContext with shared clients and indexes
+        scheduler: RunScheduler planning each topic
+
+    Returns:
+        Dictionary mapping topic names to ranked result lists, in
+        configuration order
+    """
+    candidates_by_topic = {}
+    for topic in scheduler.order():
+        candidates_by_topic[topic.name] = scheduler.run_topic(scheduler.plan(topic), context)
+
+    return finalize_results(
+        {topic.name: candidates_by_topic[topic.name] for topic in config.topics},
+        config,
+        context,
+        skip_summaries=scheduler.unsummarized()
+    )
+
+
+def parse_deadline(text: str, now: Optional[datetime] = None) -> datetime:
+    """
+    Parse a wall-clock deadline.
+
+    Args:
+        text: "HH:MM" (next occurrence) or an ISO 8601 date and time
+        now: Current time (default: datetime.now())
+
+    Returns:
+        Deadline as a naive local datetime
+    """
+    now = now or datetime.now()
+    if re.fullmatch(r'\d{1,2}:\d{2}', text):
+        hour, minute = map(int, text.split(':'))
+        deadline = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if deadline <= now:
+            deadline += timedelta(days=1)
+        return deadline
+    return datetime.fromisoformat(text)
+
+
+def parse_duration(text: str) -> float:
+    """
+    Parse a time budget such as "90", "90s", "20m" or "1.5h" into seconds.
+
+    Args:
+        text: Duration string; plain numbers are seconds
+
+    Returns:
+        Duration in seconds
+    """
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*', text.lower())
+    if not match:
+        raise ValueError(f"Invalid time budget: {text}")
+    value, unit = match.groups()
+    return float(value) * {'': 1, 's': 1, 'm': 60, 'h': 3600}[unit]
+
+
+def build_scheduler(
+    config: SearchConfig,
+    deadline: Optional[datetime] = None,
+    time_budget: Optional[float] = None
+) -> Optional[RunScheduler]:
+    """
+    Create a scheduler when a deadline or time budget applies.
+
+    The earlier of the deadline and now + budget wins. Without either, the
+    configured execution.time_budget_seconds is used; without that, None is
+    returned and topics run in configuration order with no time bound.
+
+    Args:
+        config: SearchConfig object
+        deadline: Optional wall-clock deadline
+        time_budget: Optional time budget in seconds
+
+    Returns:
+        RunScheduler or None
+    """
+    if time_budget is None and deadline is None:
+        time_budget = config.time_budget_seconds
+
+    limits = []
+    if time_budget is not None:
+        limits.append(float(time_budget))
+    if deadline is not None:
+        limits.append((deadline - datetime.now()).total_seconds())
+    if not limits:
+        return None
+
+    seconds = min(limits)
+    logger.info(f"Scheduling topics by priority with {seconds:.0f}s until the deadline")
+    return RunScheduler(config, deadline=time.monotonic() + seconds)
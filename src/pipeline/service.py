@@ -0,0 +1,348 @@
+"""
+Local HTTP service for on-demand topic research.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from ..core.models import HistoryConfig, Result, SearchConfig, Topic, result_to_dict
+from ..filters.stage_graph import StageTimings
+from .context import RunContext
+from .runner import process_topic
+
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceBusy(Exception):
+    """Raised when no execution slot frees up within the queue timeout."""
+
+
+class LRUCache:
+    """Bounded, thread-safe LRU cache whose entries expire after a TTL."""
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.clock() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+
+    The first caller runs the function; callers arriving while it is in
+    flight wait for and share its result (or exception).
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run func once per in-flight key.
+
+        Args:
+            key: Request identity
+            func: Zero-argument function producing the result
+
+        Returns:
+            Tuple of (result, shared) where shared is True for coalesced callers
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result(), False
+
+
+class ResearchService:
+    """
+    Runs single-topic research requests with coalescing, caching and a cap.
+
+    Each request searches and ranks one topic through the regular pipeline.
+    Identical requests in flight share one execution, recent responses are
+    served from an LRU cache, and at most max_concurrency executions run at
+    once; a request that cannot get a slot within the queue timeout fails
+    fast with ServiceBusy. Service requests do not update the cross-run
+    history, so previously reported articles are not filtered out.
+    """
+
+    def __init__(self, config: SearchConfig, context: Optional[RunContext] = None):
+        """
+        Args:
+            config: SearchConfig object; its service block sets the limits
+            context: Optional RunContext with shared clients and caches
+        """
+        self.config = replace(config, history=HistoryConfig(enabled=False))
+        self.context = context or RunContext()
+        # An empty seen-URL index keeps earlier reports from hiding results
+        self.context.seen_urls = set()
+        self.context.stage_timings = StageTimings()
+        settings = config.service
+        self.cache = LRUCache(settings.cache_size, settings.cache_ttl_seconds)
+        self.flight = SingleFlight()
+        self.queue_timeout = settings.queue_timeout_seconds
+        self.max_concurrency = settings.max_concurrency
+        self._slots = threading.BoundedSemaphore(settings.max_concurrency)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.metrics: Counter = Counter()
+        self.started = time.time()
+
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self.metrics[name] += amount
+
+    def topic_from_request(self, payload: Dict[str, Any]) -> Topic:
+        """
+        Resolve a request to a Topic.
+
+        A bare name matching a configured cluster uses that cluster; otherwise
+        the request describes an ad-hoc topic, searched with its `queries`
+        (default: the topic name itself).
+
+        Args:
+            payload: Request fields: topic, optional keywords and queries
+
+        Returns:
+            Topic object
+        """
+        name = str(payload.get('topic', '')).strip()
+        if not name:
+            raise ValueError("Missing 'topic'")
+
+        keywords = payload.get('keywords')
+        queries = payload.get('queries')
+        if keywords is None and queries is None:
+            for topic in self.config.topics:
+                if topic.name.lower() == name.lower():
+                    return topic
+
+        return Topic(name=name, keywords=list(keywords or []), search_variations=list(queries or [name]))
+
+    @staticmethod
+    def request_key(topic: Topic) -> str:
+        return json.dumps([topic.name, topic.keywords, topic.search_variations], sort_keys=True)
+
+    def research(self, topic: Topic) -> Dict[str, Any]:
+        """
+        Return ranked results for a topic, via cache, coalescing or execution.
+
+        Args:
+            topic: Topic to research
+
+        Returns:
+            Response dictionary with results and how they were served
+        """
+        self._count('requests')
+        key = self.request_key(topic)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._count('cache_hits')
+            return {**cached, 'served_from': 'cache'}
+
+        response, shared = self.flight.do(key, lambda: self._execute(key, topic))
+        if shared:
+            self._count('coalesced')
+            return {**response, 'served_from': 'coalesced'}
+        return {**response, 'served_from': 'execution'}
+
+    def _execute(self, key: str, topic: Topic) -> Dict[str, Any]:
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            self._count('rejected')
+            raise ServiceBusy(f"All {self.max_concurrency} execution slots busy")
+
+        with self._lock:
+            self._in_flight += 1
+        start = time.monotonic()
+        try:
+            results: List[Result] = process_topic(topic, self.config, self.context)
+        except Exception:
+            self._count('errors')
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+        elapsed = time.monotonic() - start
+        self._count('executions')
+        self._count('execution_seconds', elapsed)
+        response = {
+            'topic': topic.name,
+            'results': [result_to_dict(r) for r in results],
+            'elapsed_seconds': round(elapsed, 2)
+        }
+        self.cache.set(key, response)
+        return response
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            'status': 'ok',
+            'in_flight': self._in_flight,
+            'max_concurrency': self.max_concurrency,
+            'uptime_seconds': round(time.time() - self.started)
+        }
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        executions = self.metrics['executions']
+        return {
+            **{k: v for k, v in self.metrics.items() if k != 'execution_seconds'},
+            'in_flight': self._in_flight,
+            'cache_entries': len(self.cache),
+            'stage_timings': self.context.stage_timings.to_dict(),
+            'avg_execution_seconds': round(self.metrics['execution_seconds'] / executions, 2) if executions else 0.0
+        }
+
+
+def _make_handler(service: ResearchService):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _research(self, payload: Dict[str, Any]) -> None:
+            try:
+                topic = service.topic_from_request(payload)
+            except ValueError as e:
+                self._send(400, {'error': str(e)})
+                return
+            try:
+                self._send(200, service.research(topic))
+            except ServiceBusy as e:
+                self._send(503, {'error': str(e)}, {'Retry-After': str(int(service.queue_timeout) or 1)})
+            except Exception as e:
+                logger.error(f"Research request failed: {e}", exc_info=True)
+                self._send(500, {'error': str(e)})
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            if url.path == '/health':
+                self._send(200, service.health())
+            elif url.path == '/metrics':
+                self._send(200, service.metrics_snapshot())
+            elif url.path == '/research':
+                params = parse_qs(url.query)
+                payload = {'topic': params.get('topic', [''])[0]}
+                if 'q' in params:
+                    payload['queries'] = params['q']
+                self._research(payload)
+            else:
+                self._send(404, {'error': 'Not found'})
+
+        def do_POST(self) -> None:
+            if urlparse(self.path).path != '/research':
+                self._send(404, {'error': 'Not found'})
+                return
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                self._send(400, {'error': 'Invalid JSON body'})
+                return
+            if not isinstance(payload, dict):
+                self._send(400, {'error': 'Expected a JSON object'})
+                return
+            self._research(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format % args)
+
+    return Handler
+
+
+def create_server(service: ResearchService) -> ThreadingHTTPServer:
+    """
+    Bind an HTTP server for a service on its configured host and port.
+
+    Args:
+        service: ResearchService handling requests
+
+    Returns:
+        ThreadingHTTPServer (call serve_forever() to run it)
+    """
+    settings = service.config.service
+    server = ThreadingHTTPServer((settings.host, settings.port), _make_handler(service))
+    server.daemon_threads = True
+    return server
+
+
+def serve(config: SearchConfig, context: Optional[RunContext] = None) -> None:
+    """
+    Run the research service until interrupted.
+
+    Args:
+        config: SearchConfig object
+        context: Optional RunContext with shared clients and caches
+    """
+    service = ResearchService(config, context)
+    server = create_server(service)
+    host, port = server.server_address[:2]
+    logger.info(
+        f"Research service listening on http://{host}:{port} "
+        f"(max {service.max_concurrency} concurrent runs)"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.context.close()
+        logger.info("Research service stopped")
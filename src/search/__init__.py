@@ -2,5 +2,18 @@
 
 from .query_builder import build_queries_for_topic
 from .tavily_client import tavily_search
+from .brave_client import brave_search
+from .base import SearchProvider
+from .hedged import HedgedSearchProvider
+from .providers import TavilyProvider, BraveProvider, create_search_provider
 
-__all__ = ['build_queries_for_topic', 'tavily_search']
+__all__ = [
+    'build_queries_for_topic',
+    'tavily_search',
+    'brave_search',
+    'SearchProvider',
+    'TavilyProvider',
+    'BraveProvider',
+    'HedgedSearchProvider',
+    'create_search_provider'
+]
@@ -0,0 +1,29 @@
+"""
+Search provider interface.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from ..core.models import Result
+
+
+class SearchProvider(ABC):
+    """A web search backend returning normalized Result objects."""
+
+    name: str = "provider"
+    api_key_env: Optional[str] = None
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        search_depth: str = "basic",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None
+    ) -> List[Result]:
+        """Execute a search and return results."""
+
+    def close(self) -> None:
+        """Release provider resources."""
@@ -0,0 +1,186 @@
+"""
+Brave Search API integration.
+"""
+
+import os
+import logging
+import time
+from datetime import date
+from typing import List, Optional
+
+import requests
+
+from ..core.cassette import CassetteMiss, get_active_cassette
+from ..core.models import Result
+from .dates import result_date
+from .tavily_client import extract_domain
+
+
+logger = logging.getLogger(__name__)
+
+BRAVE_API_URL = "https://api.search.brave.com/res/v1/web/search"
+
+# Brave rejects longer queries
+MAX_QUERY_CHARS = 400
+
+
+def _with_sites(base: str, domains: List[str]) -> str:
+    return f"{base} ({' OR '.join('site:' + domain for domain in domains)})"
+
+
+def domain_queries(
+    query: str,
+    include_domains: Optional[List[str]] = None,
+    exclude_domains: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Express domain lists as site: operators, since Brave has no domain parameters.
+
+    Exclusions become -site: operators unless they would overflow the query,
+    in which case they are only applied to the results. Inclusions are split
+    into as many OR-groups as needed to keep each query within
+    MAX_QUERY_CHARS; each group is a separate request.
+
+    Args:
+        query: Search query string
+        include_domains: Optional list of domains to include
+        exclude_domains: Optional list of domains to exclude
+
+    Returns:
+        Queries to send, in order
+    """
+    base = query + ''.join(f" -site:{domain}" for domain in exclude_domains or [])
+    if len(base) > MAX_QUERY_CHARS:
+        base = query
+    if not include_domains:
+        return [base]
+
+    queries, group = [], []
+    for domain in include_domains:
+        if group and len(_with_sites(base, group + [domain])) > MAX_QUERY_CHARS:
+            queries.append(_with_sites(base, group))
+            group = []
+        group.append(domain)
+    queries.append(_with_sites(base, group))
+    return queries
+
+
+def brave_search(
+    query: str,
+    max_results: int = 10,
+    include_domains: Optional[List[str]] = None,
+    exclude_domains: Optional[List[str]] = None,
+    freshness: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    api_url: str = BRAVE_API_URL,
+    start_date: Optional[str] = None
+) -> List[Result]:
+    """
+    Execute a search using the Brave Search API.
+
+    Brave has no domain filter parameters, so include/exclude lists are sent
+    as site: operators (see domain_queries) and applied to the returned
+    results as well. A long include list takes one request per group of
+    domains; results are merged in group order up to max_results.
+
+    Args:
+        query: Search query string
+        max_results: Maximum number of results to return (Brave caps at 20)
+        include_domains: Optional list of domains to include
+        exclude_domains: Optional list of domains to exclude
+        freshness: Optional Brave freshness filter ("pd", "pw", "pm", "py")
+        session: Optional requests.Session to reuse pooled connections
+        api_url: Search endpoint, overridable for stand-in servers
+        start_date: Optional YYYY-MM-DD; without an explicit freshness,
+            only results published since are requested
+
+    Returns:
+        List of Result objects
+    """
+    cassette = get_active_cassette()
+    replaying = cassette is not None and cassette.replaying
+
+    api_key = os.getenv('BRAVE_API_KEY')
+    if not api_key and not replaying:
+        logger.error("BRAVE_API_KEY not found in environment variables")
+        raise ValueError("BRAVE_API_KEY must be set in environment")
+
+    headers = {
+        "Accept": "application/json",
+        "X-Subscription-Token": api_key
+    }
+
+    queries = domain_queries(query, include_domains, exclude_domains)
+    if len(queries) > 1:
+        logger.info(f"Executing Brave search: '{query}' as {len(queries)} site-restricted queries")
+    else:
+        logger.info(f"Executing Brave search: '{query}'")
+
+    try:
+        results = []
+        seen_urls = set()
+        for q in queries:
+            params = {
+                "q": q,
+                "count": min(max_results, 20)
+            }
+            # Recorded with an open end, so replays on later days still match
+            request_record = dict(params)
+            if freshness:
+                params["freshness"] = request_record["freshness"] = freshness
+            elif start_date:
+                params["freshness"] = f"{start_date}to{date.today().isoformat()}"
+                request_record["freshness"] = f"{start_date}to"
+
+            if replaying:
+                data = cassette.play("brave", request_record)
+            else:
+                start = time.monotonic()
+                http = session or requests
+                response = http.get(api_url, params=params, headers=headers, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+                if cassette is not None:
+                    cassette.record("brave", request_record, data, time.monotonic() - start)
+
+            for item in data.get('web', {}).get('results', []):
+                domain = extract_domain(item.get('url', ''))
+
+                if exclude_domains and _matches_domain(domain, exclude_domains):
+                    continue
+                if include_domains and not _matches_domain(domain, include_domains):
+                    continue
+                if item.get('url', '') in seen_urls:
+                    continue
+                seen_urls.add(item.get('url', ''))
+
+                description = item.get('description', '')
+                published_date = result_date(
+                    item.get('page_age') or item.get('age'), item.get('title', '') + ' ' + description
+                )
+
+                results.append(Result(
+                    title=item.get('title', 'No title'),
+                    url=item.get('url', ''),
+                    snippet=description[:500],
+                    published_date=published_date,
+                    domain=domain
+                ))
+            if len(results) >= max_results:
+                break
+
+        results = results[:max_results]
+        logger.info(f"Found {len(results)} results for query")
+        return results
+
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Brave API request failed: {e}")
+        return []
+    except CassetteMiss as e:
+        logger.error(f"Brave replay failed: {e}")
+        return []
+
+
+def _matches_domain(domain: str, domains: List[str]) -> bool:
+    """Check whether a host equals or is a subdomain of any listed domain."""
+    return any(domain == d or domain.endswith('.' + d) for d in domains)
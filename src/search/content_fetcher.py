@@ -0,0 +1,154 @@
+"""
+Concurrent full-page fetching for candidate results.
+"""
+
+import codecs
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from ..core.cache import DiskCache
+from ..core.cassette import get_active_cassette
+from ..core.models import FetchConfig, Result
+from .text_extractor import MainTextExtractor
+
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (compatible; ResearchAutomationTool/2.0)"
+
+
+class ContentFetcher:
+    """
+    Download candidate pages and extract their main text.
+
+    Requests run on a bounded thread pool with a per-host concurrency limit.
+    Bodies are streamed, capped at `max_bytes` and parsed incrementally.
+    Extracted text is cached per URL and revalidated with ETag/Last-Modified.
+    """
+
+    def __init__(self, fetch_config: FetchConfig, session: Optional[requests.Session] = None):
+        """
+        Args:
+            fetch_config: FetchConfig with pool, size and cache settings
+            session: Optional shared requests.Session
+        """
+        self.config = fetch_config
+        self.session = session or requests.Session()
+        self.cache = DiskCache(fetch_config.cache_dir)
+        self._host_limits: Dict[str, threading.Semaphore] = defaultdict(
+            lambda: threading.Semaphore(fetch_config.per_host_limit)
+        )
+        self._lock = threading.Lock()
+
+    def _host_semaphore(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            return self._host_limits[host]
+
+    def fetch_all(self, results: List[Result]) -> None:
+        """
+        Fetch every result's page and set `content` and `word_count` in place.
+
+        Args:
+            results: Results to enrich; failed fetches are left unchanged
+        """
+        if not results:
+            return
+
+        logger.info(f"Fetching {len(results)} pages")
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as pool:
+            list(pool.map(self._fetch_result, results))
+
+        fetched = sum(1 for r in results if r.word_count is not None)
+        logger.info(f"Fetched content for {fetched}/{len(results)} pages")
+
+    def _fetch_result(self, result: Result) -> None:
+        try:
+            with self._host_semaphore(result.domain or ''):
+                page = self.fetch(result.url)
+        except Exception as e:
+            logger.debug(f"Fetch failed for {result.url}: {e}")
+            return
+
+        # No extracted text means the length is unknown, not zero
+        if page is not None and page['word_count']:
+            result.content = page['text']
+            result.word_count = page['word_count']
+
+    def fetch(self, url: str) -> Optional[Dict]:
+        """
+        Fetch one page, recording or replaying it when a cassette is active.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Dictionary with text and word_count, or None if not HTML
+        """
+        cassette = get_active_cassette()
+        if cassette is not None and cassette.replaying:
+            return cassette.play('page', {'url': url})
+
+        start = time.monotonic()
+        page = self._fetch_live(url)
+        if cassette is not None:
+            cassette.record('page', {'url': url}, page, time.monotonic() - start)
+        return page
+
+    def _fetch_live(self, url: str) -> Optional[Dict]:
+        """Fetch one page, using the cache when the server reports it unchanged."""
+        cached = self.cache.get(url)
+        headers = {'User-Agent': USER_AGENT}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        with self.session.get(
+            url, headers=headers, stream=True, timeout=self.config.timeout_seconds
+        ) as response:
+            if response.status_code == 304 and cached:
+                return cached
+
+            response.raise_for_status()
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'html' not in content_type and 'text' not in content_type:
+                return None
+
+            text, word_count = self._extract_stream(response)
+
+            page = {
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'text': text,
+                'word_count': word_count
+            }
+
+        if page['etag'] or page['last_modified']:
+            self.cache.set(url, page)
+        return page
+
+    def _extract_stream(self, response: requests.Response) -> Tuple[str, int]:
+        # requests assumes ISO-8859-1 when no charset is declared; HTML is almost always UTF-8
+        content_type = response.headers.get('Content-Type', '')
+        encoding = response.encoding if 'charset' in content_type.lower() else 'utf-8'
+        decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        extractor = MainTextExtractor(max_words=self.config.max_words)
+        received = 0
+
+        for chunk in response.iter_content(chunk_size=16384):
+            chunk = chunk[:self.config.max_bytes - received]
+            received += len(chunk)
+            extractor.feed(decoder.decode(chunk))
+            if received >= self.config.max_bytes or extractor.done:
+                break
+
+        extractor.close()
+        return extractor.text, extractor.word_count
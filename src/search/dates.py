@@ -0,0 +1,155 @@
+"""
+Publication date extraction and normalization.
+
+Dates are normalized to ISO strings at the precision they were found:
+"2025-03-07", "2025-03" or "2025". ISO strings compare correctly as text,
+so sorting and range checks need no further parsing.
+"""
+
+import re
+from datetime import date, timedelta
+from typing import Optional
+
+from ..core.models import SearchConfig
+
+
+MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'),
+        ('may',), ('jun', 'june'), ('jul', 'july'), ('aug', 'august'),
+        ('sep', 'sept', 'september'), ('oct', 'october'), ('nov', 'november'), ('dec', 'december')
+    ], 1)
+    for name in names
+}
+_MONTH = r'(?P<month>' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\.?'
+_YEAR = r'(?P<year>(?:19|20)\d{2})'
+
+# Full dates, most specific patterns first
+_ISO_RE = re.compile(r'\b' + _YEAR + r'[-/.](?P<num_month>\d{1,2})[-/.](?P<day>\d{1,2})(?!\d)')
+_MONTH_DAY_YEAR_RE = re.compile(r'\b' + _MONTH + r'\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?,?\s+' + _YEAR + r'\b', re.I)
+_DAY_MONTH_YEAR_RE = re.compile(r'\b(?P<day>\d{1,2})(?:st|nd|rd|th)?\s+' + _MONTH + r',?\s+' + _YEAR + r'\b', re.I)
+_ISO_MONTH_RE = re.compile(r'\b' + _YEAR + r'-(?P<num_month>0?[1-9]|1[0-2])(?![\d-])')
+_MONTH_YEAR_RE = re.compile(r'\b' + _MONTH + r',?\s+' + _YEAR + r'\b', re.I)
+# A bare year only counts as a date after a date word, so "2000 employees" or "$2050" is not one
+_YEAR_RE = re.compile(
+    r'(?:\b(?:published|posted|updated|revised|released|dated|copyright|as of|since|during|in)|©|\(c\))'
+    r'\s*(?:on\s+|in\s+)?' + _YEAR + r'\b(?![.,]?\d|\s*%)',
+    re.I
+)
+_YEAR_ONLY_RE = re.compile(_YEAR)
+_RELATIVE_RE = re.compile(r'\b(?P<count>\d+|an?|one)\s+(?P<unit>hour|day|week|month|year)s?\s+ago\b', re.I)
+
+_RELATIVE_DAYS = {'hour': 0, 'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+
+def _valid(year: int, month: int, day: int) -> Optional[str]:
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return None
+
+
+def _full_date(text: str, latest: Optional[date] = None) -> Optional[str]:
+    for pattern in (_ISO_RE, _MONTH_DAY_YEAR_RE, _DAY_MONTH_YEAR_RE):
+        for match in pattern.finditer(text):
+            groups = match.groupdict()
+            month = int(groups['num_month']) if groups.get('num_month') else MONTHS[groups['month'].lower()]
+            found = _valid(int(groups['year']), month, int(groups['day']))
+            if found is not None and (latest is None or found <= latest.isoformat()):
+                return found
+    return None
+
+
+def parse_date(value: Optional[str], today: Optional[date] = None) -> Optional[str]:
+    """
+    Normalize a provider's date field.
+
+    Accepts ISO dates and timestamps, RFC 2822 dates ("Sun, 09 Mar 2025
+    10:00:00 GMT"), written dates ("March 9, 2025"), month-year and year
+    values ("2025-03", "Mar 2025", "2025"), and relative ages ("3 days ago").
+    A year inside a longer value needs a date word before it ("Updated 2025").
+
+    Args:
+        value: Date string from a search provider, or None
+        today: Reference date for relative ages (default: today)
+
+    Returns:
+        Normalized ISO date string, or None when nothing date-like is found
+    """
+    if not value:
+        return None
+    value = str(value).strip()
+
+    found = _full_date(value)
+    if found is not None:
+        return found
+
+    relative = _RELATIVE_RE.search(value)
+    if relative is not None:
+        count = relative.group('count').lower()
+        count = 1 if count in ('a', 'an', 'one') else int(count)
+        days = count * _RELATIVE_DAYS[relative.group('unit').lower()]
+        return ((today or date.today()) - timedelta(days=days)).isoformat()
+
+    iso_month = _ISO_MONTH_RE.search(value)
+    if iso_month is not None:
+        return f"{iso_month.group('year')}-{int(iso_month.group('num_month')):02d}"
+    month_year = _MONTH_YEAR_RE.search(value)
+    if month_year is not None:
+        return f"{month_year.group('year')}-{MONTHS[month_year.group('month').lower()]:02d}"
+
+    year = _YEAR_ONLY_RE.fullmatch(value) or _YEAR_RE.search(value)
+    return year.group('year') if year is not None else None
+
+
+def extract_date(text: str, today: Optional[date] = None) -> Optional[str]:
+    """
+    Find the most likely publication date in free text.
+
+    The first valid full date that is not in the future wins. Otherwise the
+    most recent month or year that is not in the future is returned, since
+    text often cites older studies before current figures. Bare years only
+    count after a date word ("published 2024", "in 2023", "© 2025").
+
+    Args:
+        text: Title and snippet text
+        today: Reference date for rejecting future years (default: today)
+
+    Returns:
+        Normalized ISO date string, or None
+    """
+    if not text:
+        return None
+    today = today or date.today()
+    found = _full_date(text, latest=today)
+    if found is not None:
+        return found
+
+    # Most recent month or year, preferring a month over a bare year
+    candidates = [
+        f"{m.group('year')}-{MONTHS[m.group('month').lower()]:02d}" for m in _MONTH_YEAR_RE.finditer(text)
+    ]
+    candidates.extend(m.group('year') for m in _YEAR_RE.finditer(text))
+    candidates = [found for found in candidates if int(found[:4]) <= today.year]
+    return max(candidates, key=lambda found: (found[:4], len(found))) if candidates else None
+
+
+def result_date(provider_date: Optional[str], text: str) -> Optional[str]:
+    """Publication date of a search result: the provider's date when usable, else one found in the text."""
+    return parse_date(provider_date) or extract_date(text)
+
+
+def is_on_or_after(published: str, min_date: str) -> bool:
+    """
+    Whether a normalized date can fall on or after min_date.
+
+    Partial dates are compared at their own precision, so "2024" passes a
+    minimum of "2024-06-01" while "2024-05" does not.
+    """
+    return published >= min_date[:len(published)]
+
+
+def config_min_date(config: SearchConfig) -> str:
+    """The configured minimum publication date, YYYY-MM-DD."""
+    return config.min_date or f"{config.min_year}-01-01"
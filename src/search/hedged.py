@@ -0,0 +1,146 @@
+"""
+Hedged requests across two search providers to cut tail latency.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set
+
+from ..core.models import Result
+from .base import SearchProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedSearchProvider(SearchProvider):
+    """
+    Send each query to the primary provider and, if it has not answered
+    within its observed latency percentile, to the secondary as well.
+
+    The first non-empty answer wins. The other request is cancelled if it has
+    not started yet; an in-flight HTTP call cannot be interrupted, so its
+    response is discarded when it arrives.
+    """
+
+    def __init__(
+        self,
+        primary: SearchProvider,
+        secondary: SearchProvider,
+        percentile: float = 0.9,
+        min_samples: int = 5,
+        initial_delay: float = 4.0,
+        window: int = 100,
+        max_workers: int = 8
+    ):
+        """
+        Args:
+            primary: Provider queried first
+            secondary: Provider used for the hedge request
+            percentile: Primary latency percentile (0-1) that triggers the hedge
+            min_samples: Latency samples required before using the percentile
+            initial_delay: Hedge delay in seconds until enough samples exist
+            window: Number of recent primary latencies kept
+            max_workers: Thread pool size for in-flight requests
+        """
+        self.name = f"hedged({primary.name},{secondary.name})"
+        self.primary = primary
+        self.secondary = secondary
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.stats = {'requests': 0, 'hedged': 0, 'secondary_wins': 0}
+        self._latencies: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the primary before sending the hedge request."""
+        with self._lock:
+            samples = sorted(self._latencies)
+
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+
+        index = min(len(samples) - 1, max(0, math.ceil(self.percentile * len(samples)) - 1))
+        return samples[index]
+
+    def _call(self, provider: SearchProvider, kwargs: Dict) -> List[Result]:
+        start = time.monotonic()
+        results = provider.search(**kwargs)
+        # Every answer counts, empty ones too, so the delay is not biased low
+        if provider is self.primary:
+            with self._lock:
+                self._latencies.append(time.monotonic() - start)
+        return results
+
+    def _first_good(
+        self,
+        done: Set[Future],
+        providers: Dict[Future, SearchProvider]
+    ) -> Optional[List[Result]]:
+        # Iterate in submission order so the primary wins ties
+        for future, provider in providers.items():
+            if future not in done:
+                continue
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.warning(f"{provider.name} search failed: {e}")
+                continue
+            if results:
+                if provider is self.secondary:
+                    self.stats['secondary_wins'] += 1
+                return results
+        return None
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        search_depth: str = "basic",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None
+    ) -> List[Result]:
+        """Execute a hedged search and return the first good answer."""
+        kwargs = {
+            'query': query,
+            'max_results': max_results,
+            'search_depth': search_depth,
+            'include_domains': include_domains,
+            'exclude_domains': exclude_domains
+        }
+        self.stats['requests'] += 1
+
+        primary = self._executor.submit(self._call, self.primary, kwargs)
+        providers = {primary: self.primary}
+
+        done, pending = wait({primary}, timeout=self.hedge_delay())
+        results = self._first_good(done, providers)
+        if results is not None:
+            return results
+
+        # Primary is slow or returned nothing useful: hedge to the secondary
+        logger.info(f"Hedging '{query}' to {self.secondary.name}")
+        self.stats['hedged'] += 1
+        secondary = self._executor.submit(self._call, self.secondary, kwargs)
+        providers[secondary] = self.secondary
+        pending.add(secondary)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            results = self._first_good(done, providers)
+            if results is not None:
+                for future in pending:
+                    future.cancel()
+                return results
+
+        return []
+
+    def close(self) -> None:
+        """Stop the worker threads, dropping queued requests."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
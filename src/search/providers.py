@@ -0,0 +1,176 @@
+"""
+Concrete search providers and the provider factory.
+"""
+
+import logging
+from typing import List, Optional
+
+import requests
+
+from ..core.models import Result, SearchConfig
+from .base import SearchProvider
+from .brave_client import BRAVE_API_URL, brave_search
+from .dates import config_min_date
+from .hedged import HedgedSearchProvider
+from .tavily_client import TAVILY_API_URL, tavily_search
+
+
+logger = logging.getLogger(__name__)
+
+
+class TavilyProvider(SearchProvider):
+    """Tavily search API."""
+
+    name = "tavily"
+    api_key_env = "TAVILY_API_KEY"
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        api_url: Optional[str] = None,
+        start_date: Optional[str] = None
+    ):
+        self.session = session
+        self.api_url = api_url or TAVILY_API_URL
+        self.start_date = start_date
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        search_depth: str = "basic",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None
+    ) -> List[Result]:
+        return tavily_search(
+            query=query,
+            max_results=max_results,
+            search_depth=search_depth,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+            session=self.session,
+            api_url=self.api_url,
+            start_date=self.start_date
+        )
+
+
+class BraveProvider(SearchProvider):
+    """Brave Search API. `search_depth` has no Brave equivalent and is ignored."""
+
+    name = "brave"
+    api_key_env = "BRAVE_API_KEY"
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        api_url: Optional[str] = None,
+        count: Optional[int] = None,
+        freshness: Optional[str] = None,
+        start_date: Optional[str] = None
+    ):
+        self.session = session
+        self.api_url = api_url or BRAVE_API_URL
+        self.count = count
+        self.freshness = freshness
+        self.start_date = start_date
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        search_depth: str = "basic",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None
+    ) -> List[Result]:
+        if self.count:
+            max_results = min(max_results, self.count)
+        return brave_search(
+            query=query,
+            max_results=max_results,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains,
+            freshness=self.freshness,
+            session=self.session,
+            api_url=self.api_url,
+            start_date=self.start_date
+        )
+
+
+def build_provider(
+    name: str,
+    config: SearchConfig,
+    session: Optional[requests.Session] = None
+) -> SearchProvider:
+    """
+    Instantiate a single provider by name.
+
+    Args:
+        name: Provider name ("tavily" or "brave")
+        config: SearchConfig with provider settings
+        session: Optional shared requests.Session
+
+    Returns:
+        SearchProvider instance
+    """
+    # Push the date range down so stale pages are not returned at all
+    start_date = config_min_date(config) if config.date_pushdown else None
+    if name == "tavily":
+        return TavilyProvider(session=session, api_url=config.tavily_api_url, start_date=start_date)
+    if name == "brave":
+        return BraveProvider(
+            session=session,
+            api_url=config.brave_api_url,
+            count=config.brave_count,
+            freshness=config.brave_freshness,
+            start_date=start_date
+        )
+    raise ValueError(f"Unknown search provider: {name}")
+
+
+def create_search_provider(
+    config: SearchConfig,
+    session: Optional[requests.Session] = None
+) -> SearchProvider:
+    """
+    Build the provider configured by `search_provider` and `hedging`.
+
+    Args:
+        config: SearchConfig object
+        session: Optional shared requests.Session
+
+    Returns:
+        The primary provider, wrapped in a HedgedSearchProvider when enabled
+    """
+    primary = build_provider(config.search_provider, config, session)
+    hedging = config.hedging
+
+    if not hedging.enabled:
+        return primary
+
+    secondary = build_provider(hedging.secondary_provider, config, session)
+    logger.info(f"Hedged search enabled: {primary.name} -> {secondary.name}")
+    return HedgedSearchProvider(
+        primary,
+        secondary,
+        percentile=hedging.latency_percentile,
+        min_samples=hedging.min_samples,
+        initial_delay=hedging.initial_delay_seconds
+    )
+
+
+def required_api_keys(config: SearchConfig) -> List[str]:
+    """
+    List the environment variables needed by the configured providers.
+
+    Args:
+        config: SearchConfig object
+
+    Returns:
+        Environment variable names
+    """
+    names = [config.search_provider]
+    if config.hedging.enabled:
+        names.append(config.hedging.secondary_provider)
+
+    env_vars = {"tavily": TavilyProvider.api_key_env, "brave": BraveProvider.api_key_env}
+    return [env_vars[name] for name in names if name in env_vars]
@@ -4,24 +4,31 @@ Tavily search API integration.
 
 import os
 import logging
-import re
+import time
 import urllib.parse
 from typing import List, Optional
 
 import requests
 
+from ..core.cassette import CassetteMiss, get_active_cassette
 from ..core.models import Result
+from .dates import result_date
 
 
 logger = logging.getLogger(__name__)
 
+TAVILY_API_URL = "https://api.tavily.com/search"
+
 
 def tavily_search(
     query: str,
     max_results: int = 10,
     search_depth: str = "basic",
     include_domains: Optional[List[str]] = None,
-    exclude_domains: Optional[List[str]] = None
+    exclude_domains: Optional[List[str]] = None,
+    session: Optional[requests.Session] = None,
+    api_url: str = TAVILY_API_URL,
+    start_date: Optional[str] = None
 ) -> List[Result]:
     """
     Execute a search using the Tavily API.
@@ -32,17 +39,21 @@ def tavily_search(
         search_depth: "basic" or "advanced"
         include_domains: Optional list of domains to include
         exclude_domains: Optional list of domains to exclude
+        session: Optional requests.Session to reuse pooled connections
+        api_url: Search endpoint, overridable for stand-in servers
+        start_date: Optional YYYY-MM-DD; only results published since are returned
         
     Returns:
         List of Result objects
     """
+    cassette = get_active_cassette()
+    replaying = cassette is not None and cassette.replaying
+    
     api_key = os.getenv('TAVILY_API_KEY')
-    if not api_key:
+    if not api_key and not replaying:
         logger.error("TAVILY_API_KEY not found in environment variables")
         raise ValueError("TAVILY_API_KEY must be set in environment")
     
-    url = "https://api.tavily.com/search"
-    
     payload = {
         "api_key": api_key,
         "query": query,
@@ -56,22 +67,34 @@ def tavily_search(
         payload["include_domains"] = include_domains
     if exclude_domains:
         payload["exclude_domains"] = exclude_domains
+    if start_date:
+        payload["start_date"] = start_date
     
     logger.info(f"Executing Tavily search: '{query}'")
     
+    # Recorded requests never include the API key
+    request_record = {k: v for k, v in payload.items() if k != "api_key"}
+    
     try:
-        response = requests.post(url, json=payload, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        if replaying:
+            data = cassette.play("tavily", request_record)
+        else:
+            start = time.monotonic()
+            http = session or requests
+            response = http.post(api_url, json=payload, timeout=30)
+            response.raise_for_status()
+            data = response.json()
+            if cassette is not None:
+                cassette.record("tavily", request_record, data, time.monotonic() - start)
         
         results = []
         for item in data.get('results', []):
             # Extract domain from URL
             domain = extract_domain(item.get('url', ''))
             
-            # Extract year from content if available
-            published_date = extract_year_from_content(
-                item.get('title', '') + ' ' + item.get('content', '')
+            # Prefer the provider's date, else look for one in the text
+            published_date = result_date(
+                item.get('published_date'), item.get('title', '') + ' ' + item.get('content', '')
             )
             
             result = Result(
@@ -89,16 +112,12 @@ def tavily_search(
     except requests.exceptions.RequestException as e:
         logger.error(f"Tavily API request failed: {e}")
         return []
+    except CassetteMiss as e:
+        logger.error(f"Tavily replay failed: {e}")
+        return []
 
 
 def extract_domain(url: str) -> str:
     """Extract domain from URL."""
     parsed = urllib.parse.urlparse(url)
     return parsed.netloc
-
-
-def extract_year_from_content(text: str) -> Optional[str]:
-    """Extract year from text content (looks for 2020-2025 range)."""
-    pattern = r'\b(202[0-5])\b'
-    matches = re.findall(pattern, text)
-    return matches[0] if matches else None
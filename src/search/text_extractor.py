@@ -0,0 +1,85 @@
+"""
+Incremental main-text extraction from HTML.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import List, Optional
+
+
+# Subtrees that never contain article text
+SKIP_TAGS = {
+    'script', 'style', 'noscript', 'template', 'svg', 'iframe', 'form',
+    'nav', 'header', 'footer', 'aside', 'button', 'select', 'title'
+}
+
+# Elements that start or end a content block. End tags of <p> and <li> are
+# optional in HTML, so a block is flushed at any boundary, opening or closing.
+BLOCK_TAGS = {
+    'p', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'td', 'th', 'pre',
+    'div', 'section', 'article', 'main', 'body', 'ul', 'ol', 'dl', 'dt', 'dd',
+    'table', 'tr', 'figure', 'figcaption', 'br', 'hr'
+}
+
+# Blocks shorter than this are usually menus, captions or buttons
+MIN_BLOCK_WORDS = 5
+
+WHITESPACE = re.compile(r'\s+')
+
+
+class MainTextExtractor(HTMLParser):
+    """
+    Collect paragraph-level text while HTML is fed in chunks.
+
+    Navigation, scripts and other boilerplate subtrees are skipped, and only
+    blocks with a minimum number of words are kept. Feeding can stop as soon
+    as `max_words` have been collected; close() flushes the last block.
+    """
+
+    def __init__(self, max_words: Optional[int] = None):
+        super().__init__(convert_charrefs=True)
+        self.max_words = max_words
+        self.blocks: List[str] = []
+        self.word_count = 0
+        self._skip_depth = 0
+        self._buffer: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        """True once enough words have been collected."""
+        return self.max_words is not None and self.word_count >= self.max_words
+
+    @property
+    def text(self) -> str:
+        """Extracted main text, one block per line."""
+        return '\n'.join(self.blocks)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            if self._skip_depth == 0:
+                self._flush_block()
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS and self._skip_depth == 0:
+            self._flush_block()
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in BLOCK_TAGS and self._skip_depth == 0:
+            self._flush_block()
+
+    def handle_data(self, data):
+        if self._skip_depth == 0:
+            self._buffer.append(data)
+
+    def close(self):
+        super().close()
+        self._flush_block()
+
+    def _flush_block(self) -> None:
+        block = WHITESPACE.sub(' ', ''.join(self._buffer)).strip()
+        self._buffer = []
+        words = len(block.split())
+        if words >= MIN_BLOCK_WORDS:
+            self.blocks.append(block)
+            self.word_count += words
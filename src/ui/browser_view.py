@@ -7,9 +7,8 @@ import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
-from dataclasses import asdict
 
-from ..core.models import Result
+from ..core.models import Result, result_to_dict
 
 
 logger = logging.getLogger(__name__)
@@ -45,7 +44,7 @@ def generate_browser_view(
     
     for topic_name, results in results_by_topic.items():
         data["topics"][topic_name] = [
-            asdict(result) for result in results
+            result_to_dict(result) for result in results
         ]
     
     # Embed data in template
@@ -0,0 +1,28 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from src.core.models import SearchConfig, Topic
+
+
+@pytest.fixture
+def make_config(tmp_path):
+    """Build a SearchConfig with test defaults; keyword arguments override fields."""
+    def build(**overrides):
+        values = dict(
+            topics=[Topic(name="AI agents", keywords=["AI agents"], search_variations=["AI agents"])],
+            search_depth="basic",
+            max_results_per_query=5,
+            min_year=2024,
+            top_n_results=4,
+            output_dir=str(tmp_path / "outputs"),
+            include_domains=[],
+            exclude_domains=[],
+            required_keywords=[],
+            ai_model="gpt-4o-mini",
+            ai_temperature=0.0,
+            use_ai_filtering=True,
+        )
+        values.update(overrides)
+        return SearchConfig(**values)
+    return build
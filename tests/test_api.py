@@ -0,0 +1,37 @@
+"""Tests for the in-process library API."""
+
+from src.api import run_research
+from src.core.models import Result
+from src.pipeline.context import RunContext
+from src.search.base import SearchProvider
+
+
+class StubProvider(SearchProvider):
+    name = "stub"
+
+    def __init__(self):
+        self.queries = []
+
+    def search(self, query, max_results=10, search_depth="basic", include_domains=None, exclude_domains=None):
+        self.queries.append(query)
+        return [
+            Result(
+                title=f"{query} result {i}",
+                url=f"https://site{i}.example/{len(self.queries)}",
+                snippet=f"AI agents in business, finding {i}",
+                published_date="2025-03-01",
+                domain=f"site{i}.example",
+            )
+            for i in range(3)
+        ]
+
+
+def test_injected_provider_runs_serially_with_workers(make_config, monkeypatch):
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    provider = StubProvider()
+    config = make_config(use_ai_filtering=False, workers=2)
+
+    run = run_research(config, context=RunContext(search_provider=provider), workers=2)
+
+    assert provider.queries
+    assert len(run.results_by_topic["AI agents"]) == 3
@@ -0,0 +1,45 @@
+"""Tests for the compressed run archive."""
+
+import json
+
+from src.core.history import ContentHistory
+from src.filters.cross_run_dedup import bootstrap_history, load_previous_urls
+from src.output.archive import RunArchive
+
+
+def run_data(*urls):
+    return {
+        'generated_at': '2025-03-01T09:00:00',
+        'topics': {'AI agents': [
+            {'title': f'Title {url}', 'url': url, 'snippet': 'Agents in business', 'relevance_score': 0.8}
+            for url in urls
+        ]},
+        'metadata': {'candidates': {'AI agents': ['large payload'] * 100}},
+    }
+
+
+def test_dedup_reads_urls_from_index_only(tmp_path):
+    archive = RunArchive(str(tmp_path))
+    archive.append_run('20250301_090000', run_data('https://a.example/1', 'https://b.example/2'))
+    archive.append_run('20250302_090000', run_data('https://c.example/3'))
+    for segment in (tmp_path / 'archive').glob('segment_*.gz'):
+        segment.unlink()
+
+    assert load_previous_urls(str(tmp_path)) == {
+        'https://a.example/1', 'https://b.example/2', 'https://c.example/3'
+    }
+    history = ContentHistory()
+    assert bootstrap_history(history, str(tmp_path)) == 3
+    assert len(history) == 3
+
+
+def test_index_without_rows_is_backfilled(tmp_path):
+    archive = RunArchive(str(tmp_path))
+    archive.append_run('20250301_090000', run_data('https://a.example/1'))
+    index_path = tmp_path / 'archive' / 'index.json'
+    index = json.loads(index_path.read_text())
+    del index['20250301_090000']['results']
+    index_path.write_text(json.dumps(index))
+
+    assert load_previous_urls(str(tmp_path)) == {'https://a.example/1'}
+    assert 'results' in json.loads(index_path.read_text())['20250301_090000']
@@ -0,0 +1,98 @@
+"""Tests for the local relevance classifier."""
+
+import json
+import random
+
+import pytest
+
+from src.ai.classifier import (
+    RelevanceClassifier, classifier_path, extract_features, screen_results, train_classifier
+)
+from src.core.models import ClassifierConfig, Result, Topic
+
+TOPIC = Topic(name="AI agents", keywords=["AI agents", "automation"], search_variations=[])
+
+RELEVANT = [
+    "AI agents automate invoice processing for enterprise finance teams",
+    "Enterprises deploy AI agents to handle customer support automation",
+    "Survey: 40% of companies pilot AI agents for workflow automation",
+    "How AI agents cut procurement costs in manufacturing",
+]
+IRRELEVANT = [
+    "Ten easy pasta recipes for a weeknight dinner",
+    "Travel guide to the best beaches in Portugal",
+    "Local football club wins the regional cup final",
+    "Gardening tips for growing tomatoes on a balcony",
+]
+
+
+def verdicts(count):
+    rng = random.Random(7)
+    items = []
+    for i in range(count):
+        relevant = i % 2 == 0
+        title = rng.choice(RELEVANT if relevant else IRRELEVANT)
+        items.append({
+            'topic': TOPIC.name,
+            'url': f"https://{'news' if relevant else 'blog'}{i}.example/{i}",
+            'domain': 'news.example' if relevant else 'blog.example',
+            'title': title,
+            'snippet': title,
+            'score': 0.9 if relevant else 0.1,
+        })
+    return items
+
+
+def write_run(output_dir, items):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    data = {'generated_at': '2025-03-01T09:00:00', 'topics': {}, 'metadata': {'verdicts': items}}
+    (output_dir / 'research_data_20250301_090000.json').write_text(json.dumps(data))
+
+
+def example(title, label):
+    return extract_features(TOPIC.name, TOPIC.keywords, title, title, ''), label
+
+
+def test_fit_separates_a_small_labelled_set():
+    examples = [example(title, 1) for title in RELEVANT] + [example(title, 0) for title in IRRELEVANT]
+    classifier = RelevanceClassifier()
+    classifier.fit(examples)
+
+    relevant = Result(title="AI agents take over expense automation", url="u", snippet="AI agents at work")
+    irrelevant = Result(title="Best pasta recipes for the weekend", url="v", snippet="Dinner ideas")
+    assert classifier.score(TOPIC, relevant) > 0.5 > classifier.score(TOPIC, irrelevant)
+
+
+def test_fit_needs_both_classes():
+    with pytest.raises(ValueError, match="both relevant and irrelevant"):
+        RelevanceClassifier().fit([example(title, 1) for title in RELEVANT])
+
+
+def test_train_refuses_too_few_verdicts(make_config, tmp_path):
+    config = make_config(topics=[TOPIC], classifier=ClassifierConfig(min_examples=50))
+    write_run(tmp_path / 'outputs', verdicts(20))
+
+    with pytest.raises(ValueError, match="Only 20 stored verdicts"):
+        train_classifier(config)
+
+
+def test_train_saves_a_model_that_screens_results(make_config, tmp_path):
+    config = make_config(topics=[TOPIC], classifier=ClassifierConfig(min_examples=50, audit_rate=0.0))
+    write_run(tmp_path / 'outputs', verdicts(80))
+
+    metrics = train_classifier(config)
+    assert metrics['examples'] == 80
+    assert metrics['relevant'] == 40
+    assert metrics['agreement'] >= 0.9
+
+    classifier = RelevanceClassifier.load(classifier_path(config))
+    results = [
+        Result(title=RELEVANT[0], url="https://news.example/new", snippet=RELEVANT[0], domain="news.example"),
+        Result(title=IRRELEVANT[0], url="https://blog.example/new", snippet=IRRELEVANT[0], domain="blog.example"),
+    ]
+    escalated, audits = screen_results(results, TOPIC, classifier, config.classifier)
+
+    assert escalated == [] and audits == {}
+    assert results[0].relevance_score >= config.classifier.upper
+    assert results[1].relevance_score <= config.classifier.lower
+    assert {r.score_source for r in results} == {'classifier'}
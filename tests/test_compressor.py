@@ -0,0 +1,53 @@
+"""Tests for pre-LLM compression of result text."""
+
+import pytest
+
+from src.ai.compressor import SnippetCompressor
+from src.core.models import CompressionConfig, Result, Topic
+
+
+@pytest.mark.parametrize("sentence", [
+    "Getty's copyright lawsuit against Stability AI goes to trial in London.",
+    "The agent can sign in to SaaS tools and file tickets on its own.",
+    "Subscribers to ChatGPT Plus rose 30% in the first quarter.",
+    "OpenAI updated its privacy policy to cover data used for training.",
+    "Publishers want newsletter content excluded from model training sets.",
+    "Users who log in with SSO get the enterprise model by default.",
+    "Share of firms using generative AI rose to 65% this year.",
+])
+def test_content_sentences_are_not_boilerplate(sentence):
+    assert not SnippetCompressor().is_boilerplate("example.com", sentence)
+
+
+@pytest.mark.parametrize("sentence", [
+    "Subscribe to our newsletter for weekly AI news.",
+    "Sign up for free",
+    "We use cookies to improve your experience.",
+    "© 2025 Example Media. All rights reserved.",
+    "Copyright (c) 2025 Example Media",
+    "Privacy Policy",
+    "Related articles",
+    "Read more",
+])
+def test_banner_sentences_are_boilerplate(sentence):
+    assert SnippetCompressor().is_boilerplate("example.com", sentence)
+
+
+def test_compress_keeps_content_around_banners():
+    topic = Topic(name="AI copyright", keywords=["copyright", "generative AI"], search_variations=[])
+    result = Result(
+        title="Copyright case",
+        url="https://news.example.com/a",
+        snippet=(
+            "Skip to content | Subscribe to our newsletter | "
+            "A court ruled the copyright claims against the generative AI lab can proceed. "
+            "The publishers say 40% of the training data was licensed content. "
+            "© 2025 Example News. All rights reserved."
+        ),
+        domain="news.example.com",
+    )
+    compressed = SnippetCompressor(CompressionConfig(enabled=True)).compress(result, topic)
+    assert compressed == (
+        "A court ruled the copyright claims against the generative AI lab can proceed. "
+        "The publishers say 40% of the training data was licensed content."
+    )
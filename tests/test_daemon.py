@@ -0,0 +1,58 @@
+"""Tests for daemon scheduling."""
+
+from datetime import datetime
+
+import pytest
+
+from src.core.config import parse_config
+from src.core.models import ScheduleConfig
+from src.pipeline.daemon import next_run_time
+
+
+def schedule(frequency, day, time="09:00"):
+    return ScheduleConfig(frequency=frequency, day=day, time=time)
+
+
+@pytest.mark.parametrize("now, expected", [
+    (datetime(2025, 1, 31, 10, 0), datetime(2025, 2, 28, 9, 0)),
+    (datetime(2024, 1, 31, 10, 0), datetime(2024, 2, 29, 9, 0)),
+    (datetime(2025, 2, 1, 8, 0), datetime(2025, 2, 28, 9, 0)),
+    (datetime(2025, 4, 15, 8, 0), datetime(2025, 4, 30, 9, 0)),
+    (datetime(2025, 12, 31, 10, 0), datetime(2026, 1, 30, 9, 0)),
+])
+def test_monthly_day_past_month_end_runs_on_last_day(now, expected):
+    assert next_run_time(schedule("monthly", "30"), now) == expected
+
+
+def test_monthly_same_day_later_or_next_month():
+    assert next_run_time(schedule("monthly", "15"), datetime(2025, 3, 15, 8, 0)) == datetime(2025, 3, 15, 9, 0)
+    assert next_run_time(schedule("monthly", "15"), datetime(2025, 3, 15, 9, 0)) == datetime(2025, 4, 15, 9, 0)
+
+
+@pytest.mark.parametrize("now, expected", [
+    (datetime(2025, 3, 5, 10, 0), datetime(2025, 3, 7, 9, 0)),   # Wednesday -> Friday
+    (datetime(2025, 3, 7, 8, 0), datetime(2025, 3, 7, 9, 0)),    # Friday before the time
+    (datetime(2025, 3, 7, 9, 0), datetime(2025, 3, 14, 9, 0)),   # Friday at the time
+])
+def test_weekly(now, expected):
+    assert next_run_time(schedule("weekly", "friday"), now) == expected
+
+
+def config_with(schedule_section):
+    return {'topics': [{'name': 'AI agents'}], 'schedule': schedule_section}
+
+
+@pytest.mark.parametrize("section, message", [
+    ({'frequency': 'weekly', 'day': 'fridya'}, "weekday name"),
+    ({'frequency': 'monthly', 'day': 'first'}, "day of the month"),
+    ({'frequency': 'monthly', 'day': 32}, "day of the month"),
+    ({'frequency': 'fortnightly'}, "schedule.frequency"),
+    ({'frequency': 'daily', 'time': '9am'}, "HH:MM"),
+])
+def test_invalid_schedule_is_rejected_at_load(section, message):
+    with pytest.raises(ValueError, match=message):
+        parse_config(config_with(section))
+
+
+def test_monthly_day_defaults_to_first():
+    assert parse_config(config_with({'frequency': 'monthly'})).schedule.day == '1'
@@ -0,0 +1,118 @@
+"""Tests for hedged search against local stand-in provider servers."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.models import HedgeConfig
+from src.search.providers import create_search_provider
+
+
+class StubSearchServer:
+    """Serves Tavily (POST /tavily) and Brave (GET /brave) answers with configurable delay and status."""
+
+    def __init__(self):
+        self.behaviour = {
+            'tavily': {'delay': 0.0, 'status': 200, 'results': 2},
+            'brave': {'delay': 0.0, 'status': 200, 'results': 2},
+        }
+        self.calls = {'tavily': 0, 'brave': 0}
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                self.answer('tavily', lambda i: {
+                    'title': f'Tavily result {i}', 'url': f'https://tavily{i}.example/a', 'content': 'AI agents'
+                }, 'results')
+
+            def do_GET(self):
+                self.answer('brave', lambda i: {
+                    'title': f'Brave result {i}', 'url': f'https://brave{i}.example/a', 'description': 'AI agents'
+                }, 'web')
+
+            def answer(self, provider, item, key):
+                stub.calls[provider] += 1
+                behaviour = stub.behaviour[provider]
+                time.sleep(behaviour['delay'])
+                items = [item(i) for i in range(behaviour['results'])]
+                body = json.dumps({'results': items} if key == 'results' else {'web': {'results': items}}).encode()
+                self.send_response(behaviour['status'])
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubSearchServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def hedged(make_config, stub_server, monkeypatch):
+    monkeypatch.setenv('TAVILY_API_KEY', 'test')
+    monkeypatch.setenv('BRAVE_API_KEY', 'test')
+    config = make_config(
+        search_provider='tavily',
+        tavily_api_url=f"{stub_server.url}/tavily",
+        brave_api_url=f"{stub_server.url}/brave",
+        date_pushdown=False,
+        hedging=HedgeConfig(enabled=True, secondary_provider='brave', min_samples=3, initial_delay_seconds=0.5),
+    )
+    provider = create_search_provider(config)
+    yield provider
+    provider.close()
+
+
+def test_fast_primary_is_not_hedged_and_sets_the_delay(hedged, stub_server):
+    stub_server.behaviour['tavily']['delay'] = 0.05
+    assert hedged.hedge_delay() == 0.5
+
+    for _ in range(3):
+        results = hedged.search("AI agents")
+        assert [r.title for r in results] == ['Tavily result 0', 'Tavily result 1']
+
+    assert stub_server.calls['brave'] == 0
+    assert hedged.stats['hedged'] == 0
+    assert 0.05 <= hedged.hedge_delay() < 0.5
+
+
+def test_first_good_answer_wins(hedged, stub_server):
+    stub_server.behaviour['tavily']['delay'] = 1.5
+
+    start = time.monotonic()
+    results = hedged.search("AI agents")
+
+    assert time.monotonic() - start < 1.2
+    assert [r.title for r in results] == ['Brave result 0', 'Brave result 1']
+    assert hedged.stats == {'requests': 1, 'hedged': 1, 'secondary_wins': 1}
+
+
+@pytest.mark.parametrize("failure", [{'status': 500}, {'results': 0}])
+def test_falls_back_when_primary_fails_or_is_empty(hedged, stub_server, failure):
+    stub_server.behaviour['tavily'].update(failure)
+
+    start = time.monotonic()
+    results = hedged.search("AI agents")
+
+    # No need to wait out the hedge delay once the primary has answered badly
+    assert time.monotonic() - start < 0.5
+    assert [r.title for r in results] == ['Brave result 0', 'Brave result 1']
+    assert stub_server.calls == {'tavily': 1, 'brave': 1}
+    assert hedged.stats['secondary_wins'] == 1
@@ -0,0 +1,39 @@
+"""Tests for recovering relevance verdicts from LLM replies."""
+
+import pytest
+
+from src.ai.json_parser import extract_json_object, parse_relevance_response
+
+
+@pytest.mark.parametrize("reply", [
+    '```json\n{"relevance_score": 0.8, "is_relevant": true, "reasoning": "On topic"}\n```',
+    '```\n{"relevance_score": 0.8, "is_relevant": true, "reasoning": "On topic"}\n```',
+    'Here is my assessment:\n{"relevance_score": 0.8, "is_relevant": true, "reasoning": "On topic"}\nHope this helps!',
+    '{"relevance_score": 0.8, "is_relevant": true, "reasoning": "On topic",}',
+    '{"relevance_score": 0.8, "is_relevant": true, "reasoning": "On top',
+])
+def test_recovers_verdict(reply):
+    verdict = parse_relevance_response(reply, 0.6)
+    assert verdict['relevance_score'] == 0.8
+    assert verdict['is_relevant'] is True
+    assert verdict['reasoning'].startswith("On top")
+
+
+def test_truncated_nested_object_is_closed():
+    assert extract_json_object('{"a": {"b": [1, 2], "c": "x') == {"a": {"b": [1, 2], "c": "x"}}
+
+
+def test_field_level_fallback_without_json():
+    verdict = parse_relevance_response('relevance_score: 0.45, is_relevant: false', 0.6)
+    assert verdict == {'relevance_score': 0.45, 'is_relevant': False, 'reasoning': ''}
+
+
+@pytest.mark.parametrize("threshold, expected", [(0.6, False), (0.5, True)])
+def test_missing_is_relevant_uses_configured_threshold(threshold, expected):
+    verdict = parse_relevance_response('{"relevance_score": 0.55, "reasoning": "Partly"}', threshold)
+    assert verdict['is_relevant'] is expected
+
+
+def test_score_is_clamped_and_unparseable_reply_is_none():
+    assert parse_relevance_response('{"relevance_score": 1.7}', 0.6)['relevance_score'] == 1.0
+    assert parse_relevance_response("I cannot judge this result.", 0.6) is None
@@ -0,0 +1,65 @@
+"""Tests for the cross-topic selection of final results."""
+
+import logging
+
+from src.core.models import Result, SelectionConfig
+from src.filters.heuristic import rank_by_heuristic
+from src.filters.selection import select_results
+
+
+def result(topic, index, domain, score):
+    return Result(
+        title=f"{topic} finding {index} from {domain} number {index * 7919}",
+        url=f"https://{domain}/{topic}/{index}",
+        snippet=f"Snippet {topic} {index} {domain}",
+        domain=domain,
+        relevance_score=score,
+    )
+
+
+def concentrated_candidates():
+    # Top scores sit on one domain per topic; topic C can fill only two slots
+    return {
+        "A": [result("A", i, "a.com", 0.99 - i / 100) for i in range(4)]
+        + [result("A", 4 + i, f"a{i}.com", 0.5) for i in range(3)],
+        "B": [result("B", i, "b.com", 0.99 - i / 100) for i in range(4)]
+        + [result("B", 4 + i, f"b{i}.com", 0.5) for i in range(3)],
+        "C": [result("C", 0, "c.com", 0.9), result("C", 1, "c0.com", 0.5)],
+    }
+
+
+def test_min_unique_sources_defers_against_reachable_slots(make_config, caplog):
+    config = make_config(selection=SelectionConfig(total_max_results=12, min_unique_sources=8))
+    with caplog.at_level(logging.WARNING):
+        selected = select_results(concentrated_candidates(), config)
+
+    chosen = [r for results in selected.values() for r in results]
+    assert len(chosen) == 10
+    assert len({r.domain for r in chosen}) >= 8
+    assert not [record for record in caplog.records if record.levelno >= logging.WARNING]
+
+
+def test_warns_only_when_candidates_lack_domains(make_config, caplog):
+    candidates = {"A": [result("A", i, f"d{i % 3}.com", 0.9 - i / 100) for i in range(6)]}
+    config = make_config(selection=SelectionConfig(total_max_results=4, min_unique_sources=5))
+    with caplog.at_level(logging.WARNING):
+        selected = select_results(candidates, config)
+
+    assert len(selected["A"]) == 4
+    assert {r.domain for r in selected["A"]} == {"d0.com", "d1.com", "d2.com"}
+    assert "Only 3 distinct sources among the candidates" in caplog.text
+
+
+def test_heuristic_scores_rank_after_ai_scores(make_config):
+    ai_scored = [result("priority", i, f"ai{i}.com", 0.65) for i in range(3)]
+    for r in ai_scored:
+        r.score_source = "llm"
+    degraded = [result("degraded", i, f"h{i}.com", 0.0) for i in range(3)]
+    heuristic = rank_by_heuristic(degraded, ["h0.com", "h1.com", "h2.com"], ["degraded"], 2024)
+    assert all(r.relevance_score > 0.65 for r in heuristic)
+    config = make_config(selection=SelectionConfig(total_max_results=4))
+
+    selected = select_results({"priority": ai_scored, "degraded": heuristic}, config)
+
+    assert selected["priority"] == ai_scored
+    assert selected["degraded"] == heuristic[:1]
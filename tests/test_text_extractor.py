@@ -0,0 +1,63 @@
+"""Tests for main-text extraction from fetched pages."""
+
+from src.core.models import FetchConfig, Result
+from src.search.content_fetcher import ContentFetcher
+from src.search.text_extractor import MainTextExtractor
+
+
+def extract(html, chunk_size=None):
+    extractor = MainTextExtractor()
+    if chunk_size:
+        for start in range(0, len(html), chunk_size):
+            extractor.feed(html[start:start + chunk_size])
+    else:
+        extractor.feed(html)
+    extractor.close()
+    return extractor
+
+
+def test_implicitly_closed_list_items_and_paragraphs():
+    html = (
+        "<ul><li>First item has more than five words here"
+        "<li>Second item has more than five words too</ul>"
+        "<p>Opening paragraph without an end tag goes on"
+        "<p>Closing paragraph also without any end tag"
+    )
+    extractor = extract(html)
+    assert extractor.blocks == [
+        "First item has more than five words here",
+        "Second item has more than five words too",
+        "Opening paragraph without an end tag goes on",
+        "Closing paragraph also without any end tag",
+    ]
+    assert extractor.word_count == 31
+
+
+def test_text_directly_in_div():
+    extractor = extract("<div>Text placed directly inside a div element is content</div>")
+    assert extractor.text == "Text placed directly inside a div element is content"
+
+
+def test_close_flushes_unterminated_block():
+    extractor = extract("<body><p>The last paragraph is cut off by the stream limit")
+    assert extractor.blocks == ["The last paragraph is cut off by the stream limit"]
+
+
+def test_skipped_subtrees_and_short_blocks():
+    html = (
+        "<html><head><title>Page title words here today</title></head><body>"
+        "<nav><ul><li>Home</li><li>About us and our long menu entry</li></ul></nav>"
+        "<p>Short one</p><p>Article text with <a href='#'>an inline link</a> stays together</p>"
+        "<script>var words = 'not article text at all here';</script></body></html>"
+    )
+    extractor = extract(html, chunk_size=7)
+    assert extractor.blocks == ["Article text with an inline link stays together"]
+
+
+def test_empty_extraction_leaves_word_count_unknown():
+    fetcher = ContentFetcher(FetchConfig())
+    fetcher.fetch = lambda url: {'url': url, 'text': '', 'word_count': 0}
+    result = Result(title="t", url="https://example.com/a", snippet="s", domain="example.com")
+    fetcher._fetch_result(result)
+    assert result.word_count is None
+    assert result.content is None